@@ -1,4 +1,4 @@
-from typing import List, Tuple
+from typing import Callable, Iterator, List, Tuple
 from asn1decoder.asn1types import (
     Header,
     IdentifierComponent,
@@ -232,63 +232,263 @@ def parse_primitive_value(
     )
 
 
-def parse_encoding(data: memoryview, offset: int = 0) -> ASN1Encoding:
+def parse_header(
+    data: memoryview, offset: int
+) -> Tuple[TagClass, EncodingType, int, int, int | None]:
     """
-    Parses an ASN.1 encoding from `data` starting at `offset`.
+    Parses the identifier and length octets at `offset` without building
+    component objects.
 
     Returns:
-        ASN1Encoding: the decoded encoding
+        (tag_class, encoding_type, tag_number, header_length, content_length):
+        content_length is None for the indefinite form
     """
+    _ensure_valid_offset(data=data, offset=offset)
 
-    current_offset = offset
-    _ensure_valid_offset(data=data, offset=current_offset)
-
-    identifier_component = parse_identifier_component(data=data, offset=current_offset)
-    current_offset += identifier_component.header.length
-
-    length_component = parse_length_component(data=data, offset=current_offset)
-    current_offset += length_component.header.length
+    identifier_octet = data[offset]
+    tag_class = parse_tag_class(identifier_octet=identifier_octet)
+    encoding_type = parse_encoding_type(identifier_octet=identifier_octet)
+    if identifier_octet & 0b0001_1111 == 0b0001_1111:
+        tag_number, used_bytes = parse_high_tag_number(data=data, offset=offset)
+    else:
+        tag_number, used_bytes = identifier_octet & 0b0001_1111, 1
 
-    if (
-        identifier_component.encoding_type is EncodingType.PRIMITIVE
-        and length_component.form is LengthForm.INDEFINITE
-    ):
-        raise LengthError("Primitive with indefinite length is invalid in BER")
+    length_offset = offset + used_bytes
+    _ensure_valid_offset(data=data, offset=length_offset)
+    byte = data[length_offset]
 
-    if identifier_component.encoding_type is EncodingType.PRIMITIVE:
-        if (
-            length_component.form is LengthForm.INDEFINITE
-            or length_component.content_length is None
-        ):
+    if byte == 0b1000_0000:
+        if encoding_type is EncodingType.PRIMITIVE:
             raise LengthError("Primitive with indefinite length is invalid in BER")
+        return tag_class, encoding_type, tag_number, used_bytes + 1, None
 
-        # null values have 0 content_length and no content
-        if length_component.content_length == 0:
-            return ASN1Encoding(
-                identifier_component=identifier_component,
-                length_component=length_component,
-                content_component=None,
-                eoc_component=None,
-                header=Header(offset=offset, length=current_offset - offset),
+    if byte & 0b1000_0000:
+        if byte == 0b1111_1111:
+            raise LengthError(
+                "first byte of the long form of the length octet cannot be 0xFF"
             )
 
-        content_component = parse_primitive_value(
-            data=data,
-            offset=current_offset,
-            length=length_component.content_length,
+        length_bytes = byte & 0b0111_1111
+        _ensure_valid_offset(data=data, offset=length_offset + 1, length=length_bytes)
+        content_length = int.from_bytes(
+            data[length_offset + 1 : length_offset + 1 + length_bytes], "big"
         )
-        current_offset += content_component.header.length
-        return ASN1Encoding(
-            identifier_component=identifier_component,
-            length_component=length_component,
-            content_component=content_component,
-            eoc_component=None,
-            header=Header(offset=offset, length=current_offset - offset),
+        return (
+            tag_class,
+            encoding_type,
+            tag_number,
+            used_bytes + 1 + length_bytes,
+            content_length,
+        )
+
+    return tag_class, encoding_type, tag_number, used_bytes + 1, byte
+
+
+def find_encoding_end(data: memoryview, offset: int) -> int:
+    """
+    Finds where the encoding starting at `offset` ends without building it.
+    Indefinite-length encodings are walked iteratively down to their EOC.
+
+    Returns:
+        int: the offset right after the encoding
+    """
+    open_indefinite = 0
+
+    while True:
+        if open_indefinite:
+            try:
+                _ensure_valid_offset(data=data, offset=offset, length=2)
+            except ASN1ParserError:
+                raise EOCError("missing required EOC")
+
+            if data[offset] == 0 and data[offset + 1] == 0:
+                offset += 2
+                open_indefinite -= 1
+                if not open_indefinite:
+                    return offset
+                continue
+
+        _, _, _, header_length, content_length = parse_header(data, offset)
+
+        if content_length is None:
+            open_indefinite += 1
+            offset += header_length
+            continue
+
+        offset += header_length + content_length
+        if not open_indefinite:
+            _ensure_valid_offset(data=data, offset=offset - 1)
+            return offset
+
+
+def iter_headers(
+    data: memoryview,
+    offset: int = 0,
+    end: int | None = None,
+    max_depth: int | None = None,
+    eoc: bool = False,
+) -> Iterator[Tuple[int, int, TagClass, EncodingType, int, int, int | None]]:
+    """
+    Walks the encodings starting at `offset` in document order without
+    building them and without recursion: the only state kept is the stack of
+    the open constructed encodings. The walk stops at the first top-level
+    encoding starting at or after `end`. The content of constructed
+    encodings at `max_depth` is skipped. With `eoc` the end-of-contents
+    octets closing indefinite encodings are yielded too, as empty universal
+    primitives with tag number 0.
+
+    Returns:
+        Iterator: (offset, depth, tag_class, encoding_type, tag_number,
+        header_length, content_length) for each encoding, content_length is
+        None for the indefinite form
+    """
+    if end is None:
+        end = len(data)
+
+    # end offsets of the open constructed encodings, None when indefinite
+    ends: List[int | None] = []
+
+    while True:
+        if ends:
+            top = ends[-1]
+            if top is None:
+                try:
+                    _ensure_valid_offset(data=data, offset=offset, length=2)
+                except ASN1ParserError:
+                    raise EOCError("missing required EOC")
+                if data[offset] == 0 and data[offset + 1] == 0:
+                    if eoc:
+                        yield (
+                            offset,
+                            len(ends),
+                            TagClass.UNIVERSAL,
+                            EncodingType.PRIMITIVE,
+                            0,
+                            2,
+                            0,
+                        )
+                    offset += 2
+                    ends.pop()
+                    continue
+            elif offset >= top:
+                if offset != top:
+                    raise LengthError("Constructed content length mismatch")
+                ends.pop()
+                continue
+        elif offset >= end:
+            return
+
+        tag_class, encoding_type, tag_number, header_length, content_length = (
+            parse_header(data, offset)
+        )
+        depth = len(ends)
+        content_offset = offset + header_length
+
+        if encoding_type is EncodingType.PRIMITIVE:
+            # parse_header rejects primitives with indefinite length
+            assert content_length is not None
+            if content_length:
+                _ensure_valid_offset(
+                    data=data, offset=content_offset, length=content_length
+                )
+            yield (
+                offset,
+                depth,
+                tag_class,
+                encoding_type,
+                tag_number,
+                header_length,
+                content_length,
+            )
+            offset = content_offset + content_length
+            continue
+
+        skip = max_depth is not None and depth >= max_depth
+        if skip and content_length:
+            # the skipped content is not walked, its bounds are checked here
+            _ensure_valid_offset(
+                data=data, offset=content_offset, length=content_length
+            )
+        yield (
+            offset,
+            depth,
+            tag_class,
+            encoding_type,
+            tag_number,
+            header_length,
+            content_length,
         )
+        if skip:
+            if content_length is None:
+                offset = find_encoding_end(data, offset)
+            else:
+                offset = content_offset + content_length
+            continue
+
+        ends.append(None if content_length is None else content_offset + content_length)
+        offset = content_offset
+
+
+# (offset, depth, identifier component) once the identifier is read
+StartHook = Callable[[int, int, IdentifierComponent], None]
+# (offset, depth, identifier component, length of the whole encoding)
+EndHook = Callable[[int, int, IdentifierComponent, int], None]
+# (exception, offset of the innermost encoding being parsed)
+ErrorHook = Callable[[ASN1ParserError, int], None]
+
+
+def make_encoding_parser(
+    on_start: StartHook | None = None,
+    on_end: EndHook | None = None,
+    on_error: ErrorHook | None = None,
+) -> Callable[[memoryview, int], ASN1Encoding]:
+    """
+    Builds the recursive descent parser behind `parse_encoding`, calling
+    the given hooks for each encoding parsed and for the error raised, if
+    any. Without hooks the parser is `parse_encoding` itself.
+
+    Returns:
+        Callable: a parser with the signature of `parse_encoding`
+    """
+    # offset of the innermost encoding being parsed, only kept for on_error
+    current = [0]
 
-    # if identifier_component.encoding_type is EncodingType.CONSTRUCTED:
-    else:  # EncodingType.CONSTRUCTED
-        if length_component.form is LengthForm.INDEFINITE:
+    def parse(data: memoryview, offset: int, depth: int) -> ASN1Encoding:
+        if on_error is not None:
+            current[0] = offset
+
+        current_offset = offset
+        _ensure_valid_offset(data=data, offset=current_offset)
+
+        identifier_component = parse_identifier_component(
+            data=data, offset=current_offset
+        )
+        current_offset += identifier_component.header.length
+        if on_start is not None:
+            on_start(offset, depth, identifier_component)
+
+        length_component = parse_length_component(data=data, offset=current_offset)
+        current_offset += length_component.header.length
+
+        content_component: ContentComponent | None = None
+        eoc: EOCComponent | None = None
+        if identifier_component.encoding_type is EncodingType.PRIMITIVE:
+            if (
+                length_component.form is LengthForm.INDEFINITE
+                or length_component.content_length is None
+            ):
+                raise LengthError("Primitive with indefinite length is invalid in BER")
+
+            # null values have 0 content_length and no content
+            if length_component.content_length:
+                content_component = parse_primitive_value(
+                    data=data,
+                    offset=current_offset,
+                    length=length_component.content_length,
+                )
+                current_offset += content_component.header.length
+
+        elif length_component.form is LengthForm.INDEFINITE:
             start = current_offset
             children: List[ASN1Encoding] = []
 
@@ -304,7 +504,7 @@ def parse_encoding(data: memoryview, offset: int = 0) -> ASN1Encoding:
                     current_offset += eoc.header.length
                     break
 
-                child = parse_encoding(data, current_offset)
+                child = parse(data, current_offset, depth + 1)
                 children.append(child)
                 current_offset += child.header.length
 
@@ -316,44 +516,55 @@ def parse_encoding(data: memoryview, offset: int = 0) -> ASN1Encoding:
                 ),
             )
 
-            return ASN1Encoding(
-                identifier_component=identifier_component,
-                length_component=length_component,
-                content_component=content_component,
-                eoc_component=eoc,
-                header=Header(offset=offset, length=current_offset - offset),
-            )
-
         else:  # LengthForm.DEFINITE
             if length_component.content_length is None:
                 raise LengthError("DEFINITE without content_length")
 
+            start = current_offset
             end_offset = current_offset + length_component.content_length
-
-            children: List[ASN1Encoding] = []
+            children = []
 
             while current_offset < end_offset:
-                child = parse_encoding(data=data, offset=current_offset)
+                child = parse(data, current_offset, depth + 1)
                 children.append(child)
                 current_offset += child.header.length
 
             if current_offset != end_offset:
+                if on_error is not None:
+                    current[0] = offset
                 raise LengthError("Constructed content length mismatch")
 
             content_component = ContentComponent(
                 content=children,
-                header=Header(
-                    offset=identifier_component.header.offset
-                    + identifier_component.header.length
-                    + length_component.header.length,
-                    length=length_component.content_length,
-                ),
+                header=Header(offset=start, length=length_component.content_length),
             )
 
-            return ASN1Encoding(
-                identifier_component=identifier_component,
-                length_component=length_component,
-                content_component=content_component,
-                eoc_component=None,
-                header=Header(offset=offset, length=current_offset - offset),
-            )
+        if on_end is not None:
+            on_end(offset, depth, identifier_component, current_offset - offset)
+        return ASN1Encoding(
+            identifier_component=identifier_component,
+            length_component=length_component,
+            content_component=content_component,
+            eoc_component=eoc,
+            header=Header(offset=offset, length=current_offset - offset),
+        )
+
+    def parse_encoding(data: memoryview, offset: int = 0) -> ASN1Encoding:
+        """
+        Parses an ASN.1 encoding from `data` starting at `offset`.
+
+        Returns:
+            ASN1Encoding: the decoded encoding
+        """
+        if on_error is None:
+            return parse(data, offset, 0)
+        try:
+            return parse(data, offset, 0)
+        except ASN1ParserError as exc:
+            on_error(exc, current[0])
+            raise
+
+    return parse_encoding
+
+
+parse_encoding = make_encoding_parser()
@@ -1,6 +1,6 @@
-from typing import Dict, List
+from typing import Any, Dict, List, Tuple
 from enum import IntEnum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 class TagClass(IntEnum):
@@ -59,6 +59,10 @@ class ASN1Encoding:
     length_component: LengthComponent
     content_component: ContentComponent | None
     eoc_component: EOCComponent | None
+    # (ok, value or error) once `value` was read, None before
+    _value_cache: Tuple[bool, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __str__(self) -> str:
         class_name = self.identifier_component.tag_class.name
@@ -111,6 +115,44 @@ class ASN1Encoding:
             if isinstance(self.content_component.content, list):
                 return self.content_component.content
 
+    @property
+    def value(self) -> Any:
+        """
+        The value decoded with the decoder registered for the tag (see
+        `asn1values.decode_value`). It is decoded on first access and cached
+        on the node; a decoding error is cached too and raised again on every
+        access. Later registrations do not affect cached values.
+        """
+        cached = self._value_cache
+        if cached is None:
+            # asn1values depends on this module
+            from asn1decoder.asn1values.registry import decode_value
+
+            try:
+                cached = (True, decode_value(self))
+            except ValueError as e:
+                cached = (False, e)
+            self._value_cache = cached
+
+        if cached[0]:
+            return cached[1]
+        raise cached[1].with_traceback(None)
+
+    def clear_value(self, recursive: bool = False) -> None:
+        """
+        Drops the cached value of this node, and of all the nodes below it
+        with `recursive`.
+        """
+        self._value_cache = None
+        if not recursive:
+            return
+
+        stack = list(self.inner_encodings or ())
+        while stack:
+            encoding = stack.pop()
+            encoding._value_cache = None
+            stack.extend(encoding.inner_encodings or ())
+
 
 ASN1TypeNames: Dict[int, str] = {
     0: "EOC",
@@ -1,5 +1,31 @@
-from asn1decoder.asn1values.oid import parse_oid, OIDParserError
-from asn1decoder.asn1values.integer import parse_integer, IntegerParserError
+from asn1decoder.asn1values.oid import (
+    parse_oid,
+    parse_oid_arcs,
+    parse_relative_oid,
+    parse_relative_oid_arcs,
+    RelativeOIDParserError,
+    decode_oid,
+    DecodedOID,
+    OIDDecoderCache,
+    OIDParserError,
+    encode_oid,
+)
+from asn1decoder.asn1values.oid_matcher import OIDMatcher
+from asn1decoder.asn1values.intern_pool import InternPool, InternPoolInfo
+from asn1decoder.asn1values.oid_registry import register_oid_name, lookup_oid_name
+from asn1decoder.asn1values.integer import (
+    parse_integer,
+    parse_integer_lazy,
+    parse_integers,
+    LazyInteger,
+    IntegerParserError,
+)
+from asn1decoder.asn1values.bit_string import (
+    parse_bitstring,
+    BitString,
+    BitStringParserError,
+    KEY_USAGE_BITS,
+)
 from asn1decoder.asn1values.null import parse_null, NullParserError
 from asn1decoder.asn1values.octet_string import (
     parse_octetstring,
@@ -29,13 +55,107 @@ from asn1decoder.asn1values.utf8_string import (
     UTF8StringParserError,
 )
 
-from asn1decoder.asn1values.utctime import parse_utctime, UTCTimeParserError
+from asn1decoder.asn1values.bmp_string import parse_bmpstring, BMPStringParserError
+from asn1decoder.asn1values.universal_string import (
+    parse_universalstring,
+    UniversalStringParserError,
+)
+from asn1decoder.asn1values.teletex_string import (
+    parse_teletexstring,
+    TeletexStringParserError,
+)
+
+from asn1decoder.asn1values.utctime import (
+    parse_utctime,
+    parse_utctime_epoch,
+    UTCTimeParserError,
+)
+from asn1decoder.asn1values.generalized_time import (
+    parse_generalizedtime,
+    parse_generalizedtime_epoch,
+    GeneralizedTimeParserError,
+)
+from asn1decoder.asn1values.time_batch import parse_times_epoch
+from asn1decoder.asn1values.registry import (
+    decode_value,
+    decode_tree,
+    register_decoder,
+    unregister_decoder,
+    has_decoder,
+    ValueDecoderError,
+)
+from asn1decoder.asn1values.buffer import (
+    parse_integer_buffer,
+    parse_bitstring_buffer,
+    parse_null_buffer,
+    parse_octetstring_buffer,
+    parse_oid_buffer,
+    parse_relative_oid_buffer,
+    parse_numericstring_buffer,
+    parse_printablestring_buffer,
+    parse_teletexstring_buffer,
+    parse_ia5string_buffer,
+    parse_visiblestring_buffer,
+    parse_generalstring_buffer,
+    parse_utf8string_buffer,
+    parse_universalstring_buffer,
+    parse_bmpstring_buffer,
+    parse_utctime_buffer,
+    parse_utctime_epoch_buffer,
+    parse_generalizedtime_buffer,
+    parse_generalizedtime_epoch_buffer,
+    parse_value_at,
+    BUFFER_PARSERS,
+)
+from asn1decoder.asn1values.validate import (
+    try_decode,
+    validate_value,
+    validate_values,
+    CONTENT_CHECKS,
+    try_parse_integer,
+    try_parse_bitstring,
+    try_parse_octetstring,
+    try_parse_null,
+    try_parse_oid,
+    try_parse_relative_oid,
+    try_parse_numericstring,
+    try_parse_printablestring,
+    try_parse_teletexstring,
+    try_parse_ia5string,
+    try_parse_visiblestring,
+    try_parse_generalstring,
+    try_parse_utf8string,
+    try_parse_universalstring,
+    try_parse_bmpstring,
+    try_parse_utctime,
+    try_parse_generalizedtime,
+)
 
 __all__ = [
     "parse_oid",
+    "parse_oid_arcs",
+    "parse_relative_oid",
+    "parse_relative_oid_arcs",
+    "RelativeOIDParserError",
+    "decode_oid",
+    "DecodedOID",
+    "OIDDecoderCache",
     "OIDParserError",
+    "encode_oid",
+    "OIDMatcher",
+    "InternPool",
+    "InternPoolInfo",
+    "register_oid_name",
+    "lookup_oid_name",
     "parse_integer",
+    "parse_integer_lazy",
+    "parse_integers",
+    "LazyInteger",
     "IntegerParserError",
+    "parse_bitstring",
+    "BitString",
+    "BitStringParserError",
+    "KEY_USAGE_BITS",
     "parse_null",
     "NullParserError",
     "parse_numericstring",
@@ -52,6 +172,65 @@ __all__ = [
     "GeneralStringParserError",
     "parse_utf8string",
     "UTF8StringParserError",
+    "parse_bmpstring",
+    "BMPStringParserError",
+    "parse_universalstring",
+    "UniversalStringParserError",
+    "parse_teletexstring",
+    "TeletexStringParserError",
     "parse_utctime",
+    "parse_utctime_epoch",
     "UTCTimeParserError",
+    "parse_generalizedtime",
+    "parse_generalizedtime_epoch",
+    "GeneralizedTimeParserError",
+    "parse_times_epoch",
+    "decode_value",
+    "decode_tree",
+    "register_decoder",
+    "unregister_decoder",
+    "has_decoder",
+    "ValueDecoderError",
+    "parse_integer_buffer",
+    "parse_bitstring_buffer",
+    "parse_null_buffer",
+    "parse_octetstring_buffer",
+    "parse_oid_buffer",
+    "parse_relative_oid_buffer",
+    "parse_numericstring_buffer",
+    "parse_printablestring_buffer",
+    "parse_teletexstring_buffer",
+    "parse_ia5string_buffer",
+    "parse_visiblestring_buffer",
+    "parse_generalstring_buffer",
+    "parse_utf8string_buffer",
+    "parse_universalstring_buffer",
+    "parse_bmpstring_buffer",
+    "parse_utctime_buffer",
+    "parse_utctime_epoch_buffer",
+    "parse_generalizedtime_buffer",
+    "parse_generalizedtime_epoch_buffer",
+    "parse_value_at",
+    "BUFFER_PARSERS",
+    "try_decode",
+    "validate_value",
+    "validate_values",
+    "CONTENT_CHECKS",
+    "try_parse_integer",
+    "try_parse_bitstring",
+    "try_parse_octetstring",
+    "try_parse_null",
+    "try_parse_oid",
+    "try_parse_relative_oid",
+    "try_parse_numericstring",
+    "try_parse_printablestring",
+    "try_parse_teletexstring",
+    "try_parse_ia5string",
+    "try_parse_visiblestring",
+    "try_parse_generalstring",
+    "try_parse_utf8string",
+    "try_parse_universalstring",
+    "try_parse_bmpstring",
+    "try_parse_utctime",
+    "try_parse_generalizedtime",
 ]
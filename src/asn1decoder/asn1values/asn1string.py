@@ -1,35 +1,103 @@
-from abc import ABC, abstractmethod
-from typing import Type
+from abc import ABC
+from typing import Iterable, Type
 from asn1decoder.asn1types import ASN1Encoding, EncodingType
 from asn1decoder.asn1parser import ASN1ParserError, decode_byte
-from asn1decoder.asn1values import parse_octetstring
+from asn1decoder.asn1values.octet_string import parse_octetstring
+from asn1decoder.asn1values.intern_pool import InternPool
 
 
 class ASN1StringParserError(ASN1ParserError):
     pass
 
 
+def compile_alphabet(chars: Iterable[int] | str) -> bytes:
+    """
+    Compiles the set of valid characters of a restricted string type into the
+    sorted byte table consumed by `find_invalid_byte`.
+    """
+    if isinstance(chars, str):
+        chars = chars.encode("ascii")
+    return bytes(sorted(set(chars)))
+
+
+def find_invalid_byte(data: bytes, alphabet: bytes | None) -> int:
+    """
+    Validates `data` against `alphabet` (None means any 7-bit ASCII byte).
+
+    The check runs as a single bulk operation over the whole buffer; only when
+    it fails the buffer is walked again to locate the offending byte.
+
+    Returns:
+        int: the index of the first invalid byte, or -1 if `data` is valid
+    """
+    if alphabet is None:
+        if data.isascii():
+            return -1
+    elif not data.translate(None, alphabet):
+        return -1
+
+    for index, byte in enumerate(data):
+        if byte > 0x7F or (alphabet is not None and byte not in alphabet):
+            return index
+
+    raise AssertionError("unreachable")
+
+
 class ASN1String(ABC):
     TAG_NUMBER: int
     EXCEPTION_CLASS: Type[ASN1StringParserError]
+    ALPHABET: bytes | None = None
 
-    def __init__(self, encoding: ASN1Encoding) -> None:
+    def __init__(self, encoding: ASN1Encoding, implicit: bool = False) -> None:
         self.encoding = encoding
-        self._validate_tag()
+        if not implicit:
+            self._validate_tag()
 
-    @abstractmethod
     def is_valid_char(self, char: str) -> bool:
-        pass
+        if len(char) > 1:
+            raise ValueError(f"expected a character but got a string: '{char}'")
+
+        return find_invalid_byte(char.encode("latin-1"), self.ALPHABET) == -1
 
     def parse(self) -> str:
         raw_bytes = self._extract_bytes()
-        return self._decode_and_validate(raw_bytes)
+        return self.decode_bytes(raw_bytes)
+
+    def parse_interned(self, pool: InternPool) -> str:
+        """
+        Like `parse`, but through `pool`: a value already in the pool is
+        returned as the pooled object without being decoded again.
+        """
+        return pool.lookup(self.TAG_NUMBER, self._extract_buffer(), self.decode_bytes)
 
     def _extract_bytes(self) -> bytes:
         if self.encoding.encoding_type is EncodingType.PRIMITIVE:
             return self._extract_primitive()
         return self._extract_constructed()
 
+    def _extract_buffer(self) -> bytes | memoryview:
+        """
+        Like `_extract_bytes`, but primitive content is returned as a view over
+        the source buffer instead of a copy. Constructed content is reassembled
+        with a single join.
+        """
+        if self.encoding.encoding_type is EncodingType.CONSTRUCTED:
+            return self._extract_constructed()
+
+        if self.encoding.content_length is None:
+            raise self.EXCEPTION_CLASS(
+                f"{self.__class__.__name__} declared with null length."
+            )
+
+        if self.encoding.content_component is None:
+            return b""
+
+        content = self.encoding.content_component.content
+        if not isinstance(content, memoryview):
+            raise self.EXCEPTION_CLASS(f"{self.__class__.__name__} content missing.")
+
+        return content
+
     def _validate_tag(self) -> None:
         if self.encoding.tag_number != self.TAG_NUMBER:
             raise self.EXCEPTION_CLASS(
@@ -62,19 +130,21 @@ class ASN1String(ABC):
 
         return b"".join(chunks)
 
-    def _decode_and_validate(self, data: bytes) -> str:
-        chars = []
-        for byte in data:
-            try:
-                char = decode_byte(byte)
-            except ValueError as e:
-                raise self.EXCEPTION_CLASS(str(e))
+    @classmethod
+    def decode_bytes(cls, data: bytes | memoryview) -> str:
+        """
+        Validates and decodes the (reassembled) content octets of this type.
+        """
+        if type(data) is not bytes:
+            data = bytes(data)
 
-            if not self.is_valid_char(char):
-                raise self.EXCEPTION_CLASS(
-                    f"Invalid character '{char}' for {self.__class__.__name__}"
-                )
+        index = find_invalid_byte(data, cls.ALPHABET)
+        if index == -1:
+            return data.decode("ascii")
 
-            chars.append(char)
+        try:
+            char = decode_byte(data[index])
+        except ValueError as e:
+            raise cls.EXCEPTION_CLASS(str(e))
 
-        return "".join(chars)
+        raise cls.EXCEPTION_CLASS(f"Invalid character '{char}' for {cls.__name__}")
@@ -0,0 +1,275 @@
+from datetime import MINYEAR, datetime, timedelta, timezone
+from typing import Tuple, Type
+from asn1decoder.asn1types import ASN1Encoding, EncodingType
+from asn1decoder.asn1parser import ASN1ParserError
+
+
+class ASN1TimeParserError(ASN1ParserError):
+    pass
+
+
+# (year, month, day, hours, minutes, seconds, microseconds, utc offset in seconds)
+# the offset is None for local times
+TimeFields = Tuple[int, int, int, int, int, int, int, int | None]
+
+_DIGITS = b"0123456789"
+_DIGIT_VALUES = bytes.maketrans(_DIGITS, bytes(range(10)))
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+_FRACTION_UNIT_US = {10: 3_600_000_000, 12: 60_000_000, 14: 1_000_000}
+_EPOCH_UNITS = {"s": 1, "ms": 1_000, "us": 1_000_000}
+
+
+def _is_leap(year: int) -> bool:
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def days_from_civil(year: int, month: int, day: int) -> int:
+    """
+    Number of days between 1970-01-01 and the given proleptic Gregorian date.
+    """
+    year -= month <= 2
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * (month + (-3 if month > 2 else 9)) + 2) // 5 + day - 1
+    day_of_era = (
+        year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    )
+    return era * 146097 + day_of_era - 719468
+
+
+def _time_content(
+    encoding: ASN1Encoding,
+    tag_number: int,
+    exception_class: Type[ASN1TimeParserError],
+    type_name: str,
+    implicit: bool = False,
+) -> bytes:
+    if encoding.encoding_type is EncodingType.CONSTRUCTED:
+        raise exception_class(f"{type_name} shall be primitive.")
+
+    if not implicit and encoding.tag_number != tag_number:
+        raise exception_class(
+            f"{type_name} can be initialized only with encoding having tag number = {tag_number}. Got {encoding.tag_number}."
+        )
+
+    if encoding.content_length in (None, 0) or encoding.content_component is None:
+        raise exception_class(f"{type_name} declared without content.")
+
+    content = encoding.content_component.content
+    if not isinstance(content, memoryview):
+        raise exception_class(f"{type_name} declared without content.")
+
+    if encoding.content_length != len(content):
+        raise exception_class(
+            f"{type_name} length mismatch. Declared {encoding.content_length} found {len(content)}."
+        )
+
+    return content.tobytes()
+
+
+def _two_digits(
+    data: bytes,
+    offset: int,
+    name: str,
+    limit: Tuple[int, int] | None,
+    exception_class: Type[ASN1TimeParserError],
+    type_name: str,
+) -> int:
+    high = data[offset] - 0x30
+    low = data[offset + 1] - 0x30
+    if not (0 <= high <= 9 and 0 <= low <= 9):
+        raw_value = data[offset : offset + 2].decode("latin-1")
+        raise exception_class(f"{type_name} declared with invalid {name}, {raw_value}.")
+
+    value = high * 10 + low
+    if limit is not None and not limit[0] <= value <= limit[1]:
+        raise exception_class(f"{type_name} declared with invalid {name}, {value}.")
+
+    return value
+
+
+def _check_date(
+    year: int,
+    month: int,
+    day: int,
+    exception_class: Type[ASN1TimeParserError],
+    type_name: str,
+) -> None:
+    # years before 1 AD have no datetime
+    if year < MINYEAR:
+        raise exception_class(f"{type_name} declared with invalid year, {year}.")
+
+    last_day = 29 if month == 2 and _is_leap(year) else _DAYS_IN_MONTH[month - 1]
+    if day > last_day:
+        raise exception_class(f"{type_name} declared with invalid day, {day}.")
+
+
+def decode_utctime_fields(
+    data: bytes, exception_class: Type[ASN1TimeParserError]
+) -> TimeFields:
+    """
+    Decodes the YYMMDDHHMMSSZ content octets of a UTCTime.
+    """
+    if len(data) != 13:
+        raise exception_class("UTCTime must be encoded with YYMMDDHHMMSSZ.")
+
+    if data[12] != 0x5A:  # 'Z'
+        raise exception_class("UTCTime not ending with 'Z'.")
+
+    if data[:12].isdigit():
+        d = data.translate(_DIGIT_VALUES)
+        yy = d[0] * 10 + d[1]
+        month = d[2] * 10 + d[3]
+        day = d[4] * 10 + d[5]
+        hours = d[6] * 10 + d[7]
+        minutes = d[8] * 10 + d[9]
+        seconds = d[10] * 10 + d[11]
+        valid = (
+            1 <= month <= 12
+            and 1 <= day <= 31
+            and hours <= 23
+            and minutes <= 59
+            and seconds <= 59
+        )
+    else:
+        valid = False
+
+    if not valid:
+        # slow path, only to report the offending field
+        _two_digits(data, 0, "year", None, exception_class, "UTCTime")
+        _two_digits(data, 2, "month", (1, 12), exception_class, "UTCTime")
+        _two_digits(data, 4, "day", (1, 31), exception_class, "UTCTime")
+        _two_digits(data, 6, "hours", (0, 23), exception_class, "UTCTime")
+        _two_digits(data, 8, "minutes", (0, 59), exception_class, "UTCTime")
+        _two_digits(data, 10, "seconds", (0, 59), exception_class, "UTCTime")
+        raise AssertionError("unreachable")
+
+    year = 2000 + yy if yy <= 49 else 1900 + yy
+    _check_date(year, month, day, exception_class, "UTCTime")
+
+    return (year, month, day, hours, minutes, seconds, 0, 0)
+
+
+def decode_generalizedtime_fields(
+    data: bytes, exception_class: Type[ASN1TimeParserError]
+) -> TimeFields:
+    """
+    Decodes the content octets of a GeneralizedTime:
+    YYYYMMDDHH[MM[SS]][(.|,)fraction][Z|(+|-)hh[mm]]
+
+    The fraction applies to the last time element present.
+    """
+    name = "GeneralizedTime"
+    size = len(data)
+    if size < 10:
+        raise exception_class(f"{name} must be encoded with at least YYYYMMDDHH.")
+
+    year = _two_digits(data, 0, "year", None, exception_class, name) * 100
+    year += _two_digits(data, 2, "year", None, exception_class, name)
+    month = _two_digits(data, 4, "month", (1, 12), exception_class, name)
+    day = _two_digits(data, 6, "day", (1, 31), exception_class, name)
+    hours = _two_digits(data, 8, "hours", (0, 23), exception_class, name)
+    _check_date(year, month, day, exception_class, name)
+
+    minutes = seconds = microseconds = 0
+    offset = 10
+    if offset + 1 < size and data[offset] in _DIGITS:
+        minutes = _two_digits(data, offset, "minutes", (0, 59), exception_class, name)
+        offset += 2
+        if offset + 1 < size and data[offset] in _DIGITS:
+            seconds = _two_digits(
+                data, offset, "seconds", (0, 59), exception_class, name
+            )
+            offset += 2
+
+    if offset < size and data[offset] in b".,":
+        start = offset + 1
+        end = start
+        while end < size and data[end] in _DIGITS:
+            end += 1
+
+        if end == start:
+            raise exception_class(f"{name} declared with empty fraction.")
+
+        unit = _FRACTION_UNIT_US[offset]
+        fraction = int(data[start:end]) * unit // 10 ** (end - start)
+        minutes += fraction // 60_000_000
+        seconds += fraction // 1_000_000 % 60
+        microseconds = fraction % 1_000_000
+        offset = end
+
+    utc_offset = None
+    if offset < size:
+        designator = data[offset]
+        if designator == 0x5A:  # 'Z'
+            utc_offset = 0
+            offset += 1
+        elif designator in b"+-" and offset + 3 <= size:
+            offset_hours = _two_digits(
+                data, offset + 1, "offset hours", (0, 23), exception_class, name
+            )
+            offset_minutes = 0
+            if offset + 5 <= size:
+                offset_minutes = _two_digits(
+                    data, offset + 3, "offset minutes", (0, 59), exception_class, name
+                )
+                offset += 2
+            utc_offset = offset_hours * 3600 + offset_minutes * 60
+            if designator == 0x2D:  # '-'
+                utc_offset = -utc_offset
+            offset += 3
+
+    if offset != size:
+        raise exception_class(
+            f"{name} with unexpected trailing data {data[offset:]!r}."
+        )
+
+    return (year, month, day, hours, minutes, seconds, microseconds, utc_offset)
+
+
+def fields_to_epoch(fields: TimeFields, unit: str = "s") -> int:
+    """
+    Converts decoded fields to an integer timestamp since 1970-01-01T00:00:00Z
+    in `unit` ("s", "ms" or "us"). Sub-unit precision is truncated towards
+    negative infinity. Local times (no offset) are taken as UTC.
+    """
+    year, month, day, hours, minutes, seconds, microseconds, utc_offset = fields
+    epoch = (
+        days_from_civil(year, month, day) * 86400
+        + hours * 3600
+        + minutes * 60
+        + seconds
+        - (utc_offset or 0)
+    )
+
+    multiplier = _EPOCH_UNITS[unit]
+    if multiplier == 1:
+        return epoch
+    return epoch * multiplier + microseconds * multiplier // 1_000_000
+
+
+def fields_to_datetime(fields: TimeFields, aware: bool = True) -> datetime:
+    """
+    Builds a datetime from decoded fields. When `aware` is set, times with an
+    offset get a fixed-offset tzinfo; local times always stay naive.
+    """
+    year, month, day, hours, minutes, seconds, microseconds, utc_offset = fields
+
+    tzinfo = None
+    if aware and utc_offset is not None:
+        tzinfo = (
+            timezone.utc
+            if utc_offset == 0
+            else timezone(timedelta(seconds=utc_offset))
+        )
+
+    return datetime(
+        year=year,
+        month=month,
+        day=day,
+        hour=hours,
+        minute=minutes,
+        second=seconds,
+        microsecond=microseconds,
+        tzinfo=tzinfo,
+    )
@@ -0,0 +1,204 @@
+from typing import Iterable, Iterator, List, Mapping, Sequence
+from asn1decoder.asn1types import ASN1Encoding, EncodingType
+from asn1decoder.asn1parser import ASN1ParserError
+
+
+class BitStringParserError(ASN1ParserError):
+    pass
+
+
+# X.509 KeyUsage named bits, by bit position
+KEY_USAGE_BITS = (
+    "digitalSignature",
+    "nonRepudiation",
+    "keyEncipherment",
+    "dataEncipherment",
+    "keyAgreement",
+    "keyCertSign",
+    "cRLSign",
+    "encipherOnly",
+    "decipherOnly",
+)
+
+
+class BitString:
+    """
+    A BIT STRING value kept as a view over its content octets (the initial
+    octet with the number of unused bits excluded).
+
+    Bits are numbered as in ASN.1: bit 0 is the most significant bit of the
+    first octet.
+    """
+
+    __slots__ = ("content", "unused_bits")
+
+    def __init__(self, content: memoryview, unused_bits: int = 0) -> None:
+        self.content = content
+        self.unused_bits = unused_bits
+
+    @property
+    def bit_length(self) -> int:
+        return len(self.content) * 8 - self.unused_bits
+
+    def __len__(self) -> int:
+        return self.bit_length
+
+    def __getitem__(self, index: int) -> int:
+        if index < 0:
+            index += self.bit_length
+        if not 0 <= index < self.bit_length:
+            raise IndexError("bit index out of range")
+        return self.content[index >> 3] >> (7 - (index & 7)) & 1
+
+    def __iter__(self) -> Iterator[int]:
+        """Yields the value (0 or 1) of every bit, in order."""
+        content = self.content
+        for index in range(self.bit_length):
+            yield content[index >> 3] >> (7 - (index & 7)) & 1
+
+    def iter_set_bits(self) -> Iterator[int]:
+        """Yields the positions of the bits set to 1; zero octets are skipped."""
+        bit_length = self.bit_length
+        for octet_index, octet in enumerate(self.content):
+            if not octet:
+                continue
+            base = octet_index * 8
+            for shift in range(8):
+                if octet & (0x80 >> shift):
+                    if base + shift >= bit_length:
+                        return
+                    yield base + shift
+
+    def to_int(self) -> int:
+        """The bits read as an unsigned big-endian number of `bit_length` bits."""
+        return int.from_bytes(self.content, "big") >> self.unused_bits
+
+    def to_bytes(self, mask: bool = True) -> bytes:
+        """
+        The content octets. With `mask` set the unused trailing bits are
+        cleared, since BER does not require them to be zero.
+        """
+        data = self.content.tobytes()
+        if mask and self.unused_bits and data:
+            last = data[-1] & (0xFF << self.unused_bits) & 0xFF
+            data = data[:-1] + bytes([last])
+        return data
+
+    def named_bits(self, names: Sequence[str] | Mapping[str, int]) -> frozenset:
+        """
+        The names of the bits that are set. `names` lists names by bit
+        position (e.g. KEY_USAGE_BITS) or maps names to positions, as in
+        `NamedBitList` notation.
+        """
+        if isinstance(names, Mapping):
+            positions = {position: name for name, position in names.items()}
+        else:
+            positions = dict(enumerate(names))
+
+        return frozenset(
+            positions[index] for index in self.iter_set_bits() if index in positions
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BitString):
+            return NotImplemented
+        return (
+            self.bit_length == other.bit_length and self.to_bytes() == other.to_bytes()
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.bit_length, self.to_bytes()))
+
+    def __repr__(self) -> str:
+        if self.bit_length > 64:
+            return f"BitString(<{self.bit_length} bits>)"
+        bits = "".join(str(bit) for bit in self)
+        return f"BitString('{bits}'B)"
+
+
+def _check_unused_bits(content: bytes | memoryview) -> int:
+    if not content:
+        raise BitStringParserError("BitString declared without content.")
+
+    unused_bits = content[0]
+    if unused_bits > 7:
+        raise BitStringParserError(
+            f"BitString with invalid number of unused bits {unused_bits}."
+        )
+    if unused_bits and len(content) == 1:
+        raise BitStringParserError(
+            "BitString without content octets shall have 0 unused bits."
+        )
+    return unused_bits
+
+
+def join_bitstring_segments(segments: Sequence[bytes | memoryview]) -> bytes:
+    """
+    Joins the contents of the primitive segments of a constructed BIT STRING
+    into the content of the equivalent primitive encoding. Only the last
+    segment may have unused bits.
+    """
+    if not segments:
+        return b"\x00"
+
+    parts: List[bytes | memoryview] = [b""]
+    for index, segment in enumerate(segments):
+        unused_bits = _check_unused_bits(segment)
+        if unused_bits and index != len(segments) - 1:
+            raise BitStringParserError(
+                "Only the last segment of a constructed BitString can have unused bits."
+            )
+        parts.append(segment[1:])
+
+    parts[0] = bytes([segments[-1][0]])
+    return b"".join(parts)
+
+
+def _primitive_segments(encoding: ASN1Encoding) -> Iterable[memoryview]:
+    # depth-first, without recursion, over nested constructed segments
+    stack = [iter(encoding.inner_encodings or ())]
+    while stack:
+        inner = next(stack[-1], None)
+        if inner is None:
+            stack.pop()
+            continue
+
+        if inner.tag_number != 3:
+            raise BitStringParserError(
+                f"BitString segments shall be BitStrings. Got tag {inner.tag_number}."
+            )
+
+        if inner.encoding_type is EncodingType.CONSTRUCTED:
+            if inner.inner_encodings is None:
+                raise BitStringParserError("BitString with invalid segments.")
+            stack.append(iter(inner.inner_encodings))
+            continue
+
+        if inner.content_component is None:
+            raise BitStringParserError("BitString declared without content.")
+        yield inner.content_component.content
+
+
+def bitstring_value(content: bytes | memoryview) -> BitString:
+    """Builds a BitString over the content octets of a primitive encoding."""
+    unused_bits = _check_unused_bits(content)
+    return BitString(memoryview(content)[1:], unused_bits)
+
+
+def parse_bitstring(encoding: ASN1Encoding, implicit: bool = False) -> BitString:
+    if not implicit and encoding.tag_number != 3:
+        raise BitStringParserError(
+            f"BitString can be initialized only with encoding having tag number = 3. Got {encoding.tag_number}."
+        )
+
+    if encoding.encoding_type is EncodingType.CONSTRUCTED:
+        if encoding.inner_encodings is None:
+            raise BitStringParserError("BitString with invalid segments.")
+        return bitstring_value(
+            join_bitstring_segments(list(_primitive_segments(encoding)))
+        )
+
+    if encoding.content_length in (None, 0) or encoding.content_component is None:
+        raise BitStringParserError("BitString declared without content.")
+
+    return bitstring_value(encoding.content_component.content)
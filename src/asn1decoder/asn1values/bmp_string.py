@@ -0,0 +1,40 @@
+from asn1decoder.asn1types import ASN1Encoding
+from asn1decoder.asn1values.asn1string import ASN1String, ASN1StringParserError
+
+
+class BMPStringParserError(ASN1StringParserError):
+    pass
+
+
+class ASN1BMPString(ASN1String):
+    TAG_NUMBER = 30
+    EXCEPTION_CLASS = BMPStringParserError
+
+    def parse(self) -> str:
+        return self.decode_bytes(self._extract_buffer())
+
+    @classmethod
+    def decode_bytes(cls, data: bytes | memoryview) -> str:
+        if len(data) % 2:
+            raise BMPStringParserError(
+                f"BMPString length must be a multiple of 2. Got {len(data)}."
+            )
+
+        # lone surrogates are rejected by the strict codec
+        try:
+            value = str(data, "utf-16-be")
+        except UnicodeDecodeError as e:
+            raise BMPStringParserError(str(e))
+
+        # surrogate pairs decode to characters outside the BMP
+        if value and max(value) > "\uffff":
+            raise BMPStringParserError(
+                "BMPString cannot contain characters outside the Basic Multilingual Plane."
+            )
+
+        return value
+
+
+def parse_bmpstring(encoding: ASN1Encoding, implicit: bool = False) -> str:
+    p = ASN1BMPString(encoding=encoding, implicit=implicit)
+    return p.parse()
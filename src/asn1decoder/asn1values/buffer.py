@@ -0,0 +1,531 @@
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Tuple, Type
+from asn1decoder.asn1types import EncodingType, TagClass
+from asn1decoder.asn1parser import ASN1ParserError, find_encoding_end, parse_header
+from asn1decoder.asn1values.integer import IntegerParserError
+from asn1decoder.asn1values.bit_string import (
+    BitString,
+    BitStringParserError,
+    bitstring_value,
+    join_bitstring_segments,
+)
+from asn1decoder.asn1values.null import NullParserError
+from asn1decoder.asn1values.octet_string import OctetStringParserError
+from asn1decoder.asn1values.oid import OIDParserError, RelativeOIDParserError
+from asn1decoder.asn1values.numeric_string import (
+    NumericStringParserError,
+    _decode_numeric_bytes,
+)
+from asn1decoder.asn1values.printable_string import (
+    ASN1PrintableString,
+    PrintableStringParserError,
+)
+from asn1decoder.asn1values.teletex_string import (
+    ASN1TeletexString,
+    TeletexStringParserError,
+)
+from asn1decoder.asn1values.ia5_string import ASN1IA5String, IA5StringParserError
+from asn1decoder.asn1values.visible_string import (
+    ASN1VisibleString,
+    VisibleStringParserError,
+)
+from asn1decoder.asn1values.general_string import GeneralStringParserError
+from asn1decoder.asn1values.utf8_string import ASN1UTF8String, UTF8StringParserError
+from asn1decoder.asn1values.universal_string import (
+    ASN1UniversalString,
+    UniversalStringParserError,
+)
+from asn1decoder.asn1values.bmp_string import ASN1BMPString, BMPStringParserError
+from asn1decoder.asn1values.asn1time import (
+    TimeFields,
+    decode_generalizedtime_fields,
+    decode_utctime_fields,
+    fields_to_datetime,
+    fields_to_epoch,
+)
+from asn1decoder.asn1values.utctime import UTCTimeParserError
+from asn1decoder.asn1values.generalized_time import GeneralizedTimeParserError
+from asn1decoder.asn1values.registry import (
+    integer_value,
+    null_value,
+    oid_value,
+    relative_oid_value,
+)
+
+# Variants of the parse_* functions working on a span of the source buffer:
+# `content_offset` and `content_length` delimit the content octets (as
+# returned by `parse_header`), `constructed` is the form of the encoding. No
+# ASN1Encoding is needed, primitive content is read as a view over `buf` and
+# the segments of constructed strings are walked in place. The tag is not
+# checked: the caller already dispatched on it.
+
+Buffer = bytes | memoryview
+
+
+def _primitive_content(
+    buf: Buffer,
+    content_offset: int,
+    content_length: int | None,
+    constructed: bool,
+    exception_class: Type[ASN1ParserError],
+    type_name: str,
+) -> Buffer:
+    if constructed:
+        raise exception_class(f"{type_name} shall be primitive.")
+
+    if content_length is None:
+        raise exception_class(f"{type_name} declared with null length.")
+
+    end = content_offset + content_length
+    if content_offset < 0 or end > len(buf):
+        raise exception_class(
+            f"{type_name} content at offset {content_offset} exceeds the buffer."
+        )
+    return buf[content_offset:end]
+
+
+def _segments(
+    buf: Buffer,
+    offset: int,
+    length: int | None,
+    segment_tag: int,
+    exception_class: Type[ASN1ParserError],
+    type_name: str,
+) -> List[Buffer]:
+    # depth-first, without recursion; each entry of `ends` is the end offset
+    # of an open constructed encoding, None when its length is indefinite
+    chunks: List[Buffer] = []
+    ends: List[int | None] = [None if length is None else offset + length]
+    size = len(buf)
+
+    while ends:
+        end = ends[-1]
+        if end is None:
+            if offset + 2 > size:
+                raise exception_class(f"{type_name} segments without EOC.")
+            if buf[offset] == 0 and buf[offset + 1] == 0:
+                offset += 2
+                ends.pop()
+                continue
+        elif offset >= end:
+            if offset != end:
+                raise exception_class(
+                    f"{type_name} segments exceed the constructed length."
+                )
+            ends.pop()
+            continue
+
+        _, encoding_type, tag_number, header_length, inner_length = parse_header(
+            buf, offset
+        )
+        if tag_number != segment_tag:
+            raise exception_class(
+                f"{type_name} segments shall have tag number = {segment_tag}. Got {tag_number}."
+            )
+
+        offset += header_length
+        if encoding_type is EncodingType.CONSTRUCTED:
+            ends.append(None if inner_length is None else offset + inner_length)
+            continue
+
+        # parse_header rejects primitives with indefinite length
+        assert inner_length is not None
+        if offset + inner_length > size:
+            raise exception_class(f"{type_name} segment exceeds the buffer.")
+        chunks.append(buf[offset : offset + inner_length])
+        offset += inner_length
+
+    return chunks
+
+
+def _string_content(
+    buf: Buffer,
+    content_offset: int,
+    content_length: int | None,
+    constructed: bool,
+    exception_class: Type[ASN1ParserError],
+    type_name: str,
+) -> Buffer:
+    if not constructed:
+        return _primitive_content(
+            buf, content_offset, content_length, False, exception_class, type_name
+        )
+    chunks = _segments(
+        buf, content_offset, content_length, 4, exception_class, type_name
+    )
+    return b"".join(chunks)
+
+
+def parse_integer_buffer(
+    buf: Buffer,
+    content_offset: int,
+    content_length: int | None,
+    constructed: bool = False,
+) -> int:
+    content = _primitive_content(
+        buf, content_offset, content_length, constructed, IntegerParserError, "Integer"
+    )
+    return integer_value(content)
+
+
+def parse_bitstring_buffer(
+    buf: Buffer,
+    content_offset: int,
+    content_length: int | None,
+    constructed: bool = False,
+) -> BitString:
+    if constructed:
+        chunks = _segments(
+            buf, content_offset, content_length, 3, BitStringParserError, "BitString"
+        )
+        return bitstring_value(join_bitstring_segments(chunks))
+
+    content = _primitive_content(
+        buf, content_offset, content_length, False, BitStringParserError, "BitString"
+    )
+    return bitstring_value(content)
+
+
+def parse_null_buffer(
+    buf: Buffer,
+    content_offset: int,
+    content_length: int | None,
+    constructed: bool = False,
+) -> None:
+    content = _primitive_content(
+        buf, content_offset, content_length, constructed, NullParserError, "Null"
+    )
+    return null_value(content)
+
+
+def parse_octetstring_buffer(
+    buf: Buffer,
+    content_offset: int,
+    content_length: int | None,
+    constructed: bool = False,
+) -> bytes:
+    return bytes(
+        _string_content(
+            buf,
+            content_offset,
+            content_length,
+            constructed,
+            OctetStringParserError,
+            "OctetString",
+        )
+    )
+
+
+def parse_oid_buffer(
+    buf: Buffer,
+    content_offset: int,
+    content_length: int | None,
+    constructed: bool = False,
+) -> str:
+    content = _primitive_content(
+        buf, content_offset, content_length, constructed, OIDParserError, "OID"
+    )
+    if not content:
+        raise OIDParserError("OID declared without content.")
+    return oid_value(content)
+
+
+def parse_relative_oid_buffer(
+    buf: Buffer,
+    content_offset: int,
+    content_length: int | None,
+    constructed: bool = False,
+) -> str:
+    content = _primitive_content(
+        buf,
+        content_offset,
+        content_length,
+        constructed,
+        RelativeOIDParserError,
+        "RELATIVE-OID",
+    )
+    if not content:
+        raise RelativeOIDParserError("RELATIVE-OID declared without content.")
+    return relative_oid_value(content)
+
+
+def parse_numericstring_buffer(
+    buf: Buffer,
+    content_offset: int,
+    content_length: int | None,
+    constructed: bool = False,
+) -> str:
+    content = _string_content(
+        buf,
+        content_offset,
+        content_length,
+        constructed,
+        NumericStringParserError,
+        "NumericString",
+    )
+    return _decode_numeric_bytes(content)
+
+
+def parse_printablestring_buffer(
+    buf: Buffer,
+    content_offset: int,
+    content_length: int | None,
+    constructed: bool = False,
+) -> str:
+    content = _string_content(
+        buf,
+        content_offset,
+        content_length,
+        constructed,
+        PrintableStringParserError,
+        "PrintableString",
+    )
+    return ASN1PrintableString.decode_bytes(content)
+
+
+def parse_teletexstring_buffer(
+    buf: Buffer,
+    content_offset: int,
+    content_length: int | None,
+    constructed: bool = False,
+) -> str:
+    content = _string_content(
+        buf,
+        content_offset,
+        content_length,
+        constructed,
+        TeletexStringParserError,
+        "TeletexString",
+    )
+    return ASN1TeletexString.decode_bytes(content)
+
+
+def parse_ia5string_buffer(
+    buf: Buffer,
+    content_offset: int,
+    content_length: int | None,
+    constructed: bool = False,
+) -> str:
+    content = _string_content(
+        buf,
+        content_offset,
+        content_length,
+        constructed,
+        IA5StringParserError,
+        "IA5String",
+    )
+    return ASN1IA5String.decode_bytes(content)
+
+
+def parse_visiblestring_buffer(
+    buf: Buffer,
+    content_offset: int,
+    content_length: int | None,
+    constructed: bool = False,
+) -> str:
+    content = _string_content(
+        buf,
+        content_offset,
+        content_length,
+        constructed,
+        VisibleStringParserError,
+        "VisibleString",
+    )
+    return ASN1VisibleString.decode_bytes(content)
+
+
+def parse_generalstring_buffer(
+    buf: Buffer,
+    content_offset: int,
+    content_length: int | None,
+    constructed: bool = False,
+) -> bytes:
+    # returned undecoded, as parse_generalstring does
+    return bytes(
+        _string_content(
+            buf,
+            content_offset,
+            content_length,
+            constructed,
+            GeneralStringParserError,
+            "GeneralString",
+        )
+    )
+
+
+def parse_utf8string_buffer(
+    buf: Buffer,
+    content_offset: int,
+    content_length: int | None,
+    constructed: bool = False,
+) -> str:
+    content = _string_content(
+        buf,
+        content_offset,
+        content_length,
+        constructed,
+        UTF8StringParserError,
+        "UTF8String",
+    )
+    return ASN1UTF8String.decode_bytes(content)
+
+
+def parse_universalstring_buffer(
+    buf: Buffer,
+    content_offset: int,
+    content_length: int | None,
+    constructed: bool = False,
+) -> str:
+    content = _string_content(
+        buf,
+        content_offset,
+        content_length,
+        constructed,
+        UniversalStringParserError,
+        "UniversalString",
+    )
+    return ASN1UniversalString.decode_bytes(content)
+
+
+def parse_bmpstring_buffer(
+    buf: Buffer,
+    content_offset: int,
+    content_length: int | None,
+    constructed: bool = False,
+) -> str:
+    content = _string_content(
+        buf,
+        content_offset,
+        content_length,
+        constructed,
+        BMPStringParserError,
+        "BMPString",
+    )
+    return ASN1BMPString.decode_bytes(content)
+
+
+def _utctime_fields(
+    buf: Buffer, content_offset: int, content_length: int | None, constructed: bool
+) -> TimeFields:
+    content = _primitive_content(
+        buf, content_offset, content_length, constructed, UTCTimeParserError, "UTCTime"
+    )
+    if not content:
+        raise UTCTimeParserError("UTCTime declared without content.")
+    return decode_utctime_fields(bytes(content), UTCTimeParserError)
+
+
+def _generalizedtime_fields(
+    buf: Buffer, content_offset: int, content_length: int | None, constructed: bool
+) -> TimeFields:
+    content = _primitive_content(
+        buf,
+        content_offset,
+        content_length,
+        constructed,
+        GeneralizedTimeParserError,
+        "GeneralizedTime",
+    )
+    if not content:
+        raise GeneralizedTimeParserError("GeneralizedTime declared without content.")
+    return decode_generalizedtime_fields(bytes(content), GeneralizedTimeParserError)
+
+
+def parse_utctime_buffer(
+    buf: Buffer,
+    content_offset: int,
+    content_length: int | None,
+    constructed: bool = False,
+    aware: bool = False,
+) -> datetime:
+    fields = _utctime_fields(buf, content_offset, content_length, constructed)
+    return fields_to_datetime(fields, aware=aware)
+
+
+def parse_utctime_epoch_buffer(
+    buf: Buffer,
+    content_offset: int,
+    content_length: int | None,
+    constructed: bool = False,
+    unit: str = "s",
+) -> int:
+    fields = _utctime_fields(buf, content_offset, content_length, constructed)
+    return fields_to_epoch(fields, unit=unit)
+
+
+def parse_generalizedtime_buffer(
+    buf: Buffer,
+    content_offset: int,
+    content_length: int | None,
+    constructed: bool = False,
+    aware: bool = True,
+) -> datetime:
+    fields = _generalizedtime_fields(buf, content_offset, content_length, constructed)
+    return fields_to_datetime(fields, aware=aware)
+
+
+def parse_generalizedtime_epoch_buffer(
+    buf: Buffer,
+    content_offset: int,
+    content_length: int | None,
+    constructed: bool = False,
+    unit: str = "s",
+) -> int:
+    fields = _generalizedtime_fields(buf, content_offset, content_length, constructed)
+    return fields_to_epoch(fields, unit=unit)
+
+
+# universal tag number -> buffer-level parser
+BUFFER_PARSERS: Dict[int, Callable[[Buffer, int, int | None, bool], Any]] = {
+    2: parse_integer_buffer,
+    3: parse_bitstring_buffer,
+    4: parse_octetstring_buffer,
+    5: parse_null_buffer,
+    6: parse_oid_buffer,
+    12: parse_utf8string_buffer,
+    13: parse_relative_oid_buffer,
+    18: parse_numericstring_buffer,
+    19: parse_printablestring_buffer,
+    20: parse_teletexstring_buffer,
+    22: parse_ia5string_buffer,
+    23: parse_utctime_buffer,
+    24: parse_generalizedtime_buffer,
+    26: parse_visiblestring_buffer,
+    27: parse_generalstring_buffer,
+    28: parse_universalstring_buffer,
+    30: parse_bmpstring_buffer,
+}
+
+
+def parse_value_at(
+    buf: Buffer, offset: int, as_type: int | None = None
+) -> Tuple[Any, int]:
+    """
+    Reads the header at `offset` and decodes the value that follows with the
+    buffer-level parser of its universal tag, or of `as_type` for implicitly
+    tagged values.
+
+    Returns:
+        (value, end): end is the offset right after the encoding
+    """
+    tag_class, encoding_type, tag_number, header_length, content_length = (
+        parse_header(buf, offset)
+    )
+    if as_type is None:
+        if tag_class is not TagClass.UNIVERSAL:
+            raise ASN1ParserError(
+                f"no buffer parser for {tag_class.name} tag {tag_number}, use as_type."
+            )
+        as_type = tag_number
+
+    parser = BUFFER_PARSERS.get(as_type)
+    if parser is None:
+        raise ASN1ParserError(f"no buffer parser for universal tag {as_type}.")
+
+    content_offset = offset + header_length
+    constructed = encoding_type is EncodingType.CONSTRUCTED
+    value = parser(buf, content_offset, content_length, constructed)
+
+    if content_length is None:
+        return value, find_encoding_end(buf, offset)
+    return value, content_offset + content_length
@@ -10,6 +10,8 @@ class ASN1GeneralString(ASN1String):
     TAG_NUMBER = 27
     EXCEPTION_CLASS = GeneralStringParserError
 
+    # ISO 2022 sets switched by escape sequences: any octet may appear, so
+    # the alphabet engine is not used and the content is returned as bytes
     def is_valid_char(self, char: str) -> bool:
         if len(char) > 1:
             raise ValueError(f"expected a character but got a string: '{char}'")
@@ -17,6 +19,6 @@ class ASN1GeneralString(ASN1String):
         return True
 
 
-def parse_generalstring(encoding: ASN1Encoding) -> bytes:
-    p = ASN1GeneralString(encoding=encoding)
+def parse_generalstring(encoding: ASN1Encoding, implicit: bool = False) -> bytes:
+    p = ASN1GeneralString(encoding=encoding, implicit=implicit)
     return p._extract_bytes()
@@ -0,0 +1,42 @@
+from datetime import datetime
+from asn1decoder.asn1types import ASN1Encoding
+from asn1decoder.asn1values.asn1time import (
+    ASN1TimeParserError,
+    TimeFields,
+    _time_content,
+    decode_generalizedtime_fields,
+    fields_to_datetime,
+    fields_to_epoch,
+)
+
+
+class GeneralizedTimeParserError(ASN1TimeParserError):
+    pass
+
+
+def parse_generalizedtime_fields(
+    encoding: ASN1Encoding, implicit: bool = False
+) -> TimeFields:
+    data = _time_content(
+        encoding, 24, GeneralizedTimeParserError, "GeneralizedTime", implicit
+    )
+    return decode_generalizedtime_fields(data, GeneralizedTimeParserError)
+
+
+def parse_generalizedtime(
+    encoding: ASN1Encoding, aware: bool = True, implicit: bool = False
+) -> datetime:
+    """
+    Returns:
+        datetime: with a fixed-offset tzinfo when the value carries 'Z' or an
+        offset (and `aware` is set), naive for local times
+    """
+    return fields_to_datetime(
+        parse_generalizedtime_fields(encoding, implicit), aware=aware
+    )
+
+
+def parse_generalizedtime_epoch(
+    encoding: ASN1Encoding, unit: str = "s", implicit: bool = False
+) -> int:
+    return fields_to_epoch(parse_generalizedtime_fields(encoding, implicit), unit=unit)
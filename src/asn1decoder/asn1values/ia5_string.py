@@ -1,5 +1,6 @@
 from asn1decoder.asn1types import ASN1Encoding
 from asn1decoder.asn1values.asn1string import ASN1String, ASN1StringParserError
+from asn1decoder.asn1values.intern_pool import InternPool
 
 
 class IA5StringParserError(ASN1StringParserError):
@@ -9,14 +10,13 @@ class IA5StringParserError(ASN1StringParserError):
 class ASN1IA5String(ASN1String):
     TAG_NUMBER = 22
     EXCEPTION_CLASS = IA5StringParserError
+    ALPHABET = None  # any 7-bit ASCII character
 
-    def is_valid_char(self, char: str) -> bool:
-        if len(char) > 1:
-            raise ValueError(f"expected a character but got a string: '{char}'")
 
-        return ord(char) <= 0x7F
-
-
-def parse_ia5string(encoding: ASN1Encoding) -> str:
-    p = ASN1IA5String(encoding=encoding)
+def parse_ia5string(
+    encoding: ASN1Encoding, implicit: bool = False, pool: InternPool | None = None
+) -> str:
+    p = ASN1IA5String(encoding=encoding, implicit=implicit)
+    if pool is not None:
+        return p.parse_interned(pool)
     return p.parse()
@@ -1,16 +1,24 @@
+import sys
+from array import array
+from typing import Iterable, List
 from asn1decoder.asn1types import ASN1Encoding, EncodingType
 from asn1decoder.asn1parser import ASN1ParserError
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class IntegerParserError(ASN1ParserError):
     pass
 
 
-def parse_integer(encoding: ASN1Encoding) -> int:
+def _integer_content(encoding: ASN1Encoding, implicit: bool = False) -> memoryview:
     if encoding.encoding_type is EncodingType.CONSTRUCTED:
         raise IntegerParserError("Integer shall be primitive.")
 
-    if encoding.tag_number != 2:
+    if not implicit and encoding.tag_number != 2:
         raise IntegerParserError(
             f"Integer can be initialized only with encoding having tag number = 2. Got {encoding.tag_number}."
         )
@@ -18,20 +26,157 @@ def parse_integer(encoding: ASN1Encoding) -> int:
     if encoding.content_length in (None, 0):
         raise IntegerParserError("Integer declared without content.")
 
-    if encoding.content is None:
+    if encoding.content_component is None or not isinstance(
+        encoding.content_component.content, memoryview
+    ):
         raise IntegerParserError("Integer declared without content.")
 
-    if encoding.content_length != len(encoding.content):
+    content = encoding.content_component.content
+    if encoding.content_length != len(content):
         raise IntegerParserError(
-            f"Integer length mismatch. Declared {encoding.content_length} found {len(encoding.content)}."
+            f"Integer length mismatch. Declared {encoding.content_length} found {len(content)}."
         )
 
-    if encoding.content_length > 1:
-        if (encoding.content[0] << 1 | (encoding.content[1] >> 7)) in (
+    return content
+
+
+def _check_minimal(content: memoryview) -> None:
+    if len(content) > 1:
+        if (content[0] << 1 | (content[1] >> 7)) in (
             0,
             0b1_1111_1111,
         ):
             raise IntegerParserError("Integer not minimally encoded.")
 
-    value = int.from_bytes(encoding.content, byteorder="big", signed=True)
+
+def parse_integer(encoding: ASN1Encoding, implicit: bool = False) -> int:
+    content = _integer_content(encoding, implicit)
+    _check_minimal(content)
+    value = int.from_bytes(content, byteorder="big", signed=True)
     return value
+
+
+class LazyInteger:
+    """
+    An INTEGER whose content is kept as a view over the source buffer and
+    converted to `int` only the first time the value is needed.
+    """
+
+    __slots__ = ("content", "_value")
+
+    def __init__(self, content: memoryview) -> None:
+        self.content = content
+        self._value: int | None = None
+
+    @property
+    def value(self) -> int:
+        if self._value is None:
+            self._value = int.from_bytes(self.content, byteorder="big", signed=True)
+        return self._value
+
+    @property
+    def byte_length(self) -> int:
+        return len(self.content)
+
+    def tobytes(self) -> bytes:
+        """The two's complement content octets, as encoded."""
+        return self.content.tobytes()
+
+    def __int__(self) -> int:
+        return self.value
+
+    def __index__(self) -> int:
+        return self.value
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyInteger):
+            return self.content == other.content
+        if isinstance(other, int):
+            return self.value == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
+    def __repr__(self) -> str:
+        if self._value is None:
+            return f"LazyInteger(<{len(self.content)} bytes>)"
+        return f"LazyInteger({self._value})"
+
+
+def parse_integer_lazy(encoding: ASN1Encoding, implicit: bool = False) -> LazyInteger:
+    content = _integer_content(encoding, implicit)
+    _check_minimal(content)
+    return LazyInteger(content)
+
+
+def parse_integers(
+    encodings: Iterable[ASN1Encoding], use_numpy: bool | None = None
+) -> "array | numpy.ndarray | List[int]":
+    """
+    Decodes many INTEGER encodings at once.
+
+    Values are sign-extended to 8 bytes and converted with a single buffer
+    copy into an array('q'), or a NumPy int64 array when `use_numpy` is set
+    (None means "if available"). Minimal encoding is checked on the decoded
+    array as a whole. If a value does not fit 64 bits a list of Python ints
+    is returned instead.
+    """
+    if use_numpy is None:
+        use_numpy = numpy is not None
+    elif use_numpy and numpy is None:
+        raise ImportError("numpy is required when use_numpy=True")
+
+    contents = []
+    append = contents.append
+    for encoding in encodings:
+        identifier = encoding.identifier_component
+        content_component = encoding.content_component
+        if (
+            identifier.tag_number == 2
+            and identifier.encoding_type is EncodingType.PRIMITIVE
+            and content_component is not None
+        ):
+            append(content_component.content)
+        else:
+            # slow path, raises the appropriate error
+            append(_integer_content(encoding))
+
+    if any(len(content) > 8 for content in contents):
+        values = []
+        for content in contents:
+            _check_minimal(content)
+            values.append(int.from_bytes(content, byteorder="big", signed=True))
+        return values
+
+    lengths = [len(content) for content in contents]
+    buffer = b"".join(
+        [
+            (b"\xff" if content[0] & 0x80 else b"\x00") * (8 - size) + content
+            for content, size in zip(contents, lengths)
+        ]
+    )
+
+    if use_numpy:
+        result = numpy.frombuffer(buffer, dtype=">i8").astype(numpy.int64)
+        sizes = numpy.array(lengths, dtype=numpy.int64)
+        # a value encoded on n > 1 octets must not fit in n - 1 octets
+        bounds = numpy.left_shift(1, numpy.maximum(sizes * 8 - 9, 0))
+        non_minimal = (sizes > 1) & (result >= -bounds) & (result < bounds)
+        if non_minimal.any():
+            index = int(numpy.argmax(non_minimal))
+            raise IntegerParserError(f"Integer not minimally encoded at index {index}.")
+        return result
+
+    result = array("q")
+    result.frombytes(buffer)
+    if sys.byteorder == "little":
+        result.byteswap()
+
+    # a value encoded on n > 1 octets must not fit in n - 1 octets
+    bounds = [0, 0, *(1 << (size * 8 - 9) for size in range(2, 9))]
+    for index, (value, size) in enumerate(zip(result, lengths)):
+        if -bounds[size] <= value < bounds[size]:
+            raise IntegerParserError(f"Integer not minimally encoded at index {index}.")
+
+    return result
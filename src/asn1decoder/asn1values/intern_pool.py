@@ -0,0 +1,75 @@
+from collections import OrderedDict
+from typing import Any, Callable, NamedTuple, Tuple
+
+
+class InternPoolInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class InternPool:
+    """
+    Bounded LRU pool of decoded values keyed by universal tag and raw
+    content octets, shared across documents.
+
+    A value seen before is returned as the very same object without decoding
+    the content again, so repeated values (country codes, organization
+    names, algorithm OIDs) are stored once and compare by identity. Like
+    `OIDDecoderCache`, lookups accept read-only memoryviews over the source
+    buffer and only a miss copies the content.
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be positive. Got {maxsize}.")
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Tuple[int, bytes], Any] = OrderedDict()
+
+    def lookup(
+        self,
+        tag_number: int,
+        content: bytes | memoryview,
+        decode: Callable[[bytes | memoryview], Any],
+    ) -> Any:
+        """
+        Returns the pooled value of `content`, decoding it with `decode` and
+        adding it to the pool on a miss. Decoding errors are not pooled.
+        """
+        if isinstance(content, memoryview) and not content.readonly:
+            # writable views are not hashable
+            content = content.tobytes()
+
+        key = (tag_number, content)
+        entries = self._entries
+        value = entries.get(key, entries)
+        if value is not entries:
+            self.hits += 1
+            entries.move_to_end(key)
+            return value
+
+        self.misses += 1
+        value = decode(content)
+
+        entries[(tag_number, bytes(content))] = value
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+
+        return value
+
+    def cache_info(self) -> InternPoolInfo:
+        return InternPoolInfo(
+            hits=self.hits,
+            misses=self.misses,
+            maxsize=self.maxsize,
+            currsize=len(self._entries),
+        )
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
@@ -6,11 +6,11 @@ class NullParserError(ASN1ParserError):
     pass
 
 
-def parse_null(encoding: ASN1Encoding) -> None:
+def parse_null(encoding: ASN1Encoding, implicit: bool = False) -> None:
     if encoding.encoding_type is EncodingType.CONSTRUCTED:
         raise NullParserError("Null shall be primitive.")
 
-    if encoding.tag_number != 5:
+    if not implicit and encoding.tag_number != 5:
         raise NullParserError(
             f"Null can be initialized only with encoding having tag number = 5. Got {encoding.tag_number}."
         )
@@ -1,19 +1,38 @@
 import string
-from typing import List
 from asn1decoder.asn1types import ASN1Encoding, EncodingType
 from asn1decoder.asn1parser import ASN1ParserError, decode_byte
 from asn1decoder.asn1values.octet_string import parse_octetstring
+from asn1decoder.asn1values.asn1string import compile_alphabet, find_invalid_byte
 
 
 class NumericStringParserError(ASN1ParserError):
     pass
 
 
+NUMERIC_ALPHABET = compile_alphabet(string.digits + " ")
+
+
 def is_valid_char(char: str) -> bool:
     if len(char) > 1:
         raise ValueError(f"expected a character but got a string: '{char}'")
 
-    return char in string.digits + " "
+    return find_invalid_byte(char.encode("latin-1"), NUMERIC_ALPHABET) == -1
+
+
+def _decode_numeric_bytes(data: bytes | memoryview) -> str:
+    if type(data) is not bytes:
+        data = bytes(data)
+
+    index = find_invalid_byte(data, NUMERIC_ALPHABET)
+    if index == -1:
+        return data.decode("ascii")
+
+    try:
+        char = decode_byte(data[index])
+    except ValueError as e:
+        raise NumericStringParserError(str(e))
+
+    raise NumericStringParserError(f"char '{char}' is not valid for a NumericString")
 
 
 def parse_primitive_numericstring(encoding: ASN1Encoding) -> str:
@@ -26,42 +45,22 @@ def parse_primitive_numericstring(encoding: ASN1Encoding) -> str:
     if encoding.content is None:
         return ""
 
-    chars = []
-    for byte in encoding.content:
-        try:
-            char = decode_byte(byte)
-        except ValueError as e:
-            raise NumericStringParserError(str(e))
-
-        if not is_valid_char(char):
-            raise NumericStringParserError(
-                f"char '{char}' is not valid for a NumericString"
-            )
-
-        chars.append(char)
-
-    return "".join(chars)
+    return _decode_numeric_bytes(encoding.content)
 
 
 def parse_constructed_numericstring(encoding: ASN1Encoding) -> str:
     if encoding.inner_encodings is None:
         raise NumericStringParserError("NumericString with invalid octets string")
 
-    chars: List[str] = []
-
+    chunks = []
     for inner_encoding in encoding.inner_encodings:
-        data = parse_octetstring(inner_encoding)
-
-        try:
-            chars.extend([decode_byte(byte) for byte in data])
-        except ValueError as e:
-            raise NumericStringParserError(str(e))
+        chunks.append(parse_octetstring(inner_encoding))
 
-    return "".join(chars)
+    return _decode_numeric_bytes(b"".join(chunks))
 
 
-def parse_numericstring(encoding: ASN1Encoding) -> str:
-    if encoding.tag_number != 18:
+def parse_numericstring(encoding: ASN1Encoding, implicit: bool = False) -> str:
+    if not implicit and encoding.tag_number != 18:
         raise NumericStringParserError(
             f"NumericString can be initialized only with encoding having tag number = 18. Got {encoding.tag_number}."
         )
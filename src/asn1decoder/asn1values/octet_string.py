@@ -29,8 +29,8 @@ def parse_constructed_octetstring(encoding: ASN1Encoding) -> bytes:
     return b"".join(data)
 
 
-def parse_octetstring(encoding: ASN1Encoding) -> bytes:
-    if encoding.tag_number != 4:
+def parse_octetstring(encoding: ASN1Encoding, implicit: bool = False) -> bytes:
+    if not implicit and encoding.tag_number != 4:
         raise OctetStringParserError(
             f"OctetString can be initialized only with encoding having tag number = 4. Got {encoding.tag_number}."
         )
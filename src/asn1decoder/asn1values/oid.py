@@ -1,79 +1,330 @@
-from typing import List
+from collections import OrderedDict
+from typing import List, NamedTuple, Sequence, Tuple, Type
 from asn1decoder.asn1types import ASN1Encoding, EncodingType
 from asn1decoder.asn1parser import ASN1ParserError
+from asn1decoder.asn1values.oid_registry import lookup_oid_name
+from asn1decoder.asn1values.intern_pool import InternPool
 
 
 class OIDParserError(ASN1ParserError):
     pass
 
 
-def parse_oid_subidentifier(data: List[bytes]) -> int:
-    if len(data) > 1 and (int(data[0]) & 0x7F) == 0:
+class RelativeOIDParserError(OIDParserError):
+    pass
+
+
+def _decode_subidentifiers(
+    content: bytes | memoryview,
+    exception_class: Type[OIDParserError],
+    type_name: str,
+    split_first: bool = False,
+) -> Tuple[int, ...]:
+    """
+    Decodes the subidentifiers of an OID or RELATIVE-OID in a single pass,
+    checking minimal encoding and the final continuation bit on the way.
+    With `split_first` the first subidentifier is split into the first two
+    arcs of an OID, X*40+Y.
+    """
+    if not content:
+        raise exception_class(f"{type_name} declared without content.")
+
+    arcs: List[int] = []
+    append = arcs.append
+    value = 0
+    for byte in content:
+        # 8.19.2 the leading octet of a subidentifier shall not be 0x80
+        if value == 0 and byte == 0x80:
+            raise exception_class(
+                f"{type_name} subidentifier not minimally encoded."
+            )
+
+        value = (value << 7) | (byte & 0x7F)
+        if byte < 0x80:
+            if split_first and not arcs:
+                if value < 80:
+                    append(value // 40)
+                    append(value % 40)
+                else:
+                    append(2)
+                    append(value - 80)
+            else:
+                append(value)
+            value = 0
+
+    if content[-1] >= 0x80:
+        raise exception_class(f"{type_name} with continuation bit set on last byte")
+
+    return tuple(arcs)
+
+
+def decode_oid_arcs(content: bytes | memoryview) -> Tuple[int, ...]:
+    """
+    Decodes the content octets of an OID into its arcs.
+
+    Returns:
+        Tuple[int, ...]: the object identifier components
+    """
+    return _decode_subidentifiers(content, OIDParserError, "OID", split_first=True)
+
+
+def decode_relative_oid_arcs(content: bytes | memoryview) -> Tuple[int, ...]:
+    """
+    Decodes the content octets of a RELATIVE-OID into its arcs.
+
+    Returns:
+        Tuple[int, ...]: the relative object identifier components
+    """
+    return _decode_subidentifiers(content, RelativeOIDParserError, "RELATIVE-OID")
+
+
+def parse_oid_subidentifier(data: List[int]) -> int:
+    """
+    Value of the octets of one subidentifier, as split by
+    `extract_oid_subidentifiers`. `decode_oid_arcs` decodes whole contents.
+    """
+    if len(data) > 1 and (data[0] & 0x7F) == 0:
         raise OIDParserError("OID subidentifier not minimally encoded.")
 
     value = 0
     for byte in data:
-        value = (value << 7) | (int(byte) & 0x7F)
+        value = (value << 7) | (byte & 0x7F)
     return value
 
 
-def extract_oid_subidentifiers(data: bytes) -> List[List[bytes]]:
+def extract_oid_subidentifiers(data: bytes | memoryview) -> List[List[int]]:
+    """
+    Splits OID content octets into the octets of each subidentifier.
+    """
     subidentifiers = []
-
-    subidentifier = []
+    subidentifier: List[int] = []
     for byte in data:
         subidentifier.append(byte)
-        if byte & 0b1000_0000 == 0:
+        if byte < 0x80:
             subidentifiers.append(subidentifier)
             subidentifier = []
 
     return subidentifiers
 
 
-def parse_oid(encoding: ASN1Encoding) -> str:
-    numbers = []
+def encode_oid_subidentifier(value: int) -> bytes:
+    if value < 0:
+        raise ValueError(f"OID subidentifier cannot be negative. Got {value}.")
+
+    octets = [value & 0x7F]
+    value >>= 7
+    while value:
+        octets.append(0x80 | (value & 0x7F))
+        value >>= 7
+
+    return bytes(reversed(octets))
+
+
+def encode_oid(oid: str | Sequence[int]) -> bytes:
+    """
+    Encodes a dotted string or a sequence of arcs into OID content octets,
+    merging the first two arcs into X*40+Y.
+
+    Returns:
+        bytes: the content octets, without identifier and length
+    """
+    arcs = [int(arc) for arc in oid.split(".")] if isinstance(oid, str) else oid
+
+    if len(arcs) < 2:
+        raise ValueError(f"OID needs at least two arcs. Got {len(arcs)}.")
+
+    X, Y = arcs[0], arcs[1]
+    if X not in (0, 1, 2):
+        raise ValueError(f"OID first arc must be 0, 1 or 2. Got {X}.")
+
+    if X < 2 and not 0 <= Y < 40:
+        raise ValueError(
+            f"OID second arc must be lower than 40 under arc {X}. Got {Y}."
+        )
+
+    return b"".join(
+        encode_oid_subidentifier(value) for value in (X * 40 + Y, *arcs[2:])
+    )
+
+
+class DecodedOID:
+    """
+    A decoded OID. The dotted string is only built the first time it is
+    requested.
+    """
+
+    __slots__ = ("arcs", "_dotted")
+
+    def __init__(self, arcs: Tuple[int, ...]) -> None:
+        self.arcs = arcs
+        self._dotted: str | None = None
+
+    def __repr__(self) -> str:
+        return f"DecodedOID({self.dotted!r})"
 
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DecodedOID):
+            return NotImplemented
+        return self.arcs == other.arcs
+
+    def __hash__(self) -> int:
+        return hash(self.arcs)
+
+    @property
+    def dotted(self) -> str:
+        if self._dotted is None:
+            self._dotted = ".".join([str(n) for n in self.arcs])
+        return self._dotted
+
+    @property
+    def name(self) -> str | None:
+        """The name registered in `oid_registry` for this OID, if any."""
+        return lookup_oid_name(self.dotted)
+
+
+class OIDCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class OIDDecoderCache:
+    """
+    Bounded LRU cache of decoded OIDs keyed by their raw content octets.
+
+    Lookups accept read-only memoryviews over the source buffer, so a hit
+    does not copy the content.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be positive. Got {maxsize}.")
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[bytes, DecodedOID] = OrderedDict()
+
+    def decode(self, content: bytes | memoryview) -> DecodedOID:
+        if isinstance(content, memoryview) and not content.readonly:
+            # writable views are not hashable
+            content = content.tobytes()
+
+        entry = self._entries.get(content)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(content)
+            return entry
+
+        self.misses += 1
+        entry = DecodedOID(decode_oid_arcs(content))
+
+        self._entries[bytes(content)] = entry
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+        return entry
+
+    def cache_info(self) -> OIDCacheInfo:
+        return OIDCacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            maxsize=self.maxsize,
+            currsize=len(self._entries),
+        )
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+default_oid_cache = OIDDecoderCache()
+
+
+def _oid_content(
+    encoding: ASN1Encoding,
+    tag_number: int = 6,
+    exception_class: Type[OIDParserError] = OIDParserError,
+    type_name: str = "OID",
+    implicit: bool = False,
+) -> memoryview:
     if encoding.encoding_type is EncodingType.CONSTRUCTED:
-        raise OIDParserError("OID shall be primitive.")
+        raise exception_class(f"{type_name} shall be primitive.")
 
-    if encoding.tag_number != 6:
-        raise OIDParserError(
-            f"OID can be initialize only with encoding having tag number = 6. Got {encoding.tag_number}."
+    if not implicit and encoding.tag_number != tag_number:
+        raise exception_class(
+            f"{type_name} can be initialize only with encoding having tag number = {tag_number}. Got {encoding.tag_number}."
         )
 
     if encoding.content_length in (None, 0):
-        raise OIDParserError("OID declared without content.")
+        raise exception_class(f"{type_name} declared without content.")
 
-    if encoding.content is None:
-        raise OIDParserError("OID declared without content.")
+    if encoding.content_component is None or not isinstance(
+        encoding.content_component.content, memoryview
+    ):
+        raise exception_class(f"{type_name} declared without content.")
 
-    if encoding.content_length != len(encoding.content):
-        raise OIDParserError(
-            f"OID length mismatch. Declared {encoding.content_length} found {len(encoding.content)}."
+    content = encoding.content_component.content
+    if encoding.content_length != len(content):
+        raise exception_class(
+            f"{type_name} length mismatch. Declared {encoding.content_length} found {len(content)}."
         )
 
-    last_byte = encoding.content[-1]
-    if last_byte & 0b1000_0000 == 0b1000_0000:
-        raise OIDParserError("OID with continuation bit set on last byte")
+    return content
+
+
+def decode_oid(
+    encoding: ASN1Encoding,
+    cache: OIDDecoderCache | None = None,
+    implicit: bool = False,
+) -> DecodedOID:
+    """
+    Decodes an OID through `cache` (the module-wide `default_oid_cache` if
+    omitted).
+
+    Returns:
+        DecodedOID: the dotted string, the arcs and the registered name
+    """
+    if cache is None:
+        cache = default_oid_cache
+
+    return cache.decode(_oid_content(encoding, implicit=implicit))
+
+
+def _dotted(content: bytes | memoryview) -> str:
+    return default_oid_cache.decode(content).dotted
+
+
+def parse_oid(
+    encoding: ASN1Encoding, implicit: bool = False, pool: InternPool | None = None
+) -> str:
+    if pool is not None:
+        return pool.lookup(6, _oid_content(encoding, implicit=implicit), _dotted)
+    return decode_oid(encoding, implicit=implicit).dotted
+
 
-    subidentifiers = extract_oid_subidentifiers(encoding.content)
-    first_subidentifier = subidentifiers[0]
-    first_value = parse_oid_subidentifier(first_subidentifier)
+def parse_oid_arcs(encoding: ASN1Encoding, implicit: bool = False) -> Tuple[int, ...]:
+    """
+    Like `parse_oid`, but returns the arcs without ever building the dotted
+    string.
+    """
+    return decode_oid(encoding, implicit=implicit).arcs
 
-    if first_value < 40:
-        X = 0
-        Y = first_value
-    elif first_value < 80:
-        X = 1
-        Y = first_value - 40
-    else:
-        X = 2
-        Y = first_value - 80
 
-    numbers.extend((X, Y))
+def parse_relative_oid_arcs(
+    encoding: ASN1Encoding, implicit: bool = False
+) -> Tuple[int, ...]:
+    content = _oid_content(
+        encoding,
+        tag_number=13,
+        exception_class=RelativeOIDParserError,
+        type_name="RELATIVE-OID",
+        implicit=implicit,
+    )
+    return decode_relative_oid_arcs(content)
 
-    for subidentifier in subidentifiers[1:]:
-        value = parse_oid_subidentifier(subidentifier)
-        numbers.append(value)
 
-    return ".".join([str(n) for n in numbers])
+def parse_relative_oid(encoding: ASN1Encoding, implicit: bool = False) -> str:
+    return ".".join([str(n) for n in parse_relative_oid_arcs(encoding, implicit)])
@@ -0,0 +1,122 @@
+from typing import Dict, Mapping, Sequence
+from asn1decoder.asn1types import ASN1Encoding, EncodingType
+from asn1decoder.asn1values.oid import encode_oid
+
+
+class _TrieNode:
+    __slots__ = ("children", "exact_label", "prefix_label")
+
+    def __init__(self) -> None:
+        self.children: Dict[int, _TrieNode] = {}
+        self.exact_label: str | None = None
+        self.prefix_label: str | None = None
+
+
+def _to_arcs(oid: str | Sequence[int]) -> Sequence[int]:
+    if isinstance(oid, str):
+        return [int(arc) for arc in oid.split(".")]
+    return oid
+
+
+class OIDMatcher:
+    """
+    Classifies OIDs directly on their encoded content octets.
+
+    OIDs and arc prefixes are compiled to their BER form and stored in a byte
+    trie, so matching walks the raw content once without decoding it. Since
+    the last octet of every subidentifier has bit 8 clear, a byte-level
+    prefix always ends on an arc boundary.
+
+    A prefix made of the root arc alone (e.g. "2") cannot be expressed in
+    bytes because the first subidentifier merges X*40+Y; such prefixes are
+    resolved by decoding the first subidentifier only.
+    """
+
+    def __init__(
+        self,
+        oids: Mapping[str, str] | None = None,
+        prefixes: Mapping[str, str] | None = None,
+    ) -> None:
+        self._root = _TrieNode()
+        self._root_arc_labels: Dict[int, str] = {}
+
+        for oid, label in (oids or {}).items():
+            self.add_oid(oid, label)
+
+        for prefix, label in (prefixes or {}).items():
+            self.add_prefix(prefix, label)
+
+    def _insert(self, encoded: bytes) -> _TrieNode:
+        node = self._root
+        for byte in encoded:
+            child = node.children.get(byte)
+            if child is None:
+                child = node.children[byte] = _TrieNode()
+            node = child
+        return node
+
+    def add_oid(self, oid: str | Sequence[int], label: str) -> None:
+        """Matches `oid` exactly."""
+        self._insert(encode_oid(oid)).exact_label = label
+
+    def add_prefix(self, prefix: str | Sequence[int], label: str) -> None:
+        """Matches every OID below `prefix`, and `prefix` itself."""
+        arcs = _to_arcs(prefix)
+        if len(arcs) == 1:
+            if arcs[0] not in (0, 1, 2):
+                raise ValueError(f"OID first arc must be 0, 1 or 2. Got {arcs[0]}.")
+            self._root_arc_labels[arcs[0]] = label
+            return
+
+        node = self._insert(encode_oid(arcs))
+        node.prefix_label = label
+
+    def _match_root_arc(self, content: bytes | memoryview) -> str | None:
+        first_value = 0
+        for byte in content:
+            first_value = (first_value << 7) | (byte & 0x7F)
+            if byte & 0x80 == 0:
+                break
+        else:
+            return None
+
+        return self._root_arc_labels.get(min(first_value // 40, 2))
+
+    def match(self, content: bytes | memoryview) -> str | None:
+        """
+        Matches the content octets of an OID (without identifier and length).
+
+        Returns:
+            str | None: the label of the exact match if any, otherwise the
+            label of the longest matching prefix, otherwise None
+        """
+        node = self._root
+        label = None
+        for byte in content:
+            node = node.children.get(byte)
+            if node is None:
+                break
+            if node.prefix_label is not None:
+                label = node.prefix_label
+        else:
+            if node.exact_label is not None:
+                return node.exact_label
+
+        if label is None and self._root_arc_labels:
+            return self._match_root_arc(content)
+
+        return label
+
+    def match_encoding(self, encoding: ASN1Encoding) -> str | None:
+        """
+        Like `match`, but reads the content of a primitive OBJECT IDENTIFIER
+        encoding straight from the source buffer.
+        """
+        if (
+            encoding.encoding_type is not EncodingType.PRIMITIVE
+            or encoding.tag_number != 6
+            or encoding.content_component is None
+        ):
+            return None
+
+        return self.match(encoding.content_component.content)
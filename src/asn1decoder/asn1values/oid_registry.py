@@ -0,0 +1,92 @@
+from typing import Dict
+
+# Names follow the ones printed by `openssl asn1parse`.
+OID_NAMES: Dict[str, str] = {
+    # PKCS #1
+    "1.2.840.113549.1.1.1": "rsaEncryption",
+    "1.2.840.113549.1.1.4": "md5WithRSAEncryption",
+    "1.2.840.113549.1.1.5": "sha1WithRSAEncryption",
+    "1.2.840.113549.1.1.7": "rsaesOaep",
+    "1.2.840.113549.1.1.8": "mgf1",
+    "1.2.840.113549.1.1.10": "rsassaPss",
+    "1.2.840.113549.1.1.11": "sha256WithRSAEncryption",
+    "1.2.840.113549.1.1.12": "sha384WithRSAEncryption",
+    "1.2.840.113549.1.1.13": "sha512WithRSAEncryption",
+    "1.2.840.113549.1.1.14": "sha224WithRSAEncryption",
+    # PKCS #7 / CMS content types
+    "1.2.840.113549.1.7.1": "pkcs7-data",
+    "1.2.840.113549.1.7.2": "pkcs7-signedData",
+    "1.2.840.113549.1.7.3": "pkcs7-envelopedData",
+    "1.2.840.113549.1.7.4": "pkcs7-signedAndEnvelopedData",
+    "1.2.840.113549.1.7.5": "pkcs7-digestData",
+    "1.2.840.113549.1.7.6": "pkcs7-encryptedData",
+    "1.2.840.113549.1.9.16.1.4": "id-smime-ct-TSTInfo",
+    # PKCS #9 attributes
+    "1.2.840.113549.1.9.1": "emailAddress",
+    "1.2.840.113549.1.9.3": "contentType",
+    "1.2.840.113549.1.9.4": "messageDigest",
+    "1.2.840.113549.1.9.5": "signingTime",
+    "1.2.840.113549.1.9.6": "countersignature",
+    "1.2.840.113549.1.9.15": "S/MIME Capabilities",
+    "1.2.840.113549.1.9.16.2.12": "id-smime-aa-signingCertificate",
+    "1.2.840.113549.1.9.16.2.47": "id-smime-aa-signingCertificateV2",
+    # digest algorithms
+    "1.2.840.113549.2.5": "md5",
+    "1.3.14.3.2.26": "sha1",
+    "2.16.840.1.101.3.4.2.1": "sha256",
+    "2.16.840.1.101.3.4.2.2": "sha384",
+    "2.16.840.1.101.3.4.2.3": "sha512",
+    "2.16.840.1.101.3.4.2.4": "sha224",
+    # symmetric ciphers
+    "2.16.840.1.101.3.4.1.2": "aes-128-cbc",
+    "2.16.840.1.101.3.4.1.22": "aes-192-cbc",
+    "2.16.840.1.101.3.4.1.42": "aes-256-cbc",
+    # elliptic curves
+    "1.2.840.10045.2.1": "id-ecPublicKey",
+    "1.2.840.10045.3.1.7": "prime256v1",
+    "1.2.840.10045.4.3.2": "ecdsa-with-SHA256",
+    "1.2.840.10045.4.3.3": "ecdsa-with-SHA384",
+    "1.2.840.10045.4.3.4": "ecdsa-with-SHA512",
+    "1.3.132.0.34": "secp384r1",
+    "1.3.132.0.35": "secp521r1",
+    # X.520 attribute types
+    "2.5.4.3": "commonName",
+    "2.5.4.4": "surname",
+    "2.5.4.5": "serialNumber",
+    "2.5.4.6": "countryName",
+    "2.5.4.7": "localityName",
+    "2.5.4.8": "stateOrProvinceName",
+    "2.5.4.9": "streetAddress",
+    "2.5.4.10": "organizationName",
+    "2.5.4.11": "organizationalUnitName",
+    "2.5.4.12": "title",
+    "2.5.4.42": "givenName",
+    "2.5.4.97": "organizationIdentifier",
+    # X.509v3 certificate extensions
+    "2.5.29.14": "X509v3 Subject Key Identifier",
+    "2.5.29.15": "X509v3 Key Usage",
+    "2.5.29.17": "X509v3 Subject Alternative Name",
+    "2.5.29.19": "X509v3 Basic Constraints",
+    "2.5.29.31": "X509v3 CRL Distribution Points",
+    "2.5.29.32": "X509v3 Certificate Policies",
+    "2.5.29.35": "X509v3 Authority Key Identifier",
+    "2.5.29.37": "X509v3 Extended Key Usage",
+    # PKIX
+    "1.3.6.1.5.5.7.1.1": "Authority Information Access",
+    "1.3.6.1.5.5.7.3.1": "TLS Web Server Authentication",
+    "1.3.6.1.5.5.7.3.2": "TLS Web Client Authentication",
+    "1.3.6.1.5.5.7.3.8": "Time Stamping",
+    "1.3.6.1.5.5.7.48.1": "OCSP",
+    "1.3.6.1.5.5.7.48.2": "CA Issuers",
+}
+
+
+def register_oid_name(oid: str, name: str) -> None:
+    """
+    Registers (or overrides) the name printed for the dotted `oid`.
+    """
+    OID_NAMES[oid] = name
+
+
+def lookup_oid_name(oid: str) -> str | None:
+    return OID_NAMES.get(oid)
@@ -1,6 +1,11 @@
 import string
 from asn1decoder.asn1types import ASN1Encoding
-from asn1decoder.asn1values.asn1string import ASN1String, ASN1StringParserError
+from asn1decoder.asn1values.asn1string import (
+    ASN1String,
+    ASN1StringParserError,
+    compile_alphabet,
+)
+from asn1decoder.asn1values.intern_pool import InternPool
 
 
 class PrintableStringParserError(ASN1StringParserError):
@@ -10,14 +15,13 @@ class PrintableStringParserError(ASN1StringParserError):
 class ASN1PrintableString(ASN1String):
     TAG_NUMBER = 19
     EXCEPTION_CLASS = PrintableStringParserError
+    ALPHABET = compile_alphabet(string.digits + string.ascii_letters + " '()+,-./:=?")
 
-    def is_valid_char(self, char: str) -> bool:
-        if len(char) > 1:
-            raise ValueError(f"expected a character but got a string: '{char}'")
 
-        return char in (string.digits + string.ascii_letters + " '()+,-./:=?")
-
-
-def parse_printablestring(encoding: ASN1Encoding) -> str:
-    p = ASN1PrintableString(encoding=encoding)
+def parse_printablestring(
+    encoding: ASN1Encoding, implicit: bool = False, pool: InternPool | None = None
+) -> str:
+    p = ASN1PrintableString(encoding=encoding, implicit=implicit)
+    if pool is not None:
+        return p.parse_interned(pool)
     return p.parse()
@@ -0,0 +1,332 @@
+from datetime import datetime
+from typing import Any, Callable, Dict, Mapping, Tuple
+from asn1decoder.asn1types import ASN1Encoding, EncodingType, TagClass
+from asn1decoder.asn1parser import ASN1ParserError
+from asn1decoder.asn1values.integer import (
+    IntegerParserError,
+    _check_minimal,
+    parse_integer,
+)
+from asn1decoder.asn1values.bit_string import bitstring_value, parse_bitstring
+from asn1decoder.asn1values.null import NullParserError, parse_null
+from asn1decoder.asn1values.octet_string import parse_octetstring
+from asn1decoder.asn1values.oid import (
+    decode_relative_oid_arcs,
+    default_oid_cache,
+    parse_oid,
+    parse_relative_oid,
+)
+from asn1decoder.asn1values.numeric_string import (
+    _decode_numeric_bytes,
+    parse_numericstring,
+)
+from asn1decoder.asn1values.printable_string import (
+    ASN1PrintableString,
+    parse_printablestring,
+)
+from asn1decoder.asn1values.teletex_string import (
+    ASN1TeletexString,
+    parse_teletexstring,
+)
+from asn1decoder.asn1values.ia5_string import ASN1IA5String, parse_ia5string
+from asn1decoder.asn1values.visible_string import (
+    ASN1VisibleString,
+    parse_visiblestring,
+)
+from asn1decoder.asn1values.general_string import parse_generalstring
+from asn1decoder.asn1values.utf8_string import ASN1UTF8String, parse_utf8string
+from asn1decoder.asn1values.universal_string import (
+    ASN1UniversalString,
+    parse_universalstring,
+)
+from asn1decoder.asn1values.bmp_string import ASN1BMPString, parse_bmpstring
+from asn1decoder.asn1values.asn1time import (
+    decode_generalizedtime_fields,
+    decode_utctime_fields,
+    fields_to_datetime,
+)
+from asn1decoder.asn1values.utctime import UTCTimeParserError, parse_utctime
+from asn1decoder.asn1values.generalized_time import (
+    GeneralizedTimeParserError,
+    parse_generalizedtime,
+)
+
+
+class ValueDecoderError(ASN1ParserError):
+    pass
+
+
+Content = bytes | memoryview
+Tag = Tuple[TagClass, int]
+
+# content octets -> value, for primitive encodings whose tag has already been
+# checked by the caller (decode_value, the schema decoders)
+
+
+def integer_value(content: Content) -> int:
+    if not content:
+        raise IntegerParserError("Integer declared without content.")
+    _check_minimal(content)
+    return int.from_bytes(content, "big", signed=True)
+
+
+def null_value(content: Content) -> None:
+    if content:
+        raise NullParserError("Null declared with non-zero content.")
+    return None
+
+
+def octets_value(content: Content) -> bytes:
+    return bytes(content)
+
+
+def oid_value(content: Content) -> str:
+    return default_oid_cache.decode(content).dotted
+
+
+def relative_oid_value(content: Content) -> str:
+    return ".".join([str(n) for n in decode_relative_oid_arcs(content)])
+
+
+def utctime_value(content: Content) -> datetime:
+    fields = decode_utctime_fields(bytes(content), UTCTimeParserError)
+    return fields_to_datetime(fields, aware=False)
+
+
+def generalizedtime_value(content: Content) -> datetime:
+    fields = decode_generalizedtime_fields(bytes(content), GeneralizedTimeParserError)
+    return fields_to_datetime(fields, aware=True)
+
+
+# (tag class, tag number) -> decoder taking the whole encoding
+_decoders: Dict[Tag, Callable[[ASN1Encoding], Any]] = {
+    (TagClass.UNIVERSAL, 2): parse_integer,
+    (TagClass.UNIVERSAL, 3): parse_bitstring,
+    (TagClass.UNIVERSAL, 4): parse_octetstring,
+    (TagClass.UNIVERSAL, 5): parse_null,
+    (TagClass.UNIVERSAL, 6): parse_oid,
+    (TagClass.UNIVERSAL, 12): parse_utf8string,
+    (TagClass.UNIVERSAL, 13): parse_relative_oid,
+    (TagClass.UNIVERSAL, 18): parse_numericstring,
+    (TagClass.UNIVERSAL, 19): parse_printablestring,
+    (TagClass.UNIVERSAL, 20): parse_teletexstring,
+    (TagClass.UNIVERSAL, 22): parse_ia5string,
+    (TagClass.UNIVERSAL, 23): parse_utctime,
+    (TagClass.UNIVERSAL, 24): parse_generalizedtime,
+    (TagClass.UNIVERSAL, 26): parse_visiblestring,
+    (TagClass.UNIVERSAL, 27): parse_generalstring,
+    (TagClass.UNIVERSAL, 28): parse_universalstring,
+    (TagClass.UNIVERSAL, 30): parse_bmpstring,
+}
+
+# (tag class, tag number) -> decoder taking the content octets of a primitive
+# encoding, used instead of the full decoder whenever it is available
+_content_decoders: Dict[Tag, Callable[[Content], Any]] = {
+    (TagClass.UNIVERSAL, 2): integer_value,
+    (TagClass.UNIVERSAL, 3): bitstring_value,
+    (TagClass.UNIVERSAL, 4): octets_value,
+    (TagClass.UNIVERSAL, 5): null_value,
+    (TagClass.UNIVERSAL, 6): oid_value,
+    (TagClass.UNIVERSAL, 12): ASN1UTF8String.decode_bytes,
+    (TagClass.UNIVERSAL, 13): relative_oid_value,
+    (TagClass.UNIVERSAL, 18): _decode_numeric_bytes,
+    (TagClass.UNIVERSAL, 19): ASN1PrintableString.decode_bytes,
+    (TagClass.UNIVERSAL, 20): ASN1TeletexString.decode_bytes,
+    (TagClass.UNIVERSAL, 22): ASN1IA5String.decode_bytes,
+    (TagClass.UNIVERSAL, 23): utctime_value,
+    (TagClass.UNIVERSAL, 24): generalizedtime_value,
+    (TagClass.UNIVERSAL, 26): ASN1VisibleString.decode_bytes,
+    (TagClass.UNIVERSAL, 27): octets_value,
+    (TagClass.UNIVERSAL, 28): ASN1UniversalString.decode_bytes,
+    (TagClass.UNIVERSAL, 30): ASN1BMPString.decode_bytes,
+}
+
+_EMPTY = b""
+
+
+def register_decoder(
+    tag_class: TagClass,
+    tag_number: int,
+    decoder: Callable[[ASN1Encoding], Any] | None = None,
+    content_decoder: Callable[[Content], Any] | None = None,
+) -> None:
+    """
+    Registers the decoders of an APPLICATION or PRIVATE tag, replacing any
+    previous registration. `decoder` receives the whole encoding and handles
+    both forms; `content_decoder` receives the content octets of primitive
+    encodings only. At least one is required; when both are given the
+    content decoder is preferred for primitive encodings.
+    """
+    tag_class = TagClass(tag_class)
+    if tag_class not in (TagClass.APPLICATION, TagClass.PRIVATE):
+        raise ValueError(
+            f"decoders can be registered only for APPLICATION and PRIVATE tags, got {tag_class.name}"
+        )
+
+    if decoder is None and content_decoder is None:
+        raise ValueError("either decoder or content_decoder is required")
+
+    key = (tag_class, tag_number)
+    _decoders.pop(key, None)
+    _content_decoders.pop(key, None)
+    if decoder is not None:
+        _decoders[key] = decoder
+    if content_decoder is not None:
+        _content_decoders[key] = content_decoder
+
+
+def unregister_decoder(tag_class: TagClass, tag_number: int) -> None:
+    tag_class = TagClass(tag_class)
+    if tag_class not in (TagClass.APPLICATION, TagClass.PRIVATE):
+        raise ValueError(
+            f"decoders can be unregistered only for APPLICATION and PRIVATE tags, got {tag_class.name}"
+        )
+    _decoders.pop((tag_class, tag_number), None)
+    _content_decoders.pop((tag_class, tag_number), None)
+
+
+def has_decoder(tag_class: TagClass, tag_number: int) -> bool:
+    key = (TagClass(tag_class), tag_number)
+    return key in _decoders or key in _content_decoders
+
+
+# universal types whose value is the list of the decoded children
+_LIST_TYPES = (16, 17)
+
+
+def _type_key(as_type: int) -> Tag:
+    key = (TagClass.UNIVERSAL, as_type)
+    if key not in _decoders and key not in _content_decoders:
+        raise ValueDecoderError(f"no decoder registered for UNIVERSAL tag {as_type}.")
+    return key
+
+
+def decode_value(encoding: ASN1Encoding, as_type: int | None = None) -> Any:
+    """
+    Decodes an encoding with the decoder registered for its tag.
+
+    Primitive encodings go straight to the content decoder: the tag was
+    matched by the lookup and the content was delimited by the parser, so the
+    per-type checks of the `parse_*` functions are not repeated.
+
+    With `as_type` the outer tag is ignored and the content is interpreted as
+    the universal type with that tag number, as for an implicitly tagged
+    value (e.g. `[0] IMPLICIT INTEGER` with `as_type=2`).
+
+    Times keep the defaults of their parsers, which differ: UTCTime is always
+    UTC and decodes to a naive datetime, as it always has; GeneralizedTime
+    may carry any offset and decodes to an aware datetime when it has 'Z'
+    or an offset, naive only for local times. The buffer parsers used by
+    the JSON and SQLite exports follow the same rule.
+
+    Returns:
+        Any: the native value
+    """
+    identifier = encoding.identifier_component
+    if as_type is None:
+        key = (identifier.tag_class, identifier.tag_number)
+    else:
+        key = _type_key(as_type)
+
+    if identifier.encoding_type is EncodingType.PRIMITIVE:
+        content_decoder = _content_decoders.get(key)
+        if content_decoder is not None:
+            content_component = encoding.content_component
+            if content_component is None:
+                return content_decoder(_EMPTY)
+            return content_decoder(content_component.content)
+
+    decoder = _decoders.get(key)
+    if decoder is None:
+        raise ValueDecoderError(
+            f"no decoder registered for {key[0].name} {identifier.encoding_type.name} tag {key[1]}."
+        )
+    if as_type is None:
+        return decoder(encoding)
+    return decoder(encoding, implicit=True)
+
+
+def _normalize_tag_types(tag_types: Mapping[Tag | int, int]) -> Dict[Tag, int]:
+    normalized: Dict[Tag, int] = {}
+    for tag, as_type in tag_types.items():
+        if isinstance(tag, int):
+            key = (TagClass.CONTEXT_SPECIFIC, tag)
+        else:
+            key = (TagClass(tag[0]), tag[1])
+        if as_type not in _LIST_TYPES:
+            _type_key(as_type)
+        normalized[key] = as_type
+    return normalized
+
+
+def decode_tree(
+    encoding: ASN1Encoding,
+    strict: bool = False,
+    tag_types: Mapping[Tag | int, int] | None = None,
+) -> Any:
+    """
+    Turns a whole encoding tree into native values in one pass.
+
+    Encodings with a registered decoder are decoded with `decode_value`.
+    Other constructed encodings (SEQUENCE, SET, context-specific wrappers)
+    become the list of their decoded children. Other primitive encodings are
+    returned as their content bytes, unless `strict` is set.
+
+    `tag_types` maps tags to the universal type their content is decoded as,
+    for implicitly tagged values. Keys are (tag class, tag number) pairs or
+    bare ints for context-specific tags, e.g. `{0: 2, 1: 16}` reads `[0]` as
+    an INTEGER and `[1]` as a SEQUENCE. Mapped tags take precedence over
+    registered decoders.
+
+    Returns:
+        Any: the native value of the tree
+    """
+    if tag_types:
+        return _decode_tree(encoding, strict, _normalize_tag_types(tag_types))
+    return _decode_tree(encoding, strict, None)
+
+
+def _decode_tree(
+    encoding: ASN1Encoding, strict: bool, tag_types: Dict[Tag, int] | None
+) -> Any:
+    identifier = encoding.identifier_component
+    key = (identifier.tag_class, identifier.tag_number)
+
+    if tag_types is not None:
+        as_type = tag_types.get(key)
+        if as_type is not None:
+            if as_type not in _LIST_TYPES:
+                return decode_value(encoding, as_type)
+            if identifier.encoding_type is EncodingType.PRIMITIVE:
+                raise ValueDecoderError(
+                    f"{identifier.tag_class.name} tag {identifier.tag_number} mapped to constructed type {as_type} is primitive."
+                )
+            return [
+                _decode_tree(inner, strict, tag_types)
+                for inner in encoding.inner_encodings or ()
+            ]
+
+    if identifier.encoding_type is EncodingType.PRIMITIVE:
+        content_component = encoding.content_component
+        content = _EMPTY if content_component is None else content_component.content
+        content_decoder = _content_decoders.get(key)
+        if content_decoder is not None:
+            return content_decoder(content)
+
+        decoder = _decoders.get(key)
+        if decoder is not None:
+            return decoder(encoding)
+
+        if strict:
+            raise ValueDecoderError(
+                f"no decoder registered for {identifier.tag_class.name} PRIMITIVE tag {identifier.tag_number}."
+            )
+        return bytes(content)
+
+    decoder = _decoders.get(key)
+    if decoder is not None:
+        return decoder(encoding)
+
+    return [
+        _decode_tree(inner, strict, tag_types) for inner in encoding.inner_encodings or ()
+    ]
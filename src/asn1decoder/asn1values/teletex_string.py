@@ -0,0 +1,143 @@
+import codecs
+import re
+import unicodedata
+from typing import Dict
+from asn1decoder.asn1types import ASN1Encoding
+from asn1decoder.asn1values.asn1string import ASN1String, ASN1StringParserError
+
+
+class TeletexStringParserError(ASN1StringParserError):
+    pass
+
+
+_UNDEFINED = "\ufffe"
+
+# T.61 primary and supplementary graphic sets. Control characters are passed
+# through unchanged, unassigned positions map to _UNDEFINED.
+_T61_SUPPLEMENTARY: Dict[int, str] = {
+    0xA0: "\u00a0",
+    0xA1: "¡",
+    0xA2: "¢",
+    0xA3: "£",
+    0xA4: "$",
+    0xA5: "¥",
+    0xA6: "#",
+    0xA7: "§",
+    0xA8: "¤",
+    0xAB: "«",
+    0xB0: "°",
+    0xB1: "±",
+    0xB2: "²",
+    0xB3: "³",
+    0xB4: "×",
+    0xB5: "µ",
+    0xB6: "¶",
+    0xB7: "·",
+    0xB8: "÷",
+    0xBB: "»",
+    0xBC: "¼",
+    0xBD: "½",
+    0xBE: "¾",
+    0xBF: "¿",
+    # non-spacing diacritical marks, they precede the character they modify
+    0xC1: "\u0300",
+    0xC2: "\u0301",
+    0xC3: "\u0302",
+    0xC4: "\u0303",
+    0xC5: "\u0304",
+    0xC6: "\u0306",
+    0xC7: "\u0307",
+    0xC8: "\u0308",
+    0xCA: "\u030a",
+    0xCB: "\u0327",
+    0xCD: "\u030b",
+    0xCE: "\u0328",
+    0xCF: "\u030c",
+    0xE0: "Ω",
+    0xE1: "Æ",
+    0xE2: "Đ",
+    0xE3: "ª",
+    0xE4: "Ħ",
+    0xE6: "Ĳ",
+    0xE7: "Ŀ",
+    0xE8: "Ł",
+    0xE9: "Ø",
+    0xEA: "Œ",
+    0xEB: "º",
+    0xEC: "Þ",
+    0xED: "Ŧ",
+    0xEE: "Ŋ",
+    0xEF: "ŉ",
+    0xF0: "ĸ",
+    0xF1: "æ",
+    0xF2: "đ",
+    0xF3: "ð",
+    0xF4: "ħ",
+    0xF5: "ı",
+    0xF6: "ĳ",
+    0xF7: "ŀ",
+    0xF8: "ł",
+    0xF9: "ø",
+    0xFA: "œ",
+    0xFB: "ß",
+    0xFC: "þ",
+    0xFD: "ŧ",
+    0xFE: "ŋ",
+}
+
+
+def _build_decoding_table() -> str:
+    table = [_UNDEFINED] * 256
+
+    for byte in [*range(0x00, 0x20), *range(0x80, 0xA0)]:
+        table[byte] = chr(byte)
+
+    for byte in range(0x20, 0x7F):
+        # not part of the T.61 primary set
+        if chr(byte) not in "#$\\^`{}~":
+            table[byte] = chr(byte)
+
+    for byte, char in _T61_SUPPLEMENTARY.items():
+        table[byte] = char
+
+    return "".join(table)
+
+
+T61_DECODING_TABLE = _build_decoding_table()
+
+_DIACRITIC_PATTERN = re.compile("([\u0300-\u030c\u0327\u0328])(.?)", re.DOTALL)
+
+
+def _apply_diacritic(match: re.Match) -> str:
+    if not match.group(2):
+        raise TeletexStringParserError(
+            "TeletexString non-spacing diacritical mark not followed by a character."
+        )
+    return match.group(2) + match.group(1)
+
+
+class ASN1TeletexString(ASN1String):
+    TAG_NUMBER = 20
+    EXCEPTION_CLASS = TeletexStringParserError
+
+    def parse(self) -> str:
+        return self.decode_bytes(self._extract_buffer())
+
+    @classmethod
+    def decode_bytes(cls, data: bytes | memoryview) -> str:
+        try:
+            value, _ = codecs.charmap_decode(data, "strict", T61_DECODING_TABLE)
+        except UnicodeDecodeError as e:
+            raise TeletexStringParserError(str(e))
+
+        # T.61 puts diacritics before the base character, Unicode after it
+        if _DIACRITIC_PATTERN.search(value):
+            value = _DIACRITIC_PATTERN.sub(_apply_diacritic, value)
+            value = unicodedata.normalize("NFC", value)
+
+        return value
+
+
+def parse_teletexstring(encoding: ASN1Encoding, implicit: bool = False) -> str:
+    p = ASN1TeletexString(encoding=encoding, implicit=implicit)
+    return p.parse()
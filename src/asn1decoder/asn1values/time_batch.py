@@ -0,0 +1,37 @@
+from array import array
+from typing import Iterable
+from asn1decoder.asn1types import ASN1Encoding
+from asn1decoder.asn1values.asn1time import (
+    _time_content,
+    decode_generalizedtime_fields,
+    decode_utctime_fields,
+    fields_to_epoch,
+)
+from asn1decoder.asn1values.utctime import UTCTimeParserError
+from asn1decoder.asn1values.generalized_time import GeneralizedTimeParserError
+
+
+def parse_times_epoch(encodings: Iterable[ASN1Encoding], unit: str = "s") -> array:
+    """
+    Converts many UTCTime and GeneralizedTime encodings to integer timestamps
+    at once, without building a datetime per value.
+
+    Returns:
+        array: an array('q') of timestamps in `unit` ("s", "ms" or "us")
+    """
+    result = array("q")
+    append = result.append
+
+    for encoding in encodings:
+        if encoding.tag_number == 24:
+            data = _time_content(
+                encoding, 24, GeneralizedTimeParserError, "GeneralizedTime"
+            )
+            fields = decode_generalizedtime_fields(data, GeneralizedTimeParserError)
+        else:
+            data = _time_content(encoding, 23, UTCTimeParserError, "UTCTime")
+            fields = decode_utctime_fields(data, UTCTimeParserError)
+
+        append(fields_to_epoch(fields, unit=unit))
+
+    return result
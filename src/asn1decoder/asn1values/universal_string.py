@@ -0,0 +1,32 @@
+from asn1decoder.asn1types import ASN1Encoding
+from asn1decoder.asn1values.asn1string import ASN1String, ASN1StringParserError
+
+
+class UniversalStringParserError(ASN1StringParserError):
+    pass
+
+
+class ASN1UniversalString(ASN1String):
+    TAG_NUMBER = 28
+    EXCEPTION_CLASS = UniversalStringParserError
+
+    def parse(self) -> str:
+        return self.decode_bytes(self._extract_buffer())
+
+    @classmethod
+    def decode_bytes(cls, data: bytes | memoryview) -> str:
+        if len(data) % 4:
+            raise UniversalStringParserError(
+                f"UniversalString length must be a multiple of 4. Got {len(data)}."
+            )
+
+        # surrogates and code points above U+10FFFF are rejected by the strict codec
+        try:
+            return str(data, "utf-32-be")
+        except UnicodeDecodeError as e:
+            raise UniversalStringParserError(str(e))
+
+
+def parse_universalstring(encoding: ASN1Encoding, implicit: bool = False) -> str:
+    p = ASN1UniversalString(encoding=encoding, implicit=implicit)
+    return p.parse()
@@ -1,5 +1,6 @@
 from asn1decoder.asn1types import ASN1Encoding
 from asn1decoder.asn1values.asn1string import ASN1String, ASN1StringParserError
+from asn1decoder.asn1values.intern_pool import InternPool
 
 
 class UTF8StringParserError(ASN1StringParserError):
@@ -10,13 +11,18 @@ class ASN1UTF8String(ASN1String):
     TAG_NUMBER = 12
     EXCEPTION_CLASS = UTF8StringParserError
 
-    def is_valid_char(self, char: str) -> bool:
-        return True
+    @classmethod
+    def decode_bytes(cls, data: bytes | memoryview) -> str:
+        try:
+            return str(data, "utf8")
+        except UnicodeDecodeError as e:
+            raise UTF8StringParserError(str(e))
 
 
-def parse_utf8string(encoding: ASN1Encoding) -> str:
-    p = ASN1UTF8String(encoding=encoding)
-    try:
-        return p._extract_bytes().decode("utf8")
-    except UnicodeDecodeError as e:
-        raise UTF8StringParserError(str(e))
+def parse_utf8string(
+    encoding: ASN1Encoding, implicit: bool = False, pool: InternPool | None = None
+) -> str:
+    p = ASN1UTF8String(encoding=encoding, implicit=implicit)
+    if pool is not None:
+        return p.parse_interned(pool)
+    return p.parse()
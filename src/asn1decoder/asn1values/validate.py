@@ -0,0 +1,393 @@
+import re
+from datetime import MINYEAR
+from array import array
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+from asn1decoder.asn1types import ASN1Encoding, EncodingType, TagClass
+from asn1decoder.validation import ErrorCode
+from asn1decoder.asn1values.asn1string import find_invalid_byte
+from asn1decoder.asn1values.asn1time import _DAYS_IN_MONTH, _is_leap
+from asn1decoder.asn1values.numeric_string import NUMERIC_ALPHABET
+from asn1decoder.asn1values.printable_string import ASN1PrintableString
+from asn1decoder.asn1values.teletex_string import T61_DECODING_TABLE
+from asn1decoder.asn1values.ia5_string import ASN1IA5String
+from asn1decoder.asn1values.visible_string import ASN1VisibleString
+from asn1decoder.asn1values.registry import _content_decoders
+from asn1decoder.asn1values.bit_string import join_bitstring_segments
+
+# Non-raising counterparts of the value parsers. Each check returns an
+# ErrorCode and the index of the offending octet in the content; the value is
+# decoded only once the content is known to be valid, with the same content
+# decoders used by `decode_value`, so no exception is ever created.
+
+Content = bytes | memoryview
+ContentCheck = Tuple[ErrorCode, int]
+# (ok, value or ErrorCode, offset)
+Result = Tuple[bool, Any, int]
+
+_OK: ContentCheck = (ErrorCode.OK, 0)
+
+# universal types that can only be primitive
+_PRIMITIVE_ONLY = frozenset((2, 5, 6, 13, 23, 24))
+
+
+def check_integer(content: Content) -> ContentCheck:
+    if not content:
+        return ErrorCode.EMPTY_CONTENT, 0
+    if len(content) > 1 and (content[0] << 1 | content[1] >> 7) in (0, 0x1FF):
+        return ErrorCode.NOT_MINIMAL, 0
+    return _OK
+
+
+def check_bitstring(content: Content) -> ContentCheck:
+    if not content:
+        return ErrorCode.EMPTY_CONTENT, 0
+    if content[0] > 7 or (content[0] and len(content) == 1):
+        return ErrorCode.INVALID_UNUSED_BITS, 0
+    return _OK
+
+
+def check_null(content: Content) -> ContentCheck:
+    if content:
+        return ErrorCode.NON_EMPTY_CONTENT, 0
+    return _OK
+
+
+def check_octets(content: Content) -> ContentCheck:
+    return _OK
+
+
+def check_oid(content: Content) -> ContentCheck:
+    if not content:
+        return ErrorCode.EMPTY_CONTENT, 0
+    previous = 0
+    for index, byte in enumerate(content):
+        # 8.19.2 the leading octet of a subidentifier shall not be 0x80
+        if byte == 0x80 and previous < 0x80:
+            return ErrorCode.NOT_MINIMAL, index
+        previous = byte
+    if previous >= 0x80:
+        return ErrorCode.INVALID_CONTENT, len(content) - 1
+    return _OK
+
+
+def _alphabet_check(alphabet: bytes | None) -> Callable[[Content], ContentCheck]:
+    def check(content: Content) -> ContentCheck:
+        index = find_invalid_byte(bytes(content), alphabet)
+        if index == -1:
+            return _OK
+        return ErrorCode.INVALID_CHARACTER, index
+
+    return check
+
+
+def check_utf8string(content: Content) -> ContentCheck:
+    # the codec replaces bad input instead of raising, so the decoded text
+    # round-trips to the content only when the content is valid
+    value = str(content, "utf8", "replace")
+    if value.encode("utf8") != content:
+        for index, (byte, other) in enumerate(zip(content, value.encode("utf8"))):
+            if byte != other:
+                return ErrorCode.INVALID_CHARACTER, index
+        return ErrorCode.INVALID_CHARACTER, 0
+    return _OK
+
+
+def check_bmpstring(content: Content) -> ContentCheck:
+    if len(content) % 2:
+        return ErrorCode.INVALID_LENGTH, len(content) - 1
+    value = str(content, "utf-16-be", "replace")
+    # surrogate pairs decode to characters outside the BMP
+    if value.encode("utf-16-be") != content or (value and max(value) > "\uffff"):
+        return ErrorCode.INVALID_CHARACTER, 0
+    return _OK
+
+
+def check_universalstring(content: Content) -> ContentCheck:
+    if len(content) % 4:
+        return ErrorCode.INVALID_LENGTH, len(content) - len(content) % 4
+    value = str(content, "utf-32-be", "replace")
+    if value.encode("utf-32-be") != content:
+        return ErrorCode.INVALID_CHARACTER, 0
+    return _OK
+
+
+_T61_UNDEFINED = bytes(
+    byte for byte, char in enumerate(T61_DECODING_TABLE) if char == "\ufffe"
+)
+_T61_DEFINED = bytes(sorted(set(range(256)) - set(_T61_UNDEFINED)))
+_T61_DIACRITICS = bytes(
+    byte
+    for byte, char in enumerate(T61_DECODING_TABLE)
+    if "\u0300" <= char <= "\u036f"
+)
+
+
+def check_teletexstring(content: Content) -> ContentCheck:
+    data = bytes(content)
+    if data.translate(None, _T61_DEFINED):
+        for index, byte in enumerate(data):
+            if byte in _T61_UNDEFINED:
+                return ErrorCode.INVALID_CHARACTER, index
+    # marks pair with the character that follows them, so a trailing run of
+    # marks of odd length leaves the last one without a character
+    trailing = len(data) - len(data.rstrip(_T61_DIACRITICS))
+    if trailing % 2:
+        return ErrorCode.INVALID_CHARACTER, len(data) - 1
+    return _OK
+
+
+def _valid_date(year: int, month: int, day: int) -> bool:
+    if year < MINYEAR or not 1 <= month <= 12 or day < 1:
+        return False
+    return day <= (29 if month == 2 and _is_leap(year) else _DAYS_IN_MONTH[month - 1])
+
+
+_UTCTIME = re.compile(rb"(\d\d)(\d\d)(\d\d)(\d\d)(\d\d)(\d\d)Z")
+_GENERALIZEDTIME = re.compile(
+    rb"(\d{4})(\d\d)(\d\d)(\d\d)(?:(\d\d)(\d\d)?)?(?:[.,]\d+)?"
+    rb"(?:Z|[+-](\d\d)(\d\d)?)?"
+)
+
+
+def check_utctime(content: Content) -> ContentCheck:
+    match = _UTCTIME.fullmatch(bytes(content))
+    if match is None:
+        return ErrorCode.INVALID_TIME, 0
+    yy, month, day, hours, minutes, seconds = map(int, match.groups())
+    year = 2000 + yy if yy <= 49 else 1900 + yy
+    if not _valid_date(year, month, day) or hours > 23 or minutes > 59 or seconds > 59:
+        return ErrorCode.INVALID_TIME, 0
+    return _OK
+
+
+def check_generalizedtime(content: Content) -> ContentCheck:
+    match = _GENERALIZEDTIME.fullmatch(bytes(content))
+    if match is None:
+        return ErrorCode.INVALID_TIME, 0
+    year, month, day, hours, minutes, seconds, offset_hours, offset_minutes = (
+        int(group or 0) for group in match.groups()
+    )
+    if (
+        not _valid_date(year, month, day)
+        or hours > 23
+        or minutes > 59
+        or seconds > 59
+        or offset_hours > 23
+        or offset_minutes > 59
+    ):
+        return ErrorCode.INVALID_TIME, 0
+    return _OK
+
+
+# universal tag number -> content check
+CONTENT_CHECKS: Dict[int, Callable[[Content], ContentCheck]] = {
+    2: check_integer,
+    3: check_bitstring,
+    4: check_octets,
+    5: check_null,
+    6: check_oid,
+    12: check_utf8string,
+    13: check_oid,
+    18: _alphabet_check(NUMERIC_ALPHABET),
+    19: _alphabet_check(ASN1PrintableString.ALPHABET),
+    20: check_teletexstring,
+    22: _alphabet_check(ASN1IA5String.ALPHABET),
+    23: check_utctime,
+    24: check_generalizedtime,
+    26: _alphabet_check(ASN1VisibleString.ALPHABET),
+    # GeneralString content is returned undecoded
+    27: check_octets,
+    28: check_universalstring,
+    30: check_bmpstring,
+}
+
+
+def _segments(encoding: ASN1Encoding, segment_tag: int) -> List[memoryview] | None:
+    # the primitive segments of a constructed string, None if one is invalid
+    chunks: List[memoryview] = []
+    stack = [iter(encoding.inner_encodings or ())]
+    while stack:
+        inner = next(stack[-1], None)
+        if inner is None:
+            stack.pop()
+            continue
+        if inner.identifier_component.tag_number != segment_tag:
+            return None
+        if inner.identifier_component.encoding_type is EncodingType.CONSTRUCTED:
+            stack.append(iter(inner.inner_encodings or ()))
+        elif inner.content_component is not None:
+            chunks.append(inner.content_component.content)
+        elif segment_tag == 3:
+            # a BIT STRING segment needs at least the unused bits octet
+            return None
+    return chunks
+
+
+def validate_value(
+    encoding: ASN1Encoding, as_type: int | None = None
+) -> Tuple[ErrorCode, int, Content]:
+    """
+    Checks an encoding against the rules of the value parser of its universal
+    type (or of `as_type`, ignoring the tag, for implicitly tagged values).
+
+    Returns:
+        (ErrorCode, offset, content): offset locates the error in the source
+        buffer; content holds the (reassembled) content octets when valid
+    """
+    identifier = encoding.identifier_component
+    start = encoding.header.offset
+    if as_type is None:
+        if identifier.tag_class is not TagClass.UNIVERSAL:
+            return ErrorCode.NO_DECODER, start, b""
+        as_type = identifier.tag_number
+
+    check = CONTENT_CHECKS.get(as_type)
+    if check is None:
+        return ErrorCode.NO_DECODER, start, b""
+
+    content_component = encoding.content_component
+    if identifier.encoding_type is EncodingType.CONSTRUCTED:
+        if as_type in _PRIMITIVE_ONLY:
+            return ErrorCode.CONSTRUCTED_FORM, start, b""
+        chunks = _segments(encoding, 3 if as_type == 3 else 4)
+        if chunks is None:
+            return ErrorCode.INVALID_SEGMENT, start, b""
+        if as_type == 3:
+            for index, chunk in enumerate(chunks):
+                code, _ = check_bitstring(chunk)
+                # only the last segment may have unused bits
+                if code or (chunk[0] and index != len(chunks) - 1):
+                    return ErrorCode.INVALID_SEGMENT, start, b""
+            content: Content = join_bitstring_segments(chunks)
+        else:
+            content = b"".join(chunks)
+        content_offset = start
+    elif content_component is None:
+        content = b""
+        content_offset = start
+    else:
+        content = content_component.content
+        content_offset = content_component.header.offset
+
+    code, index = check(content)
+    if code:
+        return code, content_offset + index, content
+    return ErrorCode.OK, content_offset, content
+
+
+def try_decode(
+    encoding: ASN1Encoding, as_type: int | None = None, implicit: bool = False
+) -> Result:
+    """
+    Non-raising value decoding. With `as_type` the content is read as that
+    universal type; unless `implicit` is set the tag must then match it.
+
+    Returns:
+        (ok, value, offset): the value and the offset right after the
+        encoding, or the ErrorCode and the offset of the error
+    """
+    identifier = encoding.identifier_component
+    if as_type is not None and not implicit and (
+        identifier.tag_class is not TagClass.UNIVERSAL
+        or identifier.tag_number != as_type
+    ):
+        return False, ErrorCode.UNEXPECTED_TAG, encoding.header.offset
+
+    code, offset, content = validate_value(encoding, as_type)
+    if code:
+        return False, code, offset
+
+    key = (TagClass.UNIVERSAL, identifier.tag_number if as_type is None else as_type)
+    value = _content_decoders[key](content)
+    header = encoding.header
+    return True, value, header.offset + header.length
+
+
+def try_parse_integer(encoding: ASN1Encoding, implicit: bool = False) -> Result:
+    return try_decode(encoding, 2, implicit)
+
+
+def try_parse_bitstring(encoding: ASN1Encoding, implicit: bool = False) -> Result:
+    return try_decode(encoding, 3, implicit)
+
+
+def try_parse_octetstring(encoding: ASN1Encoding, implicit: bool = False) -> Result:
+    return try_decode(encoding, 4, implicit)
+
+
+def try_parse_null(encoding: ASN1Encoding, implicit: bool = False) -> Result:
+    return try_decode(encoding, 5, implicit)
+
+
+def try_parse_oid(encoding: ASN1Encoding, implicit: bool = False) -> Result:
+    return try_decode(encoding, 6, implicit)
+
+
+def try_parse_utf8string(encoding: ASN1Encoding, implicit: bool = False) -> Result:
+    return try_decode(encoding, 12, implicit)
+
+
+def try_parse_relative_oid(encoding: ASN1Encoding, implicit: bool = False) -> Result:
+    return try_decode(encoding, 13, implicit)
+
+
+def try_parse_numericstring(encoding: ASN1Encoding, implicit: bool = False) -> Result:
+    return try_decode(encoding, 18, implicit)
+
+
+def try_parse_printablestring(
+    encoding: ASN1Encoding, implicit: bool = False
+) -> Result:
+    return try_decode(encoding, 19, implicit)
+
+
+def try_parse_teletexstring(encoding: ASN1Encoding, implicit: bool = False) -> Result:
+    return try_decode(encoding, 20, implicit)
+
+
+def try_parse_ia5string(encoding: ASN1Encoding, implicit: bool = False) -> Result:
+    return try_decode(encoding, 22, implicit)
+
+
+def try_parse_utctime(encoding: ASN1Encoding, implicit: bool = False) -> Result:
+    return try_decode(encoding, 23, implicit)
+
+
+def try_parse_generalizedtime(
+    encoding: ASN1Encoding, implicit: bool = False
+) -> Result:
+    return try_decode(encoding, 24, implicit)
+
+
+def try_parse_visiblestring(encoding: ASN1Encoding, implicit: bool = False) -> Result:
+    return try_decode(encoding, 26, implicit)
+
+
+def try_parse_generalstring(encoding: ASN1Encoding, implicit: bool = False) -> Result:
+    return try_decode(encoding, 27, implicit)
+
+
+def try_parse_universalstring(
+    encoding: ASN1Encoding, implicit: bool = False
+) -> Result:
+    return try_decode(encoding, 28, implicit)
+
+
+def try_parse_bmpstring(encoding: ASN1Encoding, implicit: bool = False) -> Result:
+    return try_decode(encoding, 30, implicit)
+
+
+def validate_values(
+    encodings: Iterable[ASN1Encoding], as_type: int | None = None
+) -> array:
+    """
+    Validates many encodings without decoding them (see `validate_value`).
+
+    Returns:
+        array: one unsigned byte per encoding, the ErrorCode (0 when valid)
+    """
+    codes = array("B")
+    append = codes.append
+    for encoding in encodings:
+        append(validate_value(encoding, as_type)[0])
+    return codes
@@ -1,5 +1,9 @@
 from asn1decoder.asn1types import ASN1Encoding
-from asn1decoder.asn1values.asn1string import ASN1String, ASN1StringParserError
+from asn1decoder.asn1values.asn1string import (
+    ASN1String,
+    ASN1StringParserError,
+    compile_alphabet,
+)
 
 
 class VisibleStringParserError(ASN1StringParserError):
@@ -9,14 +13,9 @@ class VisibleStringParserError(ASN1StringParserError):
 class ASN1VisibleString(ASN1String):
     TAG_NUMBER = 26
     EXCEPTION_CLASS = VisibleStringParserError
+    ALPHABET = compile_alphabet(range(0x20, 0x7F))
 
-    def is_valid_char(self, char: str) -> bool:
-        if len(char) > 1:
-            raise ValueError(f"expected a character but got a string: '{char}'")
 
-        return 0x20 <= ord(char) < 0x7F
-
-
-def parse_visiblestring(encoding: ASN1Encoding) -> str:
-    p = ASN1VisibleString(encoding=encoding)
+def parse_visiblestring(encoding: ASN1Encoding, implicit: bool = False) -> str:
+    p = ASN1VisibleString(encoding=encoding, implicit=implicit)
     return p.parse()
@@ -0,0 +1,322 @@
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Tuple
+from asn1decoder.asn1types import EncodingType, TagClass
+from asn1decoder.asn1parser import (
+    ASN1ParserError,
+    EOCError,
+    LengthError,
+    parse_header,
+    find_encoding_end,
+)
+from asn1decoder.asn1values.buffer import (
+    parse_integer_buffer,
+    parse_octetstring_buffer,
+    parse_oid_buffer,
+    parse_utf8string_buffer,
+    parse_numericstring_buffer,
+    parse_printablestring_buffer,
+    parse_ia5string_buffer,
+    parse_visiblestring_buffer,
+    parse_generalstring_buffer,
+    parse_bmpstring_buffer,
+    parse_universalstring_buffer,
+    parse_teletexstring_buffer,
+    parse_utctime_epoch_buffer,
+    parse_generalizedtime_epoch_buffer,
+)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class ColumnarExtractionError(ASN1ParserError):
+    pass
+
+
+# universal tag number -> buffer-level parser used to type the extracted value
+VALUE_PARSERS: Dict[int, Callable[..., Any]] = {
+    2: parse_integer_buffer,
+    4: parse_octetstring_buffer,
+    6: parse_oid_buffer,
+    12: parse_utf8string_buffer,
+    18: parse_numericstring_buffer,
+    19: parse_printablestring_buffer,
+    20: parse_teletexstring_buffer,
+    22: parse_ia5string_buffer,
+    23: parse_utctime_epoch_buffer,
+    24: parse_generalizedtime_epoch_buffer,
+    26: parse_visiblestring_buffer,
+    27: parse_generalstring_buffer,
+    28: parse_universalstring_buffer,
+    30: parse_bmpstring_buffer,
+}
+
+# universal types decoded to numbers, the only ones numeric columns accept
+_NUMERIC_TYPES = frozenset((2, 23, 24))
+
+# column kind -> (array typecode or None for a list, default universal type)
+COLUMN_KINDS: Dict[str, Tuple[str | None, int]] = {
+    "int": ("q", 2),
+    "float": ("d", 2),
+    "str": (None, 12),
+    "bytes": (None, 4),
+}
+
+Tag = Tuple[TagClass, int]
+
+
+def _to_tag(selector: int | Tag) -> Tag:
+    # bare numbers are context-specific tags, the usual case for CDR fields
+    if isinstance(selector, int):
+        return (TagClass.CONTEXT_SPECIFIC, selector)
+    return (TagClass(selector[0]), selector[1])
+
+
+@dataclass(slots=True)
+class FieldSpec:
+    """
+    A field to extract from every record.
+
+    `path` lists the tags to follow from the record down to the field; bare
+    ints are context-specific tag numbers. `as_type` is the universal tag
+    number used to decode the (usually IMPLICIT) field, and defaults from
+    `kind`. Numeric kinds need a default, used when the field is missing.
+    """
+
+    name: str
+    path: Sequence[int | Tag]
+    kind: str = "int"
+    default: Any = None
+    as_type: int | None = None
+    tags: Tuple[Tag, ...] = field(init=False)
+
+    def __post_init__(self) -> None:
+        if self.kind not in COLUMN_KINDS:
+            raise ValueError(
+                f"unknown column kind {self.kind!r}, expected one of {list(COLUMN_KINDS)}"
+            )
+
+        if not self.path:
+            raise ValueError(f"field {self.name!r} has an empty path")
+
+        typecode, default_type = COLUMN_KINDS[self.kind]
+        if self.as_type is None:
+            self.as_type = default_type
+
+        if self.as_type not in VALUE_PARSERS:
+            raise ValueError(f"no value parser for universal tag {self.as_type}")
+
+        if typecode is not None and self.as_type not in _NUMERIC_TYPES:
+            raise ValueError(
+                f"{self.kind} field {self.name!r} cannot hold universal tag "
+                f"{self.as_type}, expected one of {sorted(_NUMERIC_TYPES)}"
+            )
+
+        if typecode is not None and self.default is None:
+            raise ValueError(f"numeric field {self.name!r} requires a default")
+
+        self.tags = tuple(_to_tag(selector) for selector in self.path)
+
+
+class _PathNode:
+    __slots__ = ("children", "leaf")
+
+    def __init__(self) -> None:
+        self.children: Dict[Tag, _PathNode] = {}
+        self.leaf: int | None = None
+
+
+def _compile_paths(fields: Sequence[FieldSpec]) -> _PathNode:
+    root = _PathNode()
+    for index, spec in enumerate(fields):
+        node = root
+        for tag in spec.tags:
+            if node.leaf is not None:
+                break
+            node = node.children.setdefault(tag, _PathNode())
+
+        if node.leaf is not None or node.children:
+            raise ValueError(
+                f"field {spec.name!r} overlaps the path of another field"
+            )
+        node.leaf = index
+
+    return root
+
+
+_MISSING = object()
+
+
+def _iter_children(
+    data: memoryview, start: int, content_length: int | None
+) -> Iterator[Tuple[int, TagClass, EncodingType, int, int, int | None]]:
+    """
+    Yields (offset, tag_class, encoding_type, tag_number, header_length,
+    content_length) for each child of a constructed encoding.
+    """
+    offset = start
+    end = None if content_length is None else start + content_length
+
+    while True:
+        if end is None:
+            if offset + 1 >= len(data):
+                raise EOCError("missing required EOC")
+            if data[offset] == 0 and data[offset + 1] == 0:
+                return
+        elif offset == end:
+            return
+
+        tag_class, encoding_type, tag_number, header_length, length = parse_header(
+            data, offset
+        )
+        if length is None:
+            next_offset = find_encoding_end(data, offset)
+        else:
+            next_offset = offset + header_length + length
+        # checked before yielding, a child overrunning its parent would be
+        # decoded from the octets that follow it
+        if end is not None and next_offset > end:
+            raise LengthError("Constructed content length mismatch")
+
+        yield offset, tag_class, encoding_type, tag_number, header_length, length
+        offset = next_offset
+
+
+def _decode_field(
+    data: memoryview,
+    content_offset: int,
+    content_length: int | None,
+    constructed: bool,
+    spec: FieldSpec,
+) -> Any:
+    # the field may be implicitly tagged, its content is read as `as_type`
+    value = VALUE_PARSERS[spec.as_type](
+        data, content_offset, content_length, constructed
+    )
+
+    if spec.kind == "float":
+        return float(value)
+    if spec.kind == "str" and isinstance(value, bytes):
+        return value.decode("latin-1")
+    return value
+
+
+def _extract_record(
+    data: memoryview,
+    start: int,
+    content_length: int | None,
+    node: _PathNode,
+    fields: Sequence[FieldSpec],
+    row: List[Any],
+) -> None:
+    for offset, tag_class, encoding_type, tag_number, header_length, length in (
+        _iter_children(data, start, content_length)
+    ):
+        child = node.children.get((tag_class, tag_number))
+        if child is None:
+            continue
+
+        if child.leaf is not None:
+            if row[child.leaf] is _MISSING:
+                row[child.leaf] = _decode_field(
+                    data,
+                    offset + header_length,
+                    length,
+                    encoding_type is EncodingType.CONSTRUCTED,
+                    fields[child.leaf],
+                )
+        elif encoding_type is EncodingType.CONSTRUCTED:
+            _extract_record(data, offset + header_length, length, child, fields, row)
+
+
+def _iter_records(
+    data: memoryview, offset: int, container: bool
+) -> Iterator[Tuple[int, int, int | None]]:
+    if container:
+        _, encoding_type, _, header_length, length = parse_header(data, offset)
+        if encoding_type is not EncodingType.CONSTRUCTED:
+            raise ColumnarExtractionError("record container shall be constructed.")
+        for child_offset, _, child_type, _, child_header, child_length in (
+            _iter_children(data, offset + header_length, length)
+        ):
+            if child_type is not EncodingType.CONSTRUCTED:
+                raise ColumnarExtractionError(
+                    f"record at offset {child_offset} shall be constructed."
+                )
+            yield child_offset, child_offset + child_header, child_length
+        return
+
+    while offset < len(data):
+        _, encoding_type, _, header_length, length = parse_header(data, offset)
+        if encoding_type is not EncodingType.CONSTRUCTED:
+            raise ColumnarExtractionError(
+                f"record at offset {offset} shall be constructed."
+            )
+        yield offset, offset + header_length, length
+        offset = find_encoding_end(data, offset)
+
+
+def extract_columns(
+    data: memoryview,
+    fields: Sequence[FieldSpec],
+    offset: int = 0,
+    container: bool = True,
+    use_numpy: bool | None = False,
+) -> Dict[str, Any]:
+    """
+    Walks each record once and fills one typed column per field.
+
+    With `container` set, records are the children of the constructed
+    encoding at `offset` (a SEQUENCE OF records); otherwise records are the
+    top-level encodings laid one after the other from `offset` to the end.
+
+    Only the headers on the way to the requested fields are read, and only
+    the fields themselves are decoded, so no encoding tree is built.
+
+    Returns:
+        Dict[str, Any]: field name -> array('q'), array('d') or list; int and
+        float columns are NumPy arrays when `use_numpy` is set (None means
+        "if available"), an int column holding a value that does not fit 64
+        bits is a list of Python ints
+    """
+    if use_numpy is None:
+        use_numpy = numpy is not None
+    elif use_numpy and numpy is None:
+        raise ImportError("numpy is required when use_numpy=True")
+
+    data = memoryview(data)
+    root = _compile_paths(fields)
+
+    columns: List[Any] = []
+    for spec in fields:
+        typecode = COLUMN_KINDS[spec.kind][0]
+        columns.append(array(typecode) if typecode is not None else [])
+
+    appends = [column.append for column in columns]
+    defaults = [spec.default for spec in fields]
+
+    for _, start, content_length in _iter_records(data, offset, container):
+        row = [_MISSING] * len(fields)
+        _extract_record(data, start, content_length, root, fields, row)
+        for i, value in enumerate(row):
+            if value is _MISSING:
+                value = defaults[i]
+            try:
+                appends[i](value)
+            except OverflowError:
+                # like parse_integers, a column with a value that does not fit
+                # 64 bits becomes a list of Python ints
+                columns[i] = list(columns[i])
+                appends[i] = columns[i].append
+                appends[i](value)
+
+    result = {}
+    for spec, column in zip(fields, columns):
+        if use_numpy and isinstance(column, array):
+            column = numpy.frombuffer(column, dtype=column.typecode)
+        result[spec.name] = column
+
+    return result
@@ -0,0 +1,332 @@
+from typing import Iterable, List, TextIO
+from asn1decoder.asn1types import ASN1TypeNames, EncodingType, TagClass
+from asn1decoder.asn1parser import find_encoding_end, iter_headers, parse_header
+from asn1decoder.asn1values.oid import OIDParserError, default_oid_cache
+from asn1decoder.asn1values.buffer import parse_octetstring_buffer
+
+# lines collected before each write to the output stream
+_LINES_PER_WRITE = 4096
+
+
+def format_content(content: memoryview, max_content: int | None = None) -> str:
+    """
+    The content of a primitive encoding as shown by `dump`: the bytes repr,
+    or with `max_content` a hex preview of at most that many octets.
+    """
+    if max_content is None:
+        return repr(content.tobytes()) if content else ""
+
+    preview = content[:max_content].hex()
+    if len(content) > max_content:
+        return f"{preview}... ({len(content)} bytes)"
+    return preview
+
+
+def format_header(
+    tag_class: TagClass,
+    encoding_type: EncodingType,
+    tag_number: int,
+    content_length: int | None,
+) -> str:
+    if tag_class is TagClass.UNIVERSAL:
+        tag_name = ASN1TypeNames.get(tag_number, tag_number)
+    else:
+        tag_name = f"[{tag_number}]"
+
+    if encoding_type is EncodingType.PRIMITIVE:
+        length_form = ""
+    else:
+        length_form = "DEFINITE" if content_length is not None else "INDEFINITE"
+    return f"{tag_class.name} {encoding_type.name} {tag_name} {length_form}"
+
+
+def dump(
+    data: memoryview,
+    out: TextIO,
+    offset: int = 0,
+    length: int | None = None,
+    max_depth: int | None = None,
+    max_content: int | None = None,
+) -> None:
+    """
+    Writes one line per encoding of `data`, indented by depth, walking the
+    encodings as they come (see `iter_headers`) instead of building the
+    tree first. Lines are written to `out` in large batches.
+
+    `offset` and `length` restrict the dump to the top-level encodings
+    starting in that window; `offset` must be the start of an encoding.
+    """
+    # an empty buffer dumps nothing, otherwise the offset shall be within it
+    if offset < 0 or offset > len(data) or offset == len(data) != 0:
+        raise ValueError(f"offset '{offset}' is out of range")
+
+    end = None if length is None else offset + length
+    lines: List[str] = []
+
+    for (
+        node_offset,
+        depth,
+        tag_class,
+        encoding_type,
+        tag_number,
+        header_length,
+        content_length,
+    ) in iter_headers(data, offset, end, max_depth):
+        line = format_header(tag_class, encoding_type, tag_number, content_length)
+
+        if encoding_type is EncodingType.PRIMITIVE:
+            start = node_offset + header_length
+            content = data[start : start + content_length]
+            text = None
+            if tag_class is TagClass.UNIVERSAL and tag_number == 6:
+                try:
+                    oid = default_oid_cache.decode(content)
+                except OIDParserError:
+                    pass
+                else:
+                    text = f"{tag_class.name} {encoding_type.name} OBJECT-IDENTIFIER  {oid.name or oid.dotted}"
+            if text is None:
+                text = f"{line} {format_content(content, max_content)}"
+            line = text
+        else:
+            line = f"{line} "
+
+        lines.append(f"{' ' * depth}{line}\n")
+        if len(lines) >= _LINES_PER_WRITE:
+            out.write("".join(lines))
+            lines.clear()
+
+    out.write("".join(lines))
+
+
+# ASN1_tag2str of openssl, indexed by universal tag number
+ASN1PARSE_TAG_NAMES = (
+    "EOC", "BOOLEAN", "INTEGER", "BIT STRING", "OCTET STRING", "NULL",
+    "OBJECT", "OBJECT DESCRIPTOR", "EXTERNAL", "REAL", "ENUMERATED",
+    "<ASN1 11>", "UTF8STRING", "<ASN1 13>", "<ASN1 14>", "<ASN1 15>",
+    "SEQUENCE", "SET", "NUMERICSTRING", "PRINTABLESTRING", "T61STRING",
+    "VIDEOTEXSTRING", "IA5STRING", "UTCTIME", "GENERALIZEDTIME",
+    "GRAPHICSTRING", "VISIBLESTRING", "GENERALSTRING", "UNIVERSALSTRING",
+    "<ASN1 29>", "BMPSTRING",
+)  # fmt: skip
+
+# universal types whose content openssl prints as is
+_TEXT_TAGS = frozenset((12, 18, 19, 20, 22, 23, 24, 26))
+
+_PRINTABLE = frozenset(range(0x20, 0x7F)) | {0x09, 0x0A, 0x0D}
+
+# bytes printed as themselves in the ascii column of a hex dump
+_DUMP_ASCII = "".join(chr(ch) if 0x20 <= ch <= 0x7E else "." for ch in range(256))
+
+
+def hexdump(content: bytes | memoryview, indent: int = 6) -> str:
+    """
+    `content` as printed by BIO_dump_indent: 16 octets per line with their
+    offset, hex and ascii columns.
+    """
+    lines = []
+    pad = " " * indent
+    for start in range(0, len(content), 16):
+        row = bytes(content[start : start + 16])
+        octets = [f"{ch:02x} " for ch in row]
+        if len(octets) > 7:
+            octets[7] = f"{row[7]:02x}-"
+        octets.extend("   " for _ in range(16 - len(row)))
+        lines.append(
+            f"{pad}{start:04x} - {''.join(octets)}  {row.decode('latin-1').translate(_DUMP_ASCII)}\n"
+        )
+    return "".join(lines)
+
+
+def _asn1parse_integer(content: memoryview, name: str) -> str:
+    if not content or (
+        len(content) > 1
+        and (
+            (content[0] == 0 and content[1] < 0x80)
+            or (content[0] == 0xFF and content[1] >= 0x80)
+        )
+    ):
+        return f":BAD {name}"
+
+    value = int.from_bytes(content, "big", signed=True)
+    if value < 0:
+        magnitude = -value
+        return f":-{magnitude.to_bytes((magnitude.bit_length() + 7) // 8, 'big').hex().upper()}"
+    if len(content) > 1 and content[0] == 0:
+        content = content[1:]
+    return f":{content.hex().upper()}"
+
+
+def format_asn1parse_value(
+    tag_number: int, content: memoryview, dump: bool, dump_limit: int | None
+) -> str:
+    """
+    The value part of an `openssl asn1parse` line for a universal primitive,
+    including the hex dump lines when `dump` applies, without the final
+    newline unless a hex dump ends the text. Content octets are mapped to
+    the characters with the same code (latin-1).
+    """
+    if tag_number in _TEXT_TAGS:
+        # openssl prints the colon even for empty strings
+        return f":{content.tobytes().decode('latin-1')}"
+
+    if tag_number == 6:
+        try:
+            oid = default_oid_cache.decode(content)
+        except OIDParserError:
+            return ":BAD OBJECT"
+        return f":{oid.name or oid.dotted}"
+
+    if tag_number == 2:
+        return _asn1parse_integer(content, "INTEGER")
+    if tag_number == 10:
+        return _asn1parse_integer(content, "ENUMERATED")
+
+    if tag_number == 1:
+        return f":{content[0]}" if len(content) == 1 else ":BAD BOOLEAN"
+
+    if tag_number == 30:
+        try:
+            text = content.tobytes().decode("utf-16-be")
+        except UnicodeDecodeError:
+            return ""
+        return f":{text.encode().decode('latin-1')}"
+
+    if not content:
+        return ""
+
+    if tag_number == 4:
+        raw = content.tobytes()
+        if _PRINTABLE.issuperset(raw):
+            return f":{raw.decode('latin-1')}"
+        if not dump:
+            return f"[HEX DUMP]:{raw.hex().upper()}"
+
+    if dump:
+        if dump_limit is not None:
+            content = content[:dump_limit]
+        return f"\n{hexdump(content)}"
+    return ""
+
+
+def strparse(data: memoryview, offsets: Iterable[int]) -> memoryview | bytes:
+    """
+    The buffer selected by the `-strparse` options of `openssl asn1parse`:
+    for each offset, relative to the buffer selected so far, the content
+    octets of the encoding starting there (the whole encoding for
+    sequences, sets and non-universal tags). The encoding is read directly
+    at the offset, nothing before it is parsed.
+
+    Returns:
+        memoryview | bytes: the buffer to dump, bytes when a constructed
+        OCTET STRING had to be joined
+    """
+    buf: memoryview | bytes = data
+    for offset in offsets:
+        if offset <= 0 or offset >= len(buf):
+            raise ValueError(f"'{offset}' is out of range")
+
+        tag_class, encoding_type, tag_number, header_length, content_length = (
+            parse_header(buf, offset)
+        )
+        content_offset = offset + header_length
+        universal = tag_class is TagClass.UNIVERSAL
+
+        if universal and tag_number in (1, 5, 6):
+            raise ValueError(f"Can't parse {ASN1PARSE_TAG_NAMES[tag_number]} type")
+
+        if encoding_type is EncodingType.PRIMITIVE:
+            assert content_length is not None
+            end = content_offset + content_length
+            if end > len(buf):
+                raise ValueError("Error parsing structure")
+            if not universal:
+                buf = buf[offset:end]
+            elif tag_number == 3:
+                buf = buf[content_offset + 1 : end]
+            else:
+                buf = buf[content_offset:end]
+        elif not universal or tag_number in (16, 17):
+            buf = buf[offset : find_encoding_end(buf, offset)]
+        elif tag_number == 4:
+            buf = parse_octetstring_buffer(
+                buf, content_offset, content_length, constructed=True
+            )
+        else:
+            raise ValueError(
+                f"Can't parse constructed {ASN1PARSE_TAG_NAMES[tag_number]} type"
+            )
+    return buf
+
+
+def dump_asn1parse(
+    data: memoryview | bytes,
+    out: TextIO,
+    offset: int = 0,
+    length: int | None = None,
+    dump: bool = False,
+    dump_limit: int | None = None,
+) -> None:
+    """
+    Writes the lines of `openssl asn1parse` for `data`, walking it with
+    `iter_headers`. Like openssl, offsets are relative to `offset`, the
+    walk covers `length` bytes (to the end of `data` by default) and the
+    end-of-contents octets get their own lines. `dump` and `dump_limit` are
+    the `-dump` and `-dlimit` options.
+
+    Content octets are written as latin-1 characters: an `out` with the
+    latin-1 encoding reproduces the bytes written by openssl.
+    """
+    if offset < 0 or offset >= len(data):
+        raise ValueError(f"offset '{offset}' is out of range")
+
+    if length is None or length > len(data) - offset:
+        length = len(data) - offset
+    data = data[offset : offset + length]
+    lines: List[str] = []
+    tag_names = ASN1PARSE_TAG_NAMES
+
+    for (
+        node_offset,
+        depth,
+        tag_class,
+        encoding_type,
+        tag_number,
+        header_length,
+        content_length,
+    ) in iter_headers(data, eoc=True):
+        if content_length is None:
+            line = f"{node_offset:5d}:d={depth:<2d} hl={header_length} l=inf  cons: "
+        elif encoding_type is EncodingType.PRIMITIVE:
+            line = f"{node_offset:5d}:d={depth:<2d} hl={header_length} l={content_length:4d} prim: "
+        else:
+            line = f"{node_offset:5d}:d={depth:<2d} hl={header_length} l={content_length:4d} cons: "
+
+        if tag_class is TagClass.UNIVERSAL:
+            name = tag_names[tag_number] if tag_number <= 30 else f"<ASN1 {tag_number}>"
+        elif tag_class is TagClass.CONTEXT_SPECIFIC:
+            name = f"cont [ {tag_number} ]"
+        elif tag_class is TagClass.APPLICATION:
+            name = f"appl [ {tag_number} ]"
+        else:
+            name = f"priv [ {tag_number} ] "
+        line = f"{line}{name:<18}"
+
+        if encoding_type is EncodingType.PRIMITIVE and tag_class is TagClass.UNIVERSAL:
+            start = node_offset + header_length
+            value = format_asn1parse_value(
+                tag_number, data[start : start + content_length], dump, dump_limit
+            )
+            if value.endswith("\n"):
+                line = f"{line}{value}"
+            else:
+                line = f"{line}{value}\n"
+        else:
+            line = f"{line}\n"
+
+        lines.append(line)
+        if len(lines) >= _LINES_PER_WRITE:
+            out.write("".join(lines))
+            lines.clear()
+
+    out.write("".join(lines))
@@ -0,0 +1,170 @@
+from binascii import b2a_base64
+from datetime import datetime
+from json.encoder import encode_basestring
+from typing import Any, List, TextIO
+from asn1decoder.asn1types import EncodingType, TagClass
+from asn1decoder.asn1parser import ASN1ParserError, iter_headers
+from asn1decoder.asn1values.bit_string import BitString
+from asn1decoder.asn1values.buffer import BUFFER_PARSERS
+
+# parts collected before each write to the output stream
+_PARTS_PER_WRITE = 16384
+
+# integers beyond this are written as strings, as most JSON readers would
+# round them to a double
+_MAX_SAFE_INTEGER = (1 << 53) - 1
+
+_CLASS_NAMES = {tag_class: f'"{tag_class.name}"' for tag_class in TagClass}
+
+
+def _content_text(content: bytes | memoryview, content_encoding: str) -> str:
+    if content_encoding == "hex":
+        return f'"{content.hex()}"'
+    return f'"{b2a_base64(content, newline=False).decode("ascii")}"'
+
+
+def format_value(value: Any, content_encoding: str = "base64") -> str:
+    """
+    The members of a node describing a decoded value, each preceded by a
+    comma. Octets are written with `content_encoding`, "base64" or "hex".
+    """
+    if value is None:
+        return ',"value":null'
+    if isinstance(value, int):
+        if -_MAX_SAFE_INTEGER <= value <= _MAX_SAFE_INTEGER:
+            return f',"value":{value}'
+        return f',"value":"{value}"'
+    if isinstance(value, str):
+        return f',"value":{encode_basestring(value)}'
+    if isinstance(value, datetime):
+        return f',"value":"{value.isoformat()}"'
+    if isinstance(value, BitString):
+        content = _content_text(value.content, content_encoding)
+        return f',"value":{content},"unused_bits":{value.unused_bits}'
+    if isinstance(value, (bytes, memoryview)):
+        return f',"value":{_content_text(value, content_encoding)}'
+    return f',"value":{encode_basestring(str(value))}'
+
+
+def export_json(
+    data: memoryview,
+    out: TextIO,
+    offset: int = 0,
+    length: int | None = None,
+    ndjson: bool = True,
+    values: bool = True,
+    content_encoding: str = "base64",
+    max_depth: int | None = None,
+) -> None:
+    """
+    Writes the encodings of `data` as JSON while walking them with
+    `iter_headers`: one line per top-level encoding with `ndjson`, otherwise
+    a single array. Nothing but the stack of open constructed encodings is
+    kept, output is written in large batches.
+
+    Every node has its offset, class, tag number, form, header length and
+    content length (null when indefinite). Constructed nodes have their
+    `children`, except those at `max_depth`, marked `truncated` instead. Primitives have the `value` decoded by the buffer parser of
+    their universal tag when `values` is set, otherwise (and for tags
+    without parser) the `content` octets in `content_encoding`, "base64" or
+    "hex". When decoding fails the content is written with the `error`.
+    """
+    if content_encoding not in ("base64", "hex"):
+        raise ValueError(
+            f"unknown content encoding {content_encoding!r}, expected 'base64' or 'hex'"
+        )
+
+    end = None if length is None else offset + length
+    parts: List[str] = []
+    # whether each open constructed encoding has children written already
+    open_nodes: List[bool] = []
+    records = 0
+    record_end = "\n" if ndjson else ""
+    parsers = BUFFER_PARSERS if values else {}
+
+    if not ndjson:
+        parts.append("[")
+
+    for (
+        node_offset,
+        depth,
+        tag_class,
+        encoding_type,
+        tag_number,
+        header_length,
+        content_length,
+    ) in iter_headers(data, offset, end, max_depth):
+        while len(open_nodes) > depth:
+            open_nodes.pop()
+            parts.append("]}")
+            if not open_nodes:
+                parts.append(record_end)
+
+        if open_nodes:
+            if open_nodes[-1]:
+                parts.append(",")
+            else:
+                open_nodes[-1] = True
+        else:
+            if records and not ndjson:
+                parts.append(",\n")
+            records += 1
+
+        node_length = "null" if content_length is None else content_length
+        if encoding_type is EncodingType.CONSTRUCTED and (
+            max_depth is not None and depth >= max_depth
+        ):
+            # content skipped by the walk, unlike an empty SEQUENCE or SET
+            parts.append(
+                f'{{"offset":{node_offset},"class":{_CLASS_NAMES[tag_class]},'
+                f'"tag":{tag_number},"constructed":true,'
+                f'"header_length":{header_length},"length":{node_length},'
+                f'"truncated":true}}'
+            )
+            if not open_nodes:
+                parts.append(record_end)
+        elif encoding_type is EncodingType.CONSTRUCTED:
+            parts.append(
+                f'{{"offset":{node_offset},"class":{_CLASS_NAMES[tag_class]},'
+                f'"tag":{tag_number},"constructed":true,'
+                f'"header_length":{header_length},"length":{node_length},'
+                f'"children":['
+            )
+            open_nodes.append(False)
+        else:
+            content_offset = node_offset + header_length
+            parser = (
+                parsers.get(tag_number) if tag_class is TagClass.UNIVERSAL else None
+            )
+            member = None
+            error = ""
+            if parser is not None:
+                try:
+                    value = parser(data, content_offset, content_length, False)
+                except ASN1ParserError as exc:
+                    error = f',"error":{encode_basestring(str(exc))}'
+                else:
+                    member = format_value(value, content_encoding)
+            if member is None:
+                content = data[content_offset : content_offset + content_length]
+                member = f'{error},"content":{_content_text(content, content_encoding)}'
+
+            parts.append(
+                f'{{"offset":{node_offset},"class":{_CLASS_NAMES[tag_class]},'
+                f'"tag":{tag_number},"constructed":false,'
+                f'"header_length":{header_length},"length":{node_length}'
+                f"{member}}}"
+            )
+            if not open_nodes:
+                parts.append(record_end)
+
+        if len(parts) >= _PARTS_PER_WRITE:
+            out.write("".join(parts))
+            parts.clear()
+
+    if open_nodes:
+        parts.append("]}" * len(open_nodes))
+        parts.append(record_end)
+    if not ndjson:
+        parts.append("]\n")
+    out.write("".join(parts))
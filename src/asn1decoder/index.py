@@ -0,0 +1,341 @@
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+from pathlib import Path
+from typing import Iterator, NamedTuple
+from asn1decoder.asn1types import ASN1Encoding, EncodingType, TagClass
+from asn1decoder.asn1parser import ASN1ParserError, iter_headers, parse_encoding
+
+INDEX_SUFFIX = ".asn1idx"
+
+_MAGIC = b"ASN1IDX\x00"
+_VERSION = 3
+
+# magic, version, max depth (-1: no limit), source size, source mtime (ns),
+# number of records, number of entries, offset of the record table
+_HEADER = struct.Struct("<8sH6xqqqqqq")
+
+# offset, content length (-1: indefinite), tag number, header length, depth,
+# identifier bits (class and form, as in the first identifier octet), padded
+# to a multiple of 8 octets so that the record table stays aligned
+_ENTRY = struct.Struct("<QqQIIB7x")
+
+# entries packed before each write to the index file
+_ENTRIES_PER_WRITE = 65536
+
+
+class IndexFormatError(ASN1ParserError):
+    pass
+
+
+class StaleIndexError(ASN1ParserError):
+    pass
+
+
+class IndexEntry(NamedTuple):
+    offset: int
+    depth: int
+    tag_class: TagClass
+    encoding_type: EncodingType
+    tag_number: int
+    header_length: int
+    content_length: int | None
+
+
+def index_path_for(path: Path) -> Path:
+    return path.with_name(path.name + INDEX_SUFFIX)
+
+
+def _write_index(
+    path: Path, index_path: Path, stat: os.stat_result, max_depth: int | None
+) -> None:
+    records = array("Q")
+    entries = 0
+
+    with open(path, "rb") as source, open(index_path, "wb") as out:
+        out.write(bytes(_HEADER.size))
+        try:
+            mapped = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            mapped = None
+
+        if mapped is not None:
+            data = memoryview(mapped)
+            chunk = bytearray(_ENTRY.size * _ENTRIES_PER_WRITE)
+            pack_into = _ENTRY.pack_into
+            position = 0
+            try:
+                for (
+                    offset,
+                    depth,
+                    tag_class,
+                    encoding_type,
+                    tag_number,
+                    header_length,
+                    content_length,
+                ) in iter_headers(data, max_depth=max_depth):
+                    if depth == 0:
+                        records.append(entries)
+                    try:
+                        pack_into(
+                            chunk,
+                            position,
+                            offset,
+                            -1 if content_length is None else content_length,
+                            tag_number,
+                            header_length,
+                            depth,
+                            tag_class.value << 6 | encoding_type.value << 5,
+                        )
+                    except struct.error:
+                        raise IndexFormatError(
+                            f"encoding at offset {offset} does not fit in an "
+                            f"index entry (tag number {tag_number})."
+                        )
+                    entries += 1
+                    position += _ENTRY.size
+                    if position == len(chunk):
+                        out.write(chunk)
+                        position = 0
+                out.write(chunk[:position])
+            finally:
+                data.release()
+                mapped.close()
+
+        records_offset = _HEADER.size + entries * _ENTRY.size
+        # little-endian like the rest of the index, whatever the host
+        if sys.byteorder != "little":
+            records.byteswap()
+        out.write(records.tobytes())
+        out.seek(0)
+        out.write(
+            _HEADER.pack(
+                _MAGIC,
+                _VERSION,
+                -1 if max_depth is None else max_depth,
+                stat.st_size,
+                stat.st_mtime_ns,
+                len(records),
+                entries,
+                records_offset,
+            )
+        )
+
+
+def build_index(
+    path: Path, index_path: Path | None = None, max_depth: int = 0
+) -> Path:
+    """
+    Writes the sidecar index of `path`: an entry for each top-level encoding
+    and for the encodings nested up to `max_depth` (None for all of them),
+    in document order, followed by the table of the entries of the
+    top-level encodings. The index records the size and modification time
+    of `path` so that a stale index can be detected.
+
+    Returns:
+        Path: the path of the index, next to `path` by default
+    """
+    path = Path(path)
+    index_path = index_path_for(path) if index_path is None else Path(index_path)
+    stat = os.stat(path)
+
+    # written aside and moved in place once complete, so that a failed build
+    # leaves no partial index behind
+    temporary = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+    try:
+        _write_index(path, temporary, stat, max_depth)
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
+    os.replace(temporary, index_path)
+    return index_path
+
+
+class _UInt64Column:
+    # little-endian unsigned 64-bit integers `stride` octets apart, as a
+    # sequence for indexing and bisect
+    def __init__(self, view: memoryview, stride: int, count: int) -> None:
+        self.view = view
+        self.stride = stride
+        self.count = count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, i: int) -> int:
+        if i < 0:
+            i += self.count
+        if not 0 <= i < self.count:
+            raise IndexError(f"index {i} out of range")
+        start = i * self.stride
+        return int.from_bytes(self.view[start : start + 8], "little")
+
+
+class ASN1Index:
+    """
+    A memory-mapped sidecar index written by `build_index`. Records are the
+    top-level encodings, looked up in constant time by number and in
+    logarithmic time by offset. Entries are only unpacked when read.
+    """
+
+    def __init__(self, index_path: Path) -> None:
+        self.index_path = Path(index_path)
+        with open(self.index_path, "rb") as f:
+            try:
+                self._mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise IndexFormatError(f"{self.index_path} is empty.")
+
+        if len(self._mapped) < _HEADER.size:
+            self._mapped.close()
+            raise IndexFormatError(f"{self.index_path} is truncated.")
+        (
+            magic,
+            version,
+            max_depth,
+            self.source_size,
+            self.source_mtime_ns,
+            self.record_count,
+            self.entry_count,
+            records_offset,
+        ) = _HEADER.unpack_from(self._mapped)
+        if magic != _MAGIC or version != _VERSION:
+            self._mapped.close()
+            raise IndexFormatError(f"{self.index_path} is not an index.")
+        if len(self._mapped) != records_offset + self.record_count * 8:
+            self._mapped.close()
+            raise IndexFormatError(f"{self.index_path} is truncated.")
+
+        self.max_depth = None if max_depth < 0 else max_depth
+        self._view = memoryview(self._mapped)
+        self._entries = self._view[_HEADER.size : records_offset]
+        self._records_view = self._view[records_offset:]
+        self._records = _UInt64Column(self._records_view, 8, self.record_count)
+        self._offsets = _UInt64Column(self._entries, _ENTRY.size, self.entry_count)
+
+    def close(self) -> None:
+        self._entries.release()
+        self._records_view.release()
+        self._view.release()
+        self._mapped.close()
+
+    def __enter__(self) -> "ASN1Index":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.record_count
+
+    def is_fresh(self, path: Path) -> bool:
+        stat = os.stat(path)
+        return (
+            stat.st_size == self.source_size
+            and stat.st_mtime_ns == self.source_mtime_ns
+        )
+
+    def entry(self, i: int) -> IndexEntry:
+        if not 0 <= i < self.entry_count:
+            raise IndexError(f"entry {i} out of range")
+
+        offset, content_length, tag_number, header_length, depth, bits = (
+            _ENTRY.unpack_from(self._entries, i * _ENTRY.size)
+        )
+        return IndexEntry(
+            offset,
+            depth,
+            TagClass(bits >> 6),
+            EncodingType(bits >> 5 & 1),
+            tag_number,
+            header_length,
+            None if content_length < 0 else content_length,
+        )
+
+    def record(self, n: int) -> IndexEntry:
+        """
+        Returns:
+            IndexEntry: the entry of the top-level encoding number `n`
+        """
+        return self.entry(self._records[n])
+
+    def record_entries(self, n: int) -> Iterator[IndexEntry]:
+        """
+        Returns:
+            Iterator: the entries of record `n` and of its indexed encodings
+        """
+        start = self._records[n]
+        end = (
+            self._records[n + 1] if n + 1 < self.record_count else self.entry_count
+        )
+        for i in range(start, end):
+            yield self.entry(i)
+
+    def find(self, offset: int) -> IndexEntry | None:
+        """
+        Returns:
+            IndexEntry | None: the last indexed encoding starting at or
+            before `offset`, None before the first one
+        """
+        i = bisect_right(self._offsets, offset)
+        return self.entry(i - 1) if i else None
+
+    def record_number(self, offset: int) -> int | None:
+        """
+        Returns:
+            int | None: the number of the last record starting at or before
+            `offset`, None before the first one
+        """
+        i = bisect_right(self._offsets, offset)
+        if not i:
+            return None
+        return bisect_right(self._records, i - 1) - 1
+
+    def parse_record(self, data: memoryview, n: int) -> ASN1Encoding:
+        """
+        Parses record `n` of `data`, reading only the bytes of that record.
+        """
+        return parse_encoding(data, self.record(n).offset)
+
+
+def open_index(
+    path: Path, index_path: Path | None = None, max_depth: int = 0
+) -> ASN1Index:
+    """
+    Opens the index of `path`, building it first when it is missing, stale
+    or shallower than `max_depth`.
+    """
+    path = Path(path)
+    if index_path is None:
+        index_path = index_path_for(path)
+
+    try:
+        index = ASN1Index(index_path)
+    except (FileNotFoundError, IndexFormatError):
+        pass
+    else:
+        deep_enough = index.max_depth is None or (
+            max_depth is not None and index.max_depth >= max_depth
+        )
+        if deep_enough and index.is_fresh(path):
+            return index
+        index.close()
+
+    build_index(path, index_path, max_depth)
+    return ASN1Index(index_path)
+
+
+def load_index(path: Path, index_path: Path | None = None) -> ASN1Index:
+    """
+    Opens an existing index of `path`, raising StaleIndexError when `path`
+    changed since the index was built.
+    """
+    path = Path(path)
+    index = ASN1Index(index_path_for(path) if index_path is None else index_path)
+    if not index.is_fresh(path):
+        index.close()
+        raise StaleIndexError(f"{index.index_path} is older than {path}.")
+    return index
@@ -0,0 +1,213 @@
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+from asn1decoder.asn1types import (
+    ASN1Encoding,
+    EncodingType,
+    IdentifierComponent,
+    TagClass,
+)
+from asn1decoder.asn1parser import (
+    ASN1ParserError,
+    iter_headers,
+    make_encoding_parser,
+    parse_encoding,
+)
+from asn1decoder.asn1values.registry import decode_value
+
+Tag = Tuple[TagClass, int]
+HeaderTuple = Tuple[int, int, TagClass, EncodingType, int, int, int | None]
+
+# (offset, depth, tag_class, tag_number)
+NodeStartHook = Callable[[int, int, TagClass, int], None]
+# (offset, depth, tag_class, tag_number, length of the whole encoding)
+NodeEndHook = Callable[[int, int, TagClass, int, int], None]
+# (exception, offset of the encoding being parsed or decoded)
+ErrorHook = Callable[[ASN1ParserError, int], None]
+
+
+class Instrumentation:
+    """
+    Counters and optional callbacks filled by the instrumented code paths
+    returned by `select_parse_encoding`, `select_decode_value` and
+    `select_iter_headers`. Without an instrumentation those functions return
+    the plain `parse_encoding`, `decode_value` and `iter_headers`, so that
+    disabled instrumentation costs nothing once the function is selected.
+    """
+
+    def __init__(
+        self,
+        on_node_start: NodeStartHook | None = None,
+        on_node_end: NodeEndHook | None = None,
+        on_error: ErrorHook | None = None,
+        clock: Callable[[], int] = time.perf_counter_ns,
+        max_error_offsets: int | None = None,
+    ) -> None:
+        self.on_node_start = on_node_start
+        self.on_node_end = on_node_end
+        self.on_error = on_error
+        self.clock = clock
+        self.max_error_offsets = max_error_offsets
+
+        # encodings parsed per tag
+        self.nodes: Counter[Tag] = Counter()
+        # value decoding calls and time in nanoseconds per tag
+        self.decode_calls: Counter[Tag] = Counter()
+        self.decode_ns: Counter[Tag] = Counter()
+        # content octets handed to value decoders
+        self.bytes_materialized = 0
+        # errors per exception class, and (class name, offset) in order for
+        # the first `max_error_offsets` ones
+        self.errors: Counter[str] = Counter()
+        self.error_offsets: List[Tuple[str, int]] = []
+
+    def record_error(self, exc: ASN1ParserError, offset: int) -> None:
+        name = type(exc).__name__
+        self.errors[name] += 1
+        if (
+            self.max_error_offsets is None
+            or len(self.error_offsets) < self.max_error_offsets
+        ):
+            self.error_offsets.append((name, offset))
+        if self.on_error is not None:
+            self.on_error(exc, offset)
+
+    def slowest_tags(self, n: int = 10) -> List[Tuple[Tag, int]]:
+        """
+        Returns:
+            List: the `n` tags with the largest total decoding time, in
+            nanoseconds
+        """
+        return self.decode_ns.most_common(n)
+
+    def reset(self) -> None:
+        self.nodes.clear()
+        self.decode_calls.clear()
+        self.decode_ns.clear()
+        self.bytes_materialized = 0
+        self.errors.clear()
+        self.error_offsets.clear()
+
+
+def select_parse_encoding(
+    instrumentation: Instrumentation | None,
+) -> Callable[[memoryview, int], ASN1Encoding]:
+    """
+    Returns:
+        Callable: `parse_encoding`, or an equivalent parser reporting to
+        `instrumentation` each node, its tag and the errors
+    """
+    if instrumentation is None:
+        return parse_encoding
+
+    nodes = instrumentation.nodes
+    on_node_start = instrumentation.on_node_start
+    on_node_end = instrumentation.on_node_end
+
+    def on_start(
+        offset: int, depth: int, identifier: IdentifierComponent
+    ) -> None:
+        tag_class = identifier.tag_class
+        tag_number = identifier.tag_number
+        nodes[(tag_class, tag_number)] += 1
+        if on_node_start is not None:
+            on_node_start(offset, depth, tag_class, tag_number)
+
+    on_end = None
+    if on_node_end is not None:
+
+        def on_end(
+            offset: int, depth: int, identifier: IdentifierComponent, length: int
+        ) -> None:
+            on_node_end(
+                offset, depth, identifier.tag_class, identifier.tag_number, length
+            )
+
+    return make_encoding_parser(on_start, on_end, instrumentation.record_error)
+
+
+def select_decode_value(
+    instrumentation: Instrumentation | None,
+) -> Callable[..., Any]:
+    """
+    Returns:
+        Callable: `decode_value`, or a wrapper timing each call per tag and
+        counting the content octets decoded and the errors
+    """
+    if instrumentation is None:
+        return decode_value
+
+    clock = instrumentation.clock
+    decode_calls = instrumentation.decode_calls
+    decode_ns = instrumentation.decode_ns
+
+    def instrumented_decode_value(
+        encoding: ASN1Encoding, as_type: int | None = None
+    ) -> Any:
+        identifier = encoding.identifier_component
+        tag = (identifier.tag_class, identifier.tag_number)
+        start = clock()
+        try:
+            value = decode_value(encoding, as_type)
+        except ASN1ParserError as exc:
+            instrumentation.record_error(exc, encoding.header.offset)
+            raise
+        finally:
+            decode_ns[tag] += clock() - start
+            decode_calls[tag] += 1
+        content_component = encoding.content_component
+        if content_component is not None:
+            instrumentation.bytes_materialized += content_component.header.length
+        return value
+
+    return instrumented_decode_value
+
+
+def select_iter_headers(
+    instrumentation: Instrumentation | None,
+) -> Callable[..., Iterator[HeaderTuple]]:
+    """
+    Returns:
+        Callable: `iter_headers`, or a wrapper counting the nodes per tag,
+        calling the node start hook and recording the errors
+    """
+    if instrumentation is None:
+        return iter_headers
+
+    nodes = instrumentation.nodes
+    on_node_start = instrumentation.on_node_start
+
+    def instrumented_iter_headers(
+        data: memoryview, offset: int = 0, *args: Any, **kwargs: Any
+    ) -> Iterator[HeaderTuple]:
+        node_offset = offset
+        try:
+            for header in iter_headers(data, offset, *args, **kwargs):
+                node_offset, depth, tag_class, _, tag_number, _, _ = header
+                nodes[(tag_class, tag_number)] += 1
+                if on_node_start is not None:
+                    on_node_start(node_offset, depth, tag_class, tag_number)
+                yield header
+        except ASN1ParserError as exc:
+            instrumentation.record_error(exc, node_offset)
+            raise
+
+    return instrumented_iter_headers
+
+
+def per_tag_report(
+    instrumentation: Instrumentation,
+) -> Dict[Tag, Tuple[int, int, int]]:
+    """
+    Returns:
+        Dict: (nodes, decoding calls, decoding time in nanoseconds) per tag
+    """
+    tags = set(instrumentation.nodes) | set(instrumentation.decode_calls)
+    return {
+        tag: (
+            instrumentation.nodes[tag],
+            instrumentation.decode_calls[tag],
+            instrumentation.decode_ns[tag],
+        )
+        for tag in tags
+    }
@@ -1,5 +1,15 @@
 import logging
-from asn1decoder.asn1parser import parse_encoding, ASN1Encoding
+import mmap
+import sys
+from contextlib import contextmanager
+from enum import Enum
+from typing import Annotated, Iterator, List, TextIO
+from asn1decoder.dump import dump as dump_encodings, dump_asn1parse, strparse
+from asn1decoder.export import export_json
+from asn1decoder.index import ASN1Index, build_index
+from asn1decoder.sqlite_export import export_sqlite
+from asn1decoder.memory import check_memory_report, memory_report
+from asn1decoder.asn1parser import parse_encoding
 import typer
 from pathlib import Path
 
@@ -11,22 +21,228 @@ logging.basicConfig(
     format="%(levelname)s %(message)s",
 )
 
+# size of the buffer of the output stream
+OUTPUT_BUFFER_SIZE = 1 << 20
 
-def dump_encoding(encoding: ASN1Encoding, level: int = 0):
-    print(f"{' ' * level}{encoding}")
 
-    for inner_encoding in encoding.inner_encodings or []:
-        dump_encoding(encoding=inner_encoding, level=level + 1)
+@contextmanager
+def open_data(path: Path) -> Iterator[memoryview]:
+    """
+    Maps the file in memory instead of reading it, so only the pages that
+    are walked are loaded.
+    """
+    with open(path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            yield memoryview(b"")
+            return
+
+        data = memoryview(mapped)
+        try:
+            yield data
+        finally:
+            data.release()
+            try:
+                mapped.close()
+            except BufferError:
+                # views still referenced (e.g. by a traceback), the mapping
+                # goes away with them
+                pass
+
+
+@contextmanager
+def open_output(encoding: str = "utf-8") -> Iterator[TextIO]:
+    out = open(
+        sys.stdout.fileno(),
+        "w",
+        buffering=OUTPUT_BUFFER_SIZE,
+        encoding=encoding,
+        closefd=False,
+    )
+    try:
+        yield out
+    finally:
+        out.flush()
+
+
+class DumpFormat(str, Enum):
+    tree = "tree"
+    asn1parse = "asn1parse"
 
 
 @app.command()
-def dump(path: Path):
-    with open(path, "rb") as f:
-        data = f.read()
+def dump(
+    path: Path,
+    max_depth: Annotated[
+        int | None, typer.Option(help="Do not show encodings deeper than this.")
+    ] = None,
+    max_content: Annotated[
+        int | None,
+        typer.Option(help="Show at most this many content octets, in hex."),
+    ] = None,
+    offset: Annotated[
+        int, typer.Option(help="Start at the encoding at this offset.")
+    ] = 0,
+    length: Annotated[
+        int | None, typer.Option(help="Only dump encodings in this many bytes.")
+    ] = None,
+    format: Annotated[
+        DumpFormat,
+        typer.Option(help="asn1parse writes the lines of `openssl asn1parse`."),
+    ] = DumpFormat.tree,
+    strparse_offsets: Annotated[
+        List[int] | None,
+        typer.Option(
+            "--strparse",
+            help="asn1parse format: dump the content of the encoding at this offset.",
+        ),
+    ] = None,
+    hexdump: Annotated[
+        bool, typer.Option(help="asn1parse format: hex dump unknown content.")
+    ] = False,
+    dlimit: Annotated[
+        int | None,
+        typer.Option(help="asn1parse format: hex dump at most this many octets."),
+    ] = None,
+):
+    if format is DumpFormat.asn1parse:
+        # latin-1 writes the content octets unchanged, as openssl does
+        with open_data(path) as data, open_output("latin-1") as out:
+            dump_asn1parse(
+                strparse(data, strparse_offsets or ()),
+                out,
+                offset=offset,
+                length=length,
+                dump=hexdump or dlimit is not None,
+                dump_limit=dlimit,
+            )
+        return
+
+    with open_data(path) as data, open_output() as out:
+        dump_encodings(
+            data,
+            out,
+            offset=offset,
+            length=length,
+            max_depth=max_depth,
+            max_content=max_content,
+        )
+
+
+class ExportFormat(str, Enum):
+    ndjson = "ndjson"
+    json = "json"
+
+
+class ExportContent(str, Enum):
+    value = "value"
+    base64 = "base64"
+    hex = "hex"
 
-    encoding = parse_encoding(data=memoryview(data))
 
-    dump_encoding(encoding)
+@app.command()
+def export(
+    path: Path,
+    format: Annotated[
+        ExportFormat,
+        typer.Option(help="ndjson writes one line per top-level encoding."),
+    ] = ExportFormat.ndjson,
+    content: Annotated[
+        ExportContent,
+        typer.Option(
+            help="Write decoded values (content in base64 when not decodable) "
+            "or the content octets of primitives."
+        ),
+    ] = ExportContent.value,
+    max_depth: Annotated[
+        int | None, typer.Option(help="Do not export encodings deeper than this.")
+    ] = None,
+    offset: Annotated[
+        int, typer.Option(help="Start at the encoding at this offset.")
+    ] = 0,
+    length: Annotated[
+        int | None, typer.Option(help="Only export encodings in this many bytes.")
+    ] = None,
+):
+    with open_data(path) as data, open_output() as out:
+        export_json(
+            data,
+            out,
+            offset=offset,
+            length=length,
+            ndjson=format is ExportFormat.ndjson,
+            values=content is ExportContent.value,
+            content_encoding="hex" if content is ExportContent.hex else "base64",
+            max_depth=max_depth,
+        )
+
+
+@app.command()
+def index(
+    path: Path,
+    max_depth: Annotated[
+        int,
+        typer.Option(help="Index the encodings nested up to this depth, -1 for all."),
+    ] = 0,
+    output: Annotated[
+        Path | None, typer.Option(help="Path of the index, PATH.asn1idx by default.")
+    ] = None,
+):
+    index_path = build_index(path, output, None if max_depth < 0 else max_depth)
+    with ASN1Index(index_path) as built:
+        typer.echo(
+            f"{index_path}: {len(built)} records, {built.entry_count} entries"
+        )
+
+
+@app.command()
+def sqlite(
+    paths: List[Path],
+    database: Annotated[
+        Path, typer.Option(help="SQLite database, created when missing.")
+    ],
+    values: Annotated[
+        bool, typer.Option(help="Also load the decoded values of primitives.")
+    ] = False,
+    max_depth: Annotated[
+        int | None, typer.Option(help="Do not load encodings deeper than this.")
+    ] = None,
+):
+    count = export_sqlite(paths, database, values=values, max_depth=max_depth)
+    typer.echo(f"{database}: {count} nodes from {len(paths)} files")
+
+
+@app.command()
+def memory(
+    path: Path,
+    offset: Annotated[
+        int, typer.Option(help="Parse the encoding at this offset.")
+    ] = 0,
+    trace: Annotated[
+        bool,
+        typer.Option(help="Compare the report with the memory traced by tracemalloc."),
+    ] = False,
+):
+    with open_data(path) as data:
+        if trace:
+            check = check_memory_report(data, offset)
+            report = check.report
+        else:
+            report = memory_report(parse_encoding(data, offset))
+
+        typer.echo(f"nodes: {report.nodes}")
+        typer.echo(f"owned bytes: {report.owned_bytes}")
+        typer.echo(f"viewed bytes: {report.viewed_bytes}")
+        if trace:
+            typer.echo(f"traced bytes: {check.traced_bytes} (ratio {check.ratio:.3f})")
+        for name, usage in sorted(report.by_type.items()):
+            typer.echo(f"  {name}: {usage.count} objects, {usage.bytes} bytes")
+        for (tag_class, tag_number), usage in sorted(report.by_tag.items()):
+            typer.echo(
+                f"  {tag_class.name} {tag_number}: "
+                f"{usage.count} nodes, {usage.bytes} bytes"
+            )
 
 
 if __name__ == "__main__":
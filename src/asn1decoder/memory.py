@@ -0,0 +1,151 @@
+import sys
+import tracemalloc
+from collections import defaultdict
+from typing import Any, Dict, List, NamedTuple, Set, Tuple
+from asn1decoder.asn1types import ASN1Encoding, TagClass
+from asn1decoder.asn1parser import parse_encoding
+
+Tag = Tuple[TagClass, int]
+
+
+class MemoryUsage(NamedTuple):
+    count: int
+    bytes: int
+
+
+class MemoryReport(NamedTuple):
+    nodes: int
+    # bytes of the objects of the tree
+    owned_bytes: int
+    # bytes of the source buffer referenced by memoryviews, not owned
+    viewed_bytes: int
+    by_type: Dict[str, MemoryUsage]
+    by_tag: Dict[Tag, MemoryUsage]
+
+
+class MemoryCheck(NamedTuple):
+    report: MemoryReport
+    # bytes allocated by parse_encoding according to tracemalloc
+    traced_bytes: int
+
+    @property
+    def ratio(self) -> float:
+        if not self.traced_bytes:
+            return 1.0
+        return self.report.owned_bytes / self.traced_bytes
+
+
+def _add(seen: Set[int], by_type: Dict[str, List[int]], obj: Any) -> int:
+    # counts `obj` once, returns its size or 0 when it was already counted
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    usage = by_type[type(obj).__name__]
+    usage[0] += 1
+    usage[1] += size
+    return size
+
+
+def _add_int(
+    seen: Set[int], by_type: Dict[str, List[int]], value: int | None
+) -> int:
+    # small integers are shared by the interpreter
+    if value is None or -5 <= value <= 256:
+        return 0
+    return _add(seen, by_type, value)
+
+
+def memory_report(tree: ASN1Encoding) -> MemoryReport:
+    """
+    Accounts for the memory held by `tree`, walking it iteratively: the
+    encodings, their components and headers, the lists of children, the
+    memoryviews of the primitive contents, materialized `bytes` contents,
+    the integers not shared by the interpreter and the cached values.
+    Objects referenced twice are counted once. The octets of the source
+    buffer seen through memoryviews are reported apart, as `viewed_bytes`.
+
+    Returns:
+        MemoryReport: the totals, per object type and per tag
+    """
+    seen: Set[int] = set()
+    by_type: Dict[str, List[int]] = defaultdict(lambda: [0, 0])
+    by_tag: Dict[Tag, List[int]] = defaultdict(lambda: [0, 0])
+    nodes = 0
+    viewed_bytes = 0
+    # buffers whose octets were counted as viewed
+    viewed: Set[Tuple[int, int, int]] = set()
+
+    stack = [tree]
+    while stack:
+        encoding = stack.pop()
+        nodes += 1
+        size = _add(seen, by_type, encoding)
+
+        identifier = encoding.identifier_component
+        length = encoding.length_component
+        content = encoding.content_component
+        components = [identifier, length, encoding.eoc_component, content]
+        for component in components:
+            if component is None:
+                continue
+            size += _add(seen, by_type, component)
+            size += _add(seen, by_type, component.header)
+            size += _add_int(seen, by_type, component.header.offset)
+            size += _add_int(seen, by_type, component.header.length)
+        size += _add(seen, by_type, encoding.header)
+        size += _add_int(seen, by_type, encoding.header.offset)
+        size += _add_int(seen, by_type, encoding.header.length)
+        size += _add_int(seen, by_type, identifier.tag_number)
+        size += _add_int(seen, by_type, length.content_length)
+
+        if content is not None:
+            inner = content.content
+            if isinstance(inner, list):
+                size += _add(seen, by_type, inner)
+                stack.extend(reversed(inner))
+            elif isinstance(inner, memoryview):
+                size += _add(seen, by_type, inner)
+                view = (id(inner.obj), content.header.offset, inner.nbytes)
+                if view not in viewed:
+                    viewed.add(view)
+                    viewed_bytes += inner.nbytes
+            else:
+                # bytes or any other object holding its own octets
+                size += _add(seen, by_type, inner)
+
+        cached = encoding._value_cache
+        if cached is not None:
+            size += _add(seen, by_type, cached)
+            size += _add(seen, by_type, cached[1])
+
+        usage = by_tag[(identifier.tag_class, identifier.tag_number)]
+        usage[0] += 1
+        usage[1] += size
+
+    return MemoryReport(
+        nodes=nodes,
+        owned_bytes=sum(usage[1] for usage in by_type.values()),
+        viewed_bytes=viewed_bytes,
+        by_type={name: MemoryUsage(*usage) for name, usage in by_type.items()},
+        by_tag={tag: MemoryUsage(*usage) for tag, usage in by_tag.items()},
+    )
+
+
+def check_memory_report(data: memoryview, offset: int = 0) -> MemoryCheck:
+    """
+    Parses the encoding at `offset` under `tracemalloc` and returns the
+    `memory_report` of the tree with the memory actually allocated, to check
+    the report against reality. The ratio of the two is close to 1.
+    """
+    started = tracemalloc.is_tracing()
+    if not started:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        tree = parse_encoding(data, offset)
+        traced = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        if not started:
+            tracemalloc.stop()
+    return MemoryCheck(memory_report(tree), traced)
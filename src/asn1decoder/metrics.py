@@ -0,0 +1,233 @@
+import json
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from typing import Any, Dict, List, NamedTuple, Sequence, Tuple
+from asn1decoder.asn1types import ASN1Encoding, TagClass
+from asn1decoder.asn1parser import ASN1ParserError
+from asn1decoder.instrumentation import (
+    Instrumentation,
+    select_decode_value,
+    select_parse_encoding,
+)
+
+Tag = Tuple[TagClass, int]
+
+# upper bounds, in seconds, of the parse latency histogram buckets
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+    0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)  # fmt: skip
+
+
+class _Shard:
+    # the counters of one thread, only ever updated by that thread
+
+    def __init__(self, buckets: int) -> None:
+        self.documents = 0
+        self.bytes = 0
+        self.instrumentation = Instrumentation(max_error_offsets=0)
+        self.parse_encoding = select_parse_encoding(self.instrumentation)
+        self.decode_value = select_decode_value(self.instrumentation)
+        # last bucket for the latencies above the largest bound
+        self.latency_buckets = [0] * (buckets + 1)
+        self.latency_sum = 0.0
+
+
+class MetricsSnapshot(NamedTuple):
+    documents: int
+    bytes: int
+    nodes: int
+    tags: Dict[Tag, int]
+    errors: Dict[str, int]
+    buckets: Tuple[float, ...]
+    # cumulative counts, one per bucket then +Inf
+    latency_buckets: List[int]
+    latency_sum: float
+    latency_count: int
+
+
+class MetricsRegistry:
+    """
+    Cumulative counters of a long-running decoder: documents, bytes and
+    nodes parsed, nodes per tag, errors per exception class and a histogram
+    of the parse latency.
+
+    Each thread updates its own shard without locking, the shards are merged
+    when the metrics are read. Parsing and decoding go through the
+    instrumented code paths of `asn1decoder.instrumentation`.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        if list(buckets) != sorted(buckets):
+            raise ValueError("bucket bounds shall be sorted")
+
+        self.buckets = tuple(buckets)
+        self._local = threading.local()
+        self._shards: List[_Shard] = []
+        self._lock = threading.Lock()
+
+    def _shard(self) -> _Shard:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = _Shard(len(self.buckets))
+            with self._lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+            return shard
+
+    def parse_encoding(self, data: memoryview, offset: int = 0) -> ASN1Encoding:
+        """
+        `parse_encoding`, counting the document, its bytes, nodes, latency
+        and errors.
+        """
+        shard = self._shard()
+        start = time.perf_counter()
+        try:
+            encoding = shard.parse_encoding(data, offset)
+        finally:
+            elapsed = time.perf_counter() - start
+            shard.latency_buckets[bisect_left(self.buckets, elapsed)] += 1
+            shard.latency_sum += elapsed
+
+        shard.documents += 1
+        shard.bytes += encoding.header.length
+        return encoding
+
+    def decode_value(
+        self, encoding: ASN1Encoding, as_type: int | None = None
+    ) -> Any:
+        """
+        `decode_value`, counting the errors of the value parsers.
+        """
+        return self._shard().decode_value(encoding, as_type)
+
+    def record_error(self, exc: ASN1ParserError, offset: int = 0) -> None:
+        """
+        Counts an error raised outside of `parse_encoding` and `decode_value`.
+        """
+        self._shard().instrumentation.record_error(exc, offset)
+
+    def snapshot(self) -> MetricsSnapshot:
+        """
+        Returns:
+            MetricsSnapshot: the counters of all the threads merged
+        """
+        with self._lock:
+            shards = list(self._shards)
+
+        documents = 0
+        size = 0
+        tags: Counter[Tag] = Counter()
+        errors: Counter[str] = Counter()
+        counts = [0] * (len(self.buckets) + 1)
+        latency_sum = 0.0
+        for shard in shards:
+            documents += shard.documents
+            size += shard.bytes
+            # dict() copies in one step, while the owning thread may update
+            tags.update(dict(shard.instrumentation.nodes))
+            errors.update(dict(shard.instrumentation.errors))
+            for i, count in enumerate(list(shard.latency_buckets)):
+                counts[i] += count
+            latency_sum += shard.latency_sum
+
+        cumulative = []
+        total = 0
+        for count in counts:
+            total += count
+            cumulative.append(total)
+
+        return MetricsSnapshot(
+            documents=documents,
+            bytes=size,
+            nodes=sum(tags.values()),
+            tags=dict(tags),
+            errors=dict(errors),
+            buckets=self.buckets,
+            latency_buckets=cumulative,
+            latency_sum=latency_sum,
+            latency_count=total,
+        )
+
+    def reset(self) -> None:
+        with self._lock:
+            self._shards.clear()
+        # threads get a new shard on their next update
+        self._local = threading.local()
+
+    def to_prometheus(self, namespace: str = "asn1decoder") -> str:
+        """
+        Returns:
+            str: the metrics in the Prometheus text exposition format
+        """
+        snapshot = self.snapshot()
+        lines: List[str] = []
+
+        def metric(name: str, kind: str, help_text: str) -> str:
+            name = f"{namespace}_{name}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            return name
+
+        name = metric("documents_parsed_total", "counter", "Documents parsed.")
+        lines.append(f"{name} {snapshot.documents}")
+        name = metric("bytes_parsed_total", "counter", "Bytes of documents parsed.")
+        lines.append(f"{name} {snapshot.bytes}")
+        name = metric("nodes_parsed_total", "counter", "Encodings parsed.")
+        lines.append(f"{name} {snapshot.nodes}")
+
+        name = metric("tag_nodes_total", "counter", "Encodings parsed per tag.")
+        for (tag_class, tag_number), count in sorted(snapshot.tags.items()):
+            lines.append(
+                f'{name}{{class="{tag_class.name}",tag="{tag_number}"}} {count}'
+            )
+
+        name = metric("errors_total", "counter", "Errors per exception class.")
+        for exception, count in sorted(snapshot.errors.items()):
+            lines.append(f'{name}{{exception="{exception}"}} {count}')
+
+        name = metric("parse_duration_seconds", "histogram", "Parse latency.")
+        bounds = [repr(bound) for bound in snapshot.buckets] + ["+Inf"]
+        for bound, count in zip(bounds, snapshot.latency_buckets):
+            lines.append(f'{name}_bucket{{le="{bound}"}} {count}')
+        lines.append(f"{name}_sum {snapshot.latency_sum!r}")
+        lines.append(f"{name}_count {snapshot.latency_count}")
+
+        return "\n".join(lines) + "\n"
+
+    def to_json(self) -> str:
+        """
+        Returns:
+            str: the metrics as a JSON object, tags keyed "CLASS:number"
+        """
+        snapshot = self.snapshot()
+        return json.dumps(
+            {
+                "documents": snapshot.documents,
+                "bytes": snapshot.bytes,
+                "nodes": snapshot.nodes,
+                "tags": {
+                    f"{tag_class.name}:{tag_number}": count
+                    for (tag_class, tag_number), count in sorted(
+                        snapshot.tags.items()
+                    )
+                },
+                "errors": dict(sorted(snapshot.errors.items())),
+                "parse_duration_seconds": {
+                    "buckets": dict(
+                        zip(
+                            [repr(bound) for bound in snapshot.buckets] + ["+Inf"],
+                            snapshot.latency_buckets,
+                        )
+                    ),
+                    "sum": snapshot.latency_sum,
+                    "count": snapshot.latency_count,
+                },
+            }
+        )
+
+
+default_registry = MetricsRegistry()
@@ -0,0 +1,25 @@
+from asn1decoder.schema.parser import (
+    parse_module,
+    Module,
+    TypeNode,
+    Component,
+    Tag,
+    SchemaError,
+)
+from asn1decoder.schema.codegen import generate_decoder_source
+from asn1decoder.schema.compiler import compile_schema, default_cache_dir
+from asn1decoder.schema.runtime import Record, SchemaDecodeError
+
+__all__ = [
+    "parse_module",
+    "Module",
+    "TypeNode",
+    "Component",
+    "Tag",
+    "SchemaError",
+    "generate_decoder_source",
+    "compile_schema",
+    "default_cache_dir",
+    "Record",
+    "SchemaDecodeError",
+]
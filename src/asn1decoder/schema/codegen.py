@@ -0,0 +1,589 @@
+import copy
+import keyword
+import re
+from typing import Dict, Iterable, List, Set, Tuple
+from asn1decoder.asn1types import TagClass
+from asn1decoder.schema.parser import (
+    CONSTRUCTED_KINDS,
+    Component,
+    Module,
+    SchemaError,
+    Tag,
+    TypeNode,
+)
+
+# bump whenever the generated code changes, it is part of the cache key
+CODEGEN_VERSION = 2
+
+# canonical built-in type -> (universal tag number, runtime value function,
+# runtime function joining the segments of the constructed form or None
+# when the type is primitive only)
+BUILTINS: Dict[str, Tuple[int, str, str | None]] = {
+    "INTEGER": (2, "integer", None),
+    "BIT STRING": (3, "bit_string", "bit_segments"),
+    "OCTET STRING": (4, "octets", "segments"),
+    "NULL": (5, "null", None),
+    "OBJECT IDENTIFIER": (6, "oid", None),
+    "UTF8String": (12, "utf8_string", "segments"),
+    "RELATIVE-OID": (13, "relative_oid", None),
+    "NumericString": (18, "numeric_string", "segments"),
+    "PrintableString": (19, "printable_string", "segments"),
+    "TeletexString": (20, "teletex_string", "segments"),
+    "IA5String": (22, "ia5_string", "segments"),
+    "UTCTime": (23, "utctime", None),
+    "GeneralizedTime": (24, "generalized_time", None),
+    "VisibleString": (26, "visible_string", "segments"),
+    "GeneralString": (27, "general_string", "segments"),
+    "UniversalString": (28, "universal_string", "segments"),
+    "BMPString": (30, "bmp_string", "segments"),
+}
+
+_CONSTRUCTED_TAGS = {"SEQUENCE": 16, "SEQUENCE OF": 16, "SET": 17, "SET OF": 17}
+
+_RUNTIME_NAMES = (
+    "MISSING",
+    "Record",
+    "SchemaDecodeError",
+    "bit_segments",
+    "close",
+    "duplicate",
+    "indefinite_primitive",
+    "missing",
+    "read_definite_length",
+    "read_length",
+    "segments",
+    "skip",
+    "skip_extensions",
+    "truncated",
+    "unexpected",
+    *sorted({function for _, function, _ in BUILTINS.values()}),
+)
+
+TagPair = Tuple[TagClass, int]
+# (tags from the outermost, body): all the tags but the last are explicit
+# wrappers; when the body is a CHOICE every tag is a wrapper
+Shape = Tuple[Tuple[TagPair, ...], TypeNode]
+
+
+def python_name(name: str) -> str:
+    name = re.sub(r"\W", "_", name)
+    if keyword.iskeyword(name):
+        name += "_"
+    return name
+
+
+def identifier_octets(tag: TagPair, constructed: bool) -> bytes:
+    tag_class, number = tag
+    first = tag_class << 6 | (0x20 if constructed else 0)
+    if number < 31:
+        return bytes([first | number])
+
+    groups = [number & 0x7F]
+    number >>= 7
+    while number:
+        groups.append(0x80 | number & 0x7F)
+        number >>= 7
+    return bytes([first | 0x1F, *reversed(groups)])
+
+
+def _condition(identifiers: Iterable[bytes], negate: bool = False) -> str:
+    """
+    A Python expression testing whether the identifier octets at `offset` are
+    one of `identifiers` (or none of them, when negated).
+    """
+    single = sorted(octets[0] for octets in identifiers if len(octets) == 1)
+    multiple = sorted(octets for octets in identifiers if len(octets) > 1)
+
+    if negate and not multiple:
+        if len(single) == 1:
+            return f"data[offset] != 0x{single[0]:02x}"
+        values = ", ".join(f"0x{value:02x}" for value in single)
+        return f"data[offset] not in ({values})"
+
+    parts = []
+    if len(single) == 1:
+        parts.append(f"data[offset] == 0x{single[0]:02x}")
+    elif single:
+        values = ", ".join(f"0x{value:02x}" for value in single)
+        parts.append(f"data[offset] in ({values})")
+
+    for octets in multiple:
+        parts.append(f"data[offset : offset + {len(octets)}] == {octets!r}")
+
+    expression = parts[0] if len(parts) == 1 else "(" + " or ".join(parts) + ")"
+    return f"not {expression}" if negate else expression
+
+
+class _Generator:
+    def __init__(self, module: Module) -> None:
+        module = copy.deepcopy(module)
+        self.module = module
+        self.types: Dict[str, TypeNode] = {}
+        for name, node in module.types.items():
+            self.types[name] = node
+        for name in list(module.types):
+            self._hoist_components(name, self.types[name])
+
+        # body node -> name of the assignment defining it
+        self.body_names = {
+            id(node): name
+            for name, node in self.types.items()
+            if node.kind != "REFERENCE"
+        }
+        self.shapes: Dict[str, Shape] = {}
+        self.lines: List[str] = []
+        self.bodies: List[str] = []
+        self.emitted: Set[str] = set()
+
+    # normalization
+
+    def _hoist(self, node: TypeNode, name: str) -> TypeNode:
+        """
+        Moves an anonymous constructed type to its own assignment, so that it
+        gets a decoder and (for SEQUENCE and SET) a value class of its own.
+        """
+        if node.kind not in CONSTRUCTED_KINDS:
+            return node
+
+        while name in self.types:
+            name += "_"
+
+        tags, node.tags = node.tags, []
+        self.types[name] = node
+        self._hoist_components(name, node)
+        return TypeNode(kind="REFERENCE", tags=tags, reference=name)
+
+    def _hoist_components(self, name: str, node: TypeNode) -> None:
+        if node.kind in ("SEQUENCE", "SET", "CHOICE"):
+            self._automatic_tags(node)
+            for component in node.components:
+                component.type = self._hoist(
+                    component.type, f"{name}_{python_name(component.name)}"
+                )
+        elif node.kind in ("SEQUENCE OF", "SET OF"):
+            node.element = self._hoist(node.element, f"{name}_item")
+
+    def _automatic_tags(self, node: TypeNode) -> None:
+        if self.module.tag_default != "AUTOMATIC":
+            return
+        if any(component.type.tags for component in node.components):
+            return
+        for number, component in enumerate(node.components):
+            component.type.tags = [Tag(TagClass.CONTEXT_SPECIFIC, number)]
+
+    # tagging
+
+    def shape(self, node: TypeNode, resolving: Tuple[str, ...] = ()) -> Shape:
+        tags: Tuple[TagPair, ...]
+        if node.kind == "REFERENCE":
+            tags, body = self._named_shape(node.reference, resolving)
+        elif node.kind == "CHOICE":
+            tags, body = (), node
+        elif node.kind in _CONSTRUCTED_TAGS:
+            tags, body = ((TagClass.UNIVERSAL, _CONSTRUCTED_TAGS[node.kind]),), node
+        else:
+            tags, body = ((TagClass.UNIVERSAL, BUILTINS[node.kind][0]),), node
+
+        for tag in reversed(node.tags):
+            implicit = tag.mode == "IMPLICIT" or (
+                tag.mode is None and self.module.tag_default != "EXPLICIT"
+            )
+            if implicit and not tags:
+                if tag.mode == "IMPLICIT":
+                    raise SchemaError("a CHOICE cannot be tagged IMPLICIT")
+                implicit = False
+
+            pair = (tag.tag_class, tag.number)
+            tags = (pair, *tags[1:]) if implicit else (pair, *tags)
+
+        return tags, body
+
+    def _named_shape(self, name: str, resolving: Tuple[str, ...]) -> Shape:
+        if name in self.shapes:
+            return self.shapes[name]
+        if name not in self.types:
+            raise SchemaError(f"undefined type {name!r}")
+        if name in resolving:
+            raise SchemaError(f"type {name!r} is defined in terms of itself")
+
+        shape = self.shape(self.types[name], (*resolving, name))
+        self.shapes[name] = shape
+        return shape
+
+    def first_identifiers(
+        self, shape: Shape, resolving: Tuple[str, ...] = ()
+    ) -> Set[bytes]:
+        """The identifier octets an encoding of `shape` can start with."""
+        tags, body = shape
+        if not tags:
+            name = self.body_names[id(body)]
+            if name in resolving:
+                raise SchemaError(f"CHOICE {name!r} is an alternative of itself")
+            identifiers: Set[bytes] = set()
+            for component in body.components:
+                identifiers |= self.first_identifiers(
+                    self.shape(component.type), (*resolving, name)
+                )
+            return identifiers
+
+        if len(tags) > 1 or body.kind not in BUILTINS:
+            return {identifier_octets(tags[0], True)}
+        if BUILTINS[body.kind][2] is not None:
+            return {identifier_octets(tags[0], False), identifier_octets(tags[0], True)}
+        return {identifier_octets(tags[0], False)}
+
+    def _check_distinct(self, name: str, node: TypeNode) -> List[Set[bytes]]:
+        seen: Dict[bytes, str] = {}
+        result = []
+        for component in node.components:
+            identifiers = self.first_identifiers(self.shape(component.type))
+            for octets in identifiers:
+                if octets in seen:
+                    raise SchemaError(
+                        f"{name}: components {seen[octets]!r} and {component.name!r} share tag {octets.hex()}"
+                    )
+                seen[octets] = component.name
+            result.append(identifiers)
+        return result
+
+    # code generation
+
+    def generate(self) -> str:
+        emit = self.lines.append
+        emit(f"# Decoders for the ASN.1 module {self.module.name},")
+        emit("# generated by asn1decoder.schema. Do not edit.")
+        emit("from asn1decoder.schema.runtime import (")
+        for name in _RUNTIME_NAMES:
+            emit(f"    {name} as _{name},")
+        emit(")")
+
+        for name, node in self.types.items():
+            self._named_shape(name, ())
+            if node.kind in ("SEQUENCE", "SET"):
+                self._emit_class(name, node)
+
+        for name, node in self.types.items():
+            self._emit_decoder(name, node)
+
+        self.lines.extend(self.bodies)
+
+        for name in self.types:
+            self._emit_public(name)
+
+        emit("")
+        emit("")
+        emit("DECODERS = {")
+        for name in self.types:
+            emit(f"    {name!r}: decode_{python_name(name)},")
+        emit("}")
+        emit("")
+        emit("")
+        emit("def decode(type_name, data, offset=0):")
+        emit("    return DECODERS[type_name](data, offset)")
+        emit("")
+        return "\n".join(self.lines)
+
+    def _emit_class(self, name: str, node: TypeNode) -> None:
+        emit = self.lines.append
+        fields = [python_name(component.name) for component in node.components]
+        emit("")
+        emit("")
+        emit(f"class {python_name(name)}(_Record):")
+        emit(f"    __slots__ = {tuple(fields)!r}")
+        if not fields:
+            return
+        emit("")
+        emit(f"    def __init__(self, {', '.join(fields)}):")
+        for field in fields:
+            emit(f"        self.{field} = {field}")
+
+    def _emit_public(self, name: str) -> None:
+        emit = self.lines.append
+        function = python_name(name)
+        emit("")
+        emit("")
+        emit(f"def decode_{function}(data, offset=0):")
+        emit(f'    """Decodes the {name} encoding at `offset` of `data`."""')
+        emit("    if type(data) is not bytes:")
+        emit("        data = bytes(data)")
+        emit("    try:")
+        emit(f"        value, end = _decode_{function}(data, offset)")
+        emit("    except IndexError:")
+        emit(f"        raise _truncated({name!r}, data) from None")
+        emit("    if end > len(data):")
+        emit(f"        raise _truncated({name!r}, data)")
+        emit("    return value")
+
+    def _component_decoder(self, owner: str, component: str, node: TypeNode) -> str:
+        """Returns the decoder function of a component, generating it if needed."""
+        if node.kind == "REFERENCE" and not node.tags:
+            self._named_shape(node.reference, ())
+            return f"_decode_{python_name(node.reference)}"
+
+        function = f"_decode_{python_name(owner)}__{python_name(component)}"
+        if function not in self.emitted:
+            self.emitted.add(function)
+            lines = self._decoder_lines(function, f"{owner}.{component}", node, None)
+            self.bodies.extend(lines)
+        return function
+
+    def _emit_decoder(self, name: str, node: TypeNode) -> None:
+        function = f"_decode_{python_name(name)}"
+        if node.kind == "CHOICE":
+            self.lines.extend(self._choice_lines(name, node))
+            if not node.tags:
+                self.lines.append("")
+                self.lines.append("")
+                self.lines.append(f"{function} = _choice_{python_name(name)}")
+                return
+        elif node.kind == "REFERENCE" and not node.tags:
+            self.lines.append("")
+            self.lines.append("")
+            self.lines.append(f"{function} = _decode_{python_name(node.reference)}")
+            return
+
+        self.lines.extend(self._decoder_lines(function, name, node, name))
+
+    def _decoder_lines(
+        self, function: str, label: str, node: TypeNode, owner: str | None
+    ) -> List[str]:
+        """
+        A decoder checking every tag of `node` and decoding its content; the
+        content of SEQUENCE, SET and OF types is inlined when `owner` names
+        the assignment of the body.
+        """
+        tags, body = self.shape(node)
+        lines = ["", "", f"def {function}(data, offset):"]
+        indent = "    "
+
+        is_choice = body.kind == "CHOICE"
+        wrappers = tags if is_choice else tags[:-1]
+        for depth, tag in enumerate(wrappers):
+            self._header(lines, label, tag, True, f"end_{depth}", definite=False)
+
+        if is_choice:
+            lines.append(
+                f"{indent}value, offset = _choice_{python_name(self.body_names[id(body)])}(data, offset)"
+            )
+        elif body.kind in BUILTINS:
+            self._builtin_lines(lines, label, tags[-1], body)
+        else:
+            self._header(lines, label, tags[-1], True, "end", definite=False)
+            body_name = self.body_names[id(body)]
+            if body_name == owner:
+                self._body_lines(lines, body_name, body)
+            else:
+                lines.append(
+                    f"{indent}value, offset = _body_{python_name(body_name)}(data, offset, end)"
+                )
+                self._emit_body(body_name, body)
+
+        for depth in reversed(range(len(wrappers))):
+            lines.append(f"{indent}if offset != end_{depth}:")
+            lines.append(
+                f"{indent}    offset = _close(data, offset, end_{depth}, {label!r})"
+            )
+        lines.append(f"{indent}return value, offset")
+        return lines
+
+    def _header(
+        self,
+        lines: List[str],
+        label: str,
+        tag: TagPair,
+        constructed: bool | None,
+        end: str,
+        definite: bool,
+    ) -> None:
+        """
+        Checks the identifier octets (either form when `constructed` is None)
+        and reads the length octets into `end`, leaving `offset` on the
+        content.
+        """
+        indent = "    "
+        if constructed is None:
+            identifiers = {
+                identifier_octets(tag, False),
+                identifier_octets(tag, True),
+            }
+        else:
+            identifiers = {identifier_octets(tag, constructed)}
+        size = len(next(iter(identifiers)))
+
+        lines.append(f"{indent}if {_condition(identifiers, negate=True)}:")
+        lines.append(f"{indent}    raise _unexpected({label!r}, data, offset)")
+        if constructed is None:
+            lines.append(f"{indent}constructed = data[offset] & 0x20")
+        lines.append(f"{indent}length = data[offset + {size}]")
+        lines.append(f"{indent}if length < 0x80:")
+        lines.append(f"{indent}    offset += {size + 1}")
+        lines.append(f"{indent}    {end} = offset + length")
+        lines.append(f"{indent}else:")
+        if definite:
+            lines.append(
+                f"{indent}    offset, {end} = _read_definite_length(data, offset + {size}, {label!r})"
+            )
+        else:
+            lines.append(
+                f"{indent}    offset, {end} = _read_length(data, offset + {size})"
+            )
+
+    def _builtin_lines(
+        self, lines: List[str], label: str, tag: TagPair, body: TypeNode
+    ) -> None:
+        indent = "    "
+        _, function, join_segments = BUILTINS[body.kind]
+        if join_segments is None:
+            self._header(lines, label, tag, False, "end", definite=True)
+            lines.append(f"{indent}value = _{function}(data[offset:end])")
+            lines.append(f"{indent}offset = end")
+            return
+
+        self._header(lines, label, tag, None, "end", definite=False)
+        lines.append(f"{indent}if constructed:")
+        lines.append(
+            f"{indent}    content, offset = _{join_segments}(data, offset, end, {label!r})"
+        )
+        lines.append(f"{indent}elif end is None:")
+        lines.append(f"{indent}    raise _indefinite_primitive({label!r}, offset)")
+        lines.append(f"{indent}else:")
+        lines.append(f"{indent}    content = data[offset:end]")
+        lines.append(f"{indent}    offset = end")
+        lines.append(f"{indent}value = _{function}(content)")
+
+    def _emit_body(self, name: str, body: TypeNode) -> None:
+        if f"_body_{name}" in self.emitted:
+            return
+        self.emitted.add(f"_body_{name}")
+
+        lines = ["", "", f"def _body_{python_name(name)}(data, offset, end):"]
+        self._body_lines(lines, name, body)
+        lines.append("    return value, offset")
+        self.bodies.extend(lines)
+
+    def _body_lines(self, lines: List[str], name: str, body: TypeNode) -> None:
+        """Decodes the content of a SEQUENCE, SET or OF type into `value`."""
+        indent = "    "
+        lines.append(f"{indent}stop = len(data) if end is None else end")
+
+        if body.kind in ("SEQUENCE OF", "SET OF"):
+            decoder = self._component_decoder(name, "item", body.element)
+            lines.append(f"{indent}value = []")
+            lines.append(f"{indent}append = value.append")
+            lines.append(f"{indent}while offset < stop and data[offset]:")
+            lines.append(f"{indent}    item, offset = {decoder}(data, offset)")
+            lines.append(f"{indent}    append(item)")
+        elif body.kind == "SEQUENCE":
+            self._sequence_lines(lines, name, body)
+        else:
+            self._set_lines(lines, name, body)
+
+        lines.append(f"{indent}if offset != end:")
+        lines.append(f"{indent}    offset = _close(data, offset, end, {name!r})")
+
+        if body.kind in ("SEQUENCE", "SET"):
+            arguments = ", ".join(
+                f"v_{python_name(component.name)}" for component in body.components
+            )
+            lines.append(f"{indent}value = {python_name(name)}({arguments})")
+
+    def _sequence_lines(self, lines: List[str], name: str, body: TypeNode) -> None:
+        indent = "    "
+        for component in body.components:
+            variable = f"v_{python_name(component.name)}"
+            label = f"{name}.{component.name}"
+            decoder = self._component_decoder(name, component.name, component.type)
+
+            if component.optional or component.has_default:
+                identifiers = self.first_identifiers(self.shape(component.type))
+                lines.append(
+                    f"{indent}if offset < stop and {_condition(identifiers)}:"
+                )
+                lines.append(f"{indent}    {variable}, offset = {decoder}(data, offset)")
+                lines.append(f"{indent}else:")
+                lines.append(f"{indent}    {variable} = {_default(component)}")
+            else:
+                lines.append(f"{indent}if offset >= stop:")
+                lines.append(f"{indent}    raise _missing({label!r}, offset)")
+                lines.append(f"{indent}{variable}, offset = {decoder}(data, offset)")
+
+        if body.extensible:
+            lines.append(f"{indent}if offset < stop and data[offset]:")
+            lines.append(f"{indent}    offset = _skip_extensions(data, offset, stop)")
+
+    def _set_lines(self, lines: List[str], name: str, body: TypeNode) -> None:
+        indent = "    "
+        identifiers = self._check_distinct(name, body)
+        variables = [
+            f"v_{python_name(component.name)}" for component in body.components
+        ]
+
+        if variables:
+            lines.append(f"{indent}{' = '.join(variables)} = _MISSING")
+        lines.append(f"{indent}while offset < stop and data[offset]:")
+        keyword_ = "if"
+        for component, variable, component_identifiers in zip(
+            body.components, variables, identifiers
+        ):
+            label = f"{name}.{component.name}"
+            decoder = self._component_decoder(name, component.name, component.type)
+            lines.append(f"{indent}    {keyword_} {_condition(component_identifiers)}:")
+            lines.append(f"{indent}        if {variable} is not _MISSING:")
+            lines.append(f"{indent}            raise _duplicate({label!r}, offset)")
+            lines.append(
+                f"{indent}        {variable}, offset = {decoder}(data, offset)"
+            )
+            keyword_ = "elif"
+
+        lines.append(f"{indent}    else:")
+        if body.extensible:
+            lines.append(f"{indent}        offset = _skip(data, offset)")
+        else:
+            lines.append(f"{indent}        raise _unexpected({name!r}, data, offset)")
+
+        for component, variable in zip(body.components, variables):
+            lines.append(f"{indent}if {variable} is _MISSING:")
+            if component.optional or component.has_default:
+                lines.append(f"{indent}    {variable} = {_default(component)}")
+            else:
+                label = f"{name}.{component.name}"
+                lines.append(f"{indent}    raise _missing({label!r}, offset)")
+
+    def _choice_lines(self, name: str, body: TypeNode) -> List[str]:
+        identifiers = self._check_distinct(name, body)
+        lines = ["", "", f"def _choice_{python_name(name)}(data, offset):"]
+        for component, component_identifiers in zip(body.components, identifiers):
+            decoder = self._component_decoder(name, component.name, component.type)
+            lines.append(f"    if {_condition(component_identifiers)}:")
+            lines.append(f"        value, offset = {decoder}(data, offset)")
+            lines.append(f"        return ({component.name!r}, value), offset")
+
+        if body.extensible:
+            # an unknown alternative, kept as its raw encoding
+            lines.append("    end = _skip(data, offset)")
+            lines.append("    return (None, data[offset:end]), end")
+        else:
+            lines.append(f"    raise _unexpected({name!r}, data, offset)")
+        return lines
+
+
+def _default(component: Component) -> str:
+    if component.has_default:
+        return repr(component.default)
+    return "None"
+
+
+def generate_decoder_source(module: Module) -> str:
+    """
+    Generates the Python source of the decoders of `module`.
+
+    For each type assignment `T` the generated module defines `decode_T(data,
+    offset=0)`, and for each SEQUENCE and SET a `__slots__` value class named
+    after the type. SEQUENCE OF and SET OF decode to lists, CHOICE to a
+    `(alternative, value)` tuple. Anonymous constructed types are named after
+    their parent, e.g. `Parent_component` or `Parent_item`.
+
+    Returns:
+        str: the source of the decoder module
+    """
+    return _Generator(module).generate()
@@ -0,0 +1,117 @@
+import hashlib
+import os
+import types
+from pathlib import Path
+from typing import Dict, Tuple
+from asn1decoder.schema.parser import parse_module
+from asn1decoder.schema.codegen import CODEGEN_VERSION, generate_decoder_source
+
+# (cache key, cache directory) -> loaded decoder module
+_loaded: Dict[Tuple[str, str | None], types.ModuleType] = {}
+
+
+def default_cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "asn1decoder" / "schema"
+
+
+def _cache_key(source: str) -> str:
+    digest = hashlib.sha256(f"{CODEGEN_VERSION}\0{source}".encode("utf-8"))
+    return digest.hexdigest()[:24]
+
+
+# last line of a cached module, the digest of the code above it: a file cut
+# short or altered since it was written does not match and is not executed
+_CHECKSUM_MARKER = "# sha256: "
+
+
+def _checksum(code: str) -> str:
+    return hashlib.sha256(code.encode("utf-8")).hexdigest()
+
+
+def _write_atomically(path: Path, code: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        temporary.write_text(
+            f"{code}\n{_CHECKSUM_MARKER}{_checksum(code)}\n", encoding="utf-8"
+        )
+        os.replace(temporary, path)
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
+
+
+def _load_from_file(name: str, path: Path) -> types.ModuleType:
+    text = path.read_text(encoding="utf-8")
+    code, marker, checksum = text.rpartition(f"\n{_CHECKSUM_MARKER}")
+    if not marker or checksum != f"{_checksum(code)}\n":
+        raise ImportError(f"{path} is damaged or incomplete")
+
+    module = types.ModuleType(name)
+    module.__file__ = str(path)
+    exec(compile(code, str(path), "exec"), module.__dict__)
+    return module
+
+
+def _load_from_source(name: str, code: str) -> types.ModuleType:
+    module = types.ModuleType(name)
+    exec(compile(code, f"<{name}>", "exec"), module.__dict__)
+    return module
+
+
+def compile_schema(
+    source: str,
+    cache_dir: str | os.PathLike | None = None,
+    use_cache: bool = True,
+) -> types.ModuleType:
+    """
+    Compiles the text of an ASN.1 module into a module of specialized
+    decoders (see `generate_decoder_source` for what it defines).
+
+    The generated source is stored in `cache_dir` (by default
+    `$XDG_CACHE_HOME/asn1decoder/schema`) under a name derived from the
+    schema text and the generator version, so later runs import it instead
+    of compiling the schema again. An unwritable cache is not an error, the
+    decoders are then built in memory. A cached module that fails its
+    checksum or cannot be loaded is deleted and generated again.
+
+    Returns:
+        ModuleType: the module of generated decoders
+    """
+    key = _cache_key(source)
+    directory = None
+    if use_cache:
+        directory = str(cache_dir) if cache_dir is not None else str(default_cache_dir())
+        loaded = _loaded.get((key, directory))
+        if loaded is not None:
+            return loaded
+
+    name = f"asn1decoder_schema_{key}"
+
+    module = None
+    if directory is not None:
+        path = Path(directory) / f"{name}.py"
+        try:
+            module = _load_from_file(name, path)
+        except FileNotFoundError:
+            pass
+        except Exception:
+            # damaged, truncated or not written by us: start over
+            try:
+                path.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+    if module is None:
+        code = generate_decoder_source(parse_module(source))
+        if directory is not None:
+            try:
+                _write_atomically(path, code)
+            except OSError:
+                pass
+        module = _load_from_source(name, code)
+
+    if directory is not None:
+        _loaded[(key, directory)] = module
+    return module
@@ -0,0 +1,438 @@
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+from asn1decoder.asn1types import TagClass
+
+
+class SchemaError(ValueError):
+    pass
+
+
+# built-in type name -> canonical name; aliases share the canonical entry
+BUILTIN_TYPES: Dict[str, str] = {
+    "INTEGER": "INTEGER",
+    "BIT STRING": "BIT STRING",
+    "NULL": "NULL",
+    "OCTET STRING": "OCTET STRING",
+    "OBJECT IDENTIFIER": "OBJECT IDENTIFIER",
+    "RELATIVE-OID": "RELATIVE-OID",
+    "UTF8String": "UTF8String",
+    "NumericString": "NumericString",
+    "PrintableString": "PrintableString",
+    "TeletexString": "TeletexString",
+    "T61String": "TeletexString",
+    "IA5String": "IA5String",
+    "VisibleString": "VisibleString",
+    "ISO646String": "VisibleString",
+    "GeneralString": "GeneralString",
+    "UniversalString": "UniversalString",
+    "BMPString": "BMPString",
+    "UTCTime": "UTCTime",
+    "GeneralizedTime": "GeneralizedTime",
+}
+
+# built-in types that asn1values cannot decode yet
+UNSUPPORTED_TYPES = frozenset(
+    (
+        "ANY",
+        "BOOLEAN",
+        "CHARACTER",
+        "DATE",
+        "DATE-TIME",
+        "DURATION",
+        "EMBEDDED",
+        "ENUMERATED",
+        "EXTERNAL",
+        "GraphicString",
+        "INSTANCE",
+        "ObjectDescriptor",
+        "REAL",
+        "TIME",
+        "TIME-OF-DAY",
+        "VideotexString",
+    )
+)
+
+# constructed kinds a TypeNode can have besides the built-in types
+CONSTRUCTED_KINDS = ("SEQUENCE", "SET", "CHOICE", "SEQUENCE OF", "SET OF")
+
+
+@dataclass(slots=True)
+class Tag:
+    tag_class: TagClass
+    number: int
+    # "IMPLICIT", "EXPLICIT" or None for the module default
+    mode: str | None = None
+
+
+@dataclass(slots=True)
+class TypeNode:
+    """
+    A type in the schema. `kind` is a canonical built-in type name, one of
+    CONSTRUCTED_KINDS, or "REFERENCE" for a reference to another assignment.
+    `tags` are listed from the outermost.
+    """
+
+    kind: str
+    tags: List[Tag] = field(default_factory=list)
+    components: List["Component"] = field(default_factory=list)
+    extensible: bool = False
+    element: "TypeNode | None" = None
+    reference: str | None = None
+    named_numbers: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class Component:
+    name: str
+    type: TypeNode
+    optional: bool = False
+    has_default: bool = False
+    default: Any = None
+
+
+@dataclass(slots=True)
+class Module:
+    name: str
+    # "EXPLICIT", "IMPLICIT" or "AUTOMATIC"
+    tag_default: str
+    types: Dict[str, TypeNode]
+
+
+_TOKEN = re.compile(
+    r"""
+    (?P<space>\s+)
+    |(?P<comment>--.*?(?:--|$)|/\*.*?\*/)
+    |(?P<assign>::=)
+    |(?P<ellipsis>\.\.\.)
+    |(?P<range>\.\.)
+    |(?P<hstring>'[0-9A-Fa-f\s]*'H)
+    |(?P<bstring>'[01\s]*'B)
+    |(?P<cstring>"(?:[^"]|"")*")
+    |(?P<number>\d+)
+    |(?P<word>[A-Za-z][A-Za-z0-9]*(?:-[A-Za-z0-9]+)*)
+    |(?P<punct>[-{}\[\](),;|.@!<>^:&])
+    """,
+    re.VERBOSE | re.MULTILINE | re.DOTALL,
+)
+
+Token = Tuple[str, str, int]
+
+
+def tokenize(source: str) -> List[Token]:
+    """
+    Splits ASN.1 module text into (kind, text, line) tokens, dropping blanks
+    and comments.
+    """
+    tokens = []
+    offset = 0
+    line = 1
+    while offset < len(source):
+        match = _TOKEN.match(source, offset)
+        if match is None:
+            raise SchemaError(
+                f"line {line}: unexpected character {source[offset]!r}"
+            )
+
+        kind = match.lastgroup
+        text = match.group()
+        if kind not in ("space", "comment"):
+            tokens.append((kind, text, line))
+        line += text.count("\n")
+        offset = match.end()
+
+    return tokens
+
+
+_TAG_CLASSES = {
+    "UNIVERSAL": TagClass.UNIVERSAL,
+    "APPLICATION": TagClass.APPLICATION,
+    "PRIVATE": TagClass.PRIVATE,
+}
+
+
+class _Parser:
+    def __init__(self, tokens: List[Token]) -> None:
+        self.tokens = tokens
+        self.position = 0
+
+    def peek(self, ahead: int = 0) -> str | None:
+        index = self.position + ahead
+        if index < len(self.tokens):
+            return self.tokens[index][1]
+        return None
+
+    def next(self) -> Token:
+        if self.position >= len(self.tokens):
+            raise SchemaError("unexpected end of module")
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def error(self, message: str) -> SchemaError:
+        if self.position < len(self.tokens):
+            _, text, line = self.tokens[self.position]
+            return SchemaError(f"line {line}: {message}, got {text!r}")
+        return SchemaError(f"{message} at end of module")
+
+    def accept(self, *texts: str) -> bool:
+        for ahead, text in enumerate(texts):
+            if self.peek(ahead) != text:
+                return False
+        self.position += len(texts)
+        return True
+
+    def expect(self, *texts: str) -> None:
+        if not self.accept(*texts):
+            raise self.error(f"expected {' '.join(texts)!r}")
+
+    def expect_kind(self, kind: str) -> str:
+        if self.position < len(self.tokens) and self.tokens[self.position][0] == kind:
+            return self.next()[1]
+        raise self.error(f"expected a {kind}")
+
+    def skip_balanced(self) -> None:
+        closing = {"(": ")", "{": "}", "[": "]"}
+        stack = [closing[self.next()[1]]]
+        while stack:
+            text = self.next()[1]
+            if text in closing:
+                stack.append(closing[text])
+            elif text == stack[-1]:
+                stack.pop()
+            elif text in (")", "}", "]"):
+                raise self.error("unbalanced brackets")
+
+    def skip_until(self, terminator: str) -> None:
+        while not self.accept(terminator):
+            if self.peek() in ("(", "{", "["):
+                self.skip_balanced()
+            else:
+                self.next()
+
+    def parse_module(self) -> Module:
+        name = self.expect_kind("word")
+        if self.peek() == "{":
+            self.skip_balanced()
+
+        self.expect("DEFINITIONS")
+        tag_default = "EXPLICIT"
+        for mode in ("EXPLICIT", "IMPLICIT", "AUTOMATIC"):
+            if self.accept(mode, "TAGS"):
+                tag_default = mode
+        self.accept("EXTENSIBILITY", "IMPLIED")
+        self.expect("::=")
+        self.expect("BEGIN")
+
+        for section in ("EXPORTS", "IMPORTS"):
+            if self.accept(section):
+                self.skip_until(";")
+
+        types: Dict[str, TypeNode] = {}
+        while not self.accept("END"):
+            reference = self.expect_kind("word")
+            if reference[0].isupper():
+                self.expect("::=")
+                if reference in types:
+                    raise SchemaError(f"type {reference!r} assigned twice")
+                types[reference] = self.parse_type()
+            else:
+                # value assignment, e.g. id-ce OBJECT IDENTIFIER ::= { ... }
+                self.skip_until("::=")
+                self.parse_value()
+
+        return Module(name=name, tag_default=tag_default, types=types)
+
+    def parse_tag(self) -> Tag:
+        self.expect("[")
+        tag_class = TagClass.CONTEXT_SPECIFIC
+        if self.peek() in _TAG_CLASSES:
+            tag_class = _TAG_CLASSES[self.next()[1]]
+        number = int(self.expect_kind("number"))
+        self.expect("]")
+
+        mode = None
+        if self.peek() in ("IMPLICIT", "EXPLICIT"):
+            mode = self.next()[1]
+        return Tag(tag_class=tag_class, number=number, mode=mode)
+
+    def parse_type(self) -> TypeNode:
+        tags = []
+        while self.peek() == "[":
+            tags.append(self.parse_tag())
+
+        node = self.parse_base_type()
+        node.tags = tags + node.tags
+        self.skip_constraints()
+        return node
+
+    def skip_constraints(self) -> None:
+        while self.peek() == "(":
+            self.skip_balanced()
+
+    def parse_base_type(self) -> TypeNode:
+        text = self.peek()
+
+        if text in ("SEQUENCE", "SET"):
+            self.next()
+            if self.peek() == "{":
+                node = TypeNode(kind=text)
+                self.parse_components(node)
+                return node
+
+            if self.accept("SIZE"):
+                self.skip_balanced()
+            self.skip_constraints()
+            self.expect("OF")
+            # the element may be named, as in SEQUENCE OF item Item
+            if self.peek() is not None and self.peek()[0].islower():
+                self.next()
+            return TypeNode(kind=f"{text} OF", element=self.parse_type())
+
+        if text == "CHOICE":
+            self.next()
+            node = TypeNode(kind="CHOICE")
+            self.parse_components(node)
+            if not node.components:
+                raise SchemaError("CHOICE without alternatives")
+            return node
+
+        if text in ("OCTET", "OBJECT"):
+            self.next()
+            second = "STRING" if text == "OCTET" else "IDENTIFIER"
+            self.expect(second)
+            return TypeNode(kind=f"{text} {second}")
+
+        if text in ("INTEGER", "BIT"):
+            self.next()
+            if text == "BIT":
+                self.expect("STRING")
+                text = "BIT STRING"
+            node = TypeNode(kind=text)
+            if self.peek() == "{":
+                node.named_numbers = self.parse_named_numbers()
+            return node
+
+        if text in BUILTIN_TYPES:
+            self.next()
+            return TypeNode(kind=BUILTIN_TYPES[text])
+
+        if text in UNSUPPORTED_TYPES:
+            raise self.error("unsupported type")
+
+        if text is not None and text[0].isupper():
+            self.next()
+            return TypeNode(kind="REFERENCE", reference=text)
+
+        raise self.error("expected a type")
+
+    def parse_named_numbers(self) -> Dict[str, int]:
+        self.expect("{")
+        numbers = {}
+        while True:
+            name = self.expect_kind("word")
+            self.expect("(")
+            sign = -1 if self.accept("-") else 1
+            numbers[name] = sign * int(self.expect_kind("number"))
+            self.expect(")")
+            if not self.accept(","):
+                break
+        self.expect("}")
+        return numbers
+
+    def parse_components(self, node: TypeNode) -> None:
+        self.expect("{")
+        if self.accept("}"):
+            return
+
+        in_extension = False
+        while True:
+            if self.accept("..."):
+                node.extensible = True
+                in_extension = not in_extension
+                if self.accept("!"):
+                    self.parse_value()
+            elif self.accept("[", "["):
+                # extension addition group, its members are all optional here
+                if self.peek(1) == ":":
+                    self.next()
+                    self.next()
+                while True:
+                    self.parse_component(node, in_extension=True)
+                    if not self.accept(","):
+                        break
+                self.expect("]", "]")
+            else:
+                self.parse_component(node, in_extension)
+
+            if not self.accept(","):
+                break
+        self.expect("}")
+
+    def parse_component(self, node: TypeNode, in_extension: bool) -> None:
+        if self.peek() == "COMPONENTS":
+            raise self.error("unsupported component")
+
+        name = self.expect_kind("word")
+        if not name[0].islower():
+            raise SchemaError(f"component name {name!r} shall start lowercase")
+        if any(component.name == name for component in node.components):
+            raise SchemaError(f"component {name!r} declared twice")
+
+        component = Component(name=name, type=self.parse_type())
+        if self.accept("OPTIONAL"):
+            component.optional = True
+        elif self.accept("DEFAULT"):
+            component.has_default = True
+            component.default = self.parse_default(component.type)
+
+        if in_extension and not component.has_default:
+            component.optional = True
+        node.components.append(component)
+
+    def parse_value(self) -> Any:
+        if self.peek() in ("{", "("):
+            self.skip_balanced()
+            return None
+
+        kind, text, _ = self.next()
+        if kind == "number":
+            return int(text)
+        if text == "-":
+            return -int(self.expect_kind("number"))
+        if kind == "cstring":
+            return text[1:-1].replace('""', '"')
+        if kind == "hstring":
+            return bytes.fromhex("".join(text[1:-2].split()))
+        if kind == "word":
+            return text
+        raise self.error("unsupported value")
+
+    def parse_default(self, node: TypeNode) -> Any:
+        if self.peek() == "{":
+            raise self.error("unsupported DEFAULT value")
+
+        value = self.parse_value()
+        if isinstance(value, str) and self.tokens[self.position - 1][0] == "word":
+            if value == "NULL" and node.kind == "NULL":
+                return None
+            if value not in node.named_numbers:
+                raise SchemaError(f"unknown DEFAULT value {value!r}")
+            return node.named_numbers[value]
+        return value
+
+
+def parse_module(source: str) -> Module:
+    """
+    Parses the text of an ASN.1 module, restricted to the subset the schema
+    compiler supports. Value assignments, imports, exports and constraints
+    are read and ignored.
+
+    Returns:
+        Module: the module name, its tagging default and its type assignments
+    """
+    parser = _Parser(tokenize(source))
+    module = parser.parse_module()
+    if parser.position != len(parser.tokens):
+        raise parser.error("unexpected text after END")
+    return module
@@ -0,0 +1,220 @@
+from typing import Any, List, Tuple
+from asn1decoder.asn1parser import ASN1ParserError, find_encoding_end
+from asn1decoder.asn1values.bit_string import bitstring_value, join_bitstring_segments
+from asn1decoder.asn1values.numeric_string import _decode_numeric_bytes
+from asn1decoder.asn1values.printable_string import ASN1PrintableString
+from asn1decoder.asn1values.teletex_string import ASN1TeletexString
+from asn1decoder.asn1values.ia5_string import ASN1IA5String
+from asn1decoder.asn1values.visible_string import ASN1VisibleString
+from asn1decoder.asn1values.utf8_string import ASN1UTF8String
+from asn1decoder.asn1values.universal_string import ASN1UniversalString
+from asn1decoder.asn1values.bmp_string import ASN1BMPString
+from asn1decoder.asn1values.registry import (
+    generalizedtime_value,
+    integer_value,
+    null_value,
+    octets_value,
+    oid_value,
+    relative_oid_value,
+    utctime_value,
+)
+
+# Helpers shared by the generated decoders. Generated code inlines the
+# identifier checks and the short form of the length octets; everything
+# here is either a value conversion or a slow path.
+
+
+class SchemaDecodeError(ASN1ParserError):
+    pass
+
+
+MISSING: Any = object()
+
+
+class Record:
+    """
+    Base class of the SEQUENCE and SET value classes of a compiled schema.
+    Subclasses declare their components in `__slots__`.
+    """
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in self.__slots__
+        )
+        return f"{type(self).__name__}({fields})"
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+def read_length(data: bytes, offset: int) -> Tuple[int, int | None]:
+    """
+    Reads the long or indefinite form of the length octets at `offset`.
+
+    Returns:
+        (content_offset, end): end is None for the indefinite form
+    """
+    byte = data[offset]
+    if byte == 0x80:
+        return offset + 1, None
+
+    if byte == 0xFF:
+        raise SchemaDecodeError(
+            f"invalid length octet 0xff at offset {offset}."
+        )
+
+    size = byte & 0x7F
+    start = offset + 1 + size
+    if start > len(data):
+        raise SchemaDecodeError(f"truncated length octets at offset {offset}.")
+    return start, start + int.from_bytes(data[offset + 1 : start], "big")
+
+
+def read_definite_length(data: bytes, offset: int, label: str) -> Tuple[int, int]:
+    start, end = read_length(data, offset)
+    if end is None:
+        raise indefinite_primitive(label, offset)
+    return start, end
+
+
+def close(data: bytes, offset: int, end: int | None, label: str) -> int:
+    """
+    Called when the content of a constructed encoding did not end where its
+    length said: consumes the EOC of an indefinite length or fails.
+    """
+    if end is None:
+        if data[offset : offset + 2] == b"\x00\x00":
+            return offset + 2
+        raise SchemaDecodeError(f"{label}: missing EOC at offset {offset}.")
+
+    raise SchemaDecodeError(
+        f"{label}: content ends at offset {offset}, length declares {end}."
+    )
+
+
+def skip(data: bytes, offset: int) -> int:
+    return find_encoding_end(data, offset)
+
+
+def skip_extensions(data: bytes, offset: int, stop: int) -> int:
+    """
+    Skips the unknown trailing components of an extensible SEQUENCE.
+    """
+    while offset < stop and data[offset]:
+        offset = find_encoding_end(data, offset)
+    return offset
+
+
+def unexpected(label: str, data: bytes, offset: int) -> SchemaDecodeError:
+    if offset >= len(data):
+        return SchemaDecodeError(f"{label}: unexpected end of data at offset {offset}.")
+    return SchemaDecodeError(
+        f"{label}: unexpected identifier octet 0x{data[offset]:02x} at offset {offset}."
+    )
+
+
+def missing(label: str, offset: int) -> SchemaDecodeError:
+    return SchemaDecodeError(
+        f"{label}: required component missing at offset {offset}."
+    )
+
+
+def duplicate(label: str, offset: int) -> SchemaDecodeError:
+    return SchemaDecodeError(f"{label}: component repeated at offset {offset}.")
+
+
+def indefinite_primitive(label: str, offset: int) -> SchemaDecodeError:
+    return SchemaDecodeError(
+        f"{label}: primitive encoding with indefinite length near offset {offset}."
+    )
+
+
+def truncated(label: str, data: bytes) -> SchemaDecodeError:
+    return SchemaDecodeError(f"{label}: truncated encoding of {len(data)} bytes.")
+
+
+def _collect_segments(
+    data: bytes,
+    offset: int,
+    end: int | None,
+    label: str,
+    identifier: int,
+    chunks: List[bytes],
+) -> int:
+    stop = len(data) if end is None else end
+    while offset < stop and data[offset]:
+        segment_identifier = data[offset]
+        if segment_identifier | 0x20 != identifier | 0x20:
+            raise unexpected(label, data, offset)
+
+        length = data[offset + 1]
+        if length < 0x80:
+            start = offset + 2
+            inner_end = start + length
+        else:
+            start, inner_end = read_length(data, offset + 1)
+
+        if segment_identifier & 0x20:
+            offset = _collect_segments(data, start, inner_end, label, identifier, chunks)
+        elif inner_end is None:
+            raise indefinite_primitive(label, offset)
+        else:
+            chunks.append(data[start:inner_end])
+            offset = inner_end
+
+    if offset != end:
+        offset = close(data, offset, end, label)
+    return offset
+
+
+def segments(data: bytes, offset: int, end: int | None, label: str) -> Tuple[bytes, int]:
+    """
+    Reassembles the OCTET STRING segments of a constructed string.
+
+    Returns:
+        (content, offset): offset is right after the constructed content
+    """
+    chunks: List[bytes] = []
+    offset = _collect_segments(data, offset, end, label, 0x04, chunks)
+    return b"".join(chunks), offset
+
+
+def bit_segments(
+    data: bytes, offset: int, end: int | None, label: str
+) -> Tuple[bytes, int]:
+    """
+    Like `segments`, for the BIT STRING segments of a constructed BIT STRING;
+    the content returned is that of the equivalent primitive encoding.
+    """
+    chunks: List[bytes] = []
+    offset = _collect_segments(data, offset, end, label, 0x03, chunks)
+    return join_bitstring_segments(chunks), offset
+
+
+# content octets -> value, one function per built-in type
+integer = integer_value
+bit_string = bitstring_value
+null = null_value
+octets = octets_value
+oid = oid_value
+relative_oid = relative_oid_value
+utctime = utctime_value
+generalized_time = generalizedtime_value
+numeric_string = _decode_numeric_bytes
+printable_string = ASN1PrintableString.decode_bytes
+teletex_string = ASN1TeletexString.decode_bytes
+ia5_string = ASN1IA5String.decode_bytes
+visible_string = ASN1VisibleString.decode_bytes
+# GeneralString content is returned undecoded, as parse_generalstring does
+general_string = octets_value
+utf8_string = ASN1UTF8String.decode_bytes
+universal_string = ASN1UniversalString.decode_bytes
+bmp_string = ASN1BMPString.decode_bytes
@@ -0,0 +1,200 @@
+import mmap
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterable, List, Tuple
+from asn1decoder.asn1types import EncodingType, TagClass
+from asn1decoder.asn1parser import ASN1ParserError, iter_headers
+from asn1decoder.asn1values.bit_string import BitString
+from asn1decoder.asn1values.buffer import BUFFER_PARSERS
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    file_id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS nodes (
+    file_id INTEGER NOT NULL,
+    node_id INTEGER NOT NULL,
+    parent_id INTEGER,
+    depth INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    tag_class INTEGER NOT NULL,
+    tag_number INTEGER NOT NULL,
+    constructed INTEGER NOT NULL,
+    header_length INTEGER NOT NULL,
+    content_length INTEGER
+);
+CREATE TABLE IF NOT EXISTS "values" (
+    file_id INTEGER NOT NULL,
+    node_id INTEGER NOT NULL,
+    value,
+    error TEXT
+);
+"""
+
+# created once the rows are loaded, so that inserts do not maintain them
+INDEXES = """
+CREATE INDEX IF NOT EXISTS nodes_node ON nodes (file_id, node_id);
+CREATE INDEX IF NOT EXISTS nodes_parent ON nodes (file_id, parent_id);
+CREATE INDEX IF NOT EXISTS nodes_tag ON nodes (tag_class, tag_number);
+CREATE INDEX IF NOT EXISTS values_node ON "values" (file_id, node_id);
+"""
+
+_NODE_INSERT = "INSERT INTO nodes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+_VALUE_INSERT = 'INSERT INTO "values" VALUES (?, ?, ?, ?)'
+
+# sqlite integers are 64-bit
+_MIN_INTEGER = -(1 << 63)
+_MAX_INTEGER = (1 << 63) - 1
+
+
+def sql_value(value: Any) -> int | float | str | bytes | None:
+    """
+    A decoded value as stored in the `values` table: integers outside the
+    64-bit range and times as text, bit strings as their content octets.
+    """
+    if value is None or isinstance(value, (str, bytes)):
+        return value
+    if isinstance(value, int):
+        return value if _MIN_INTEGER <= value <= _MAX_INTEGER else str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, BitString):
+        return value.content.tobytes()
+    if isinstance(value, memoryview):
+        return value.tobytes()
+    return str(value)
+
+
+def _flush(
+    connection: sqlite3.Connection,
+    nodes: List[Tuple[Any, ...]],
+    values: List[Tuple[Any, ...]],
+) -> None:
+    with connection:
+        connection.executemany(_NODE_INSERT, nodes)
+        if values:
+            connection.executemany(_VALUE_INSERT, values)
+    nodes.clear()
+    values.clear()
+
+
+def _export_file(
+    connection: sqlite3.Connection,
+    path: Path,
+    values: bool,
+    max_depth: int | None,
+    batch_size: int,
+) -> int:
+    with open(path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            mapped = None
+
+        with connection:
+            file_id = connection.execute(
+                "INSERT INTO files (path, size) VALUES (?, ?)",
+                (str(path), 0 if mapped is None else len(mapped)),
+            ).lastrowid
+        if mapped is None:
+            return 0
+
+        data = memoryview(mapped)
+        node_rows: List[Tuple[Any, ...]] = []
+        value_rows: List[Tuple[Any, ...]] = []
+        # node ids of the open constructed encodings
+        parents: List[int] = []
+        node_id = 0
+        try:
+            for (
+                offset,
+                depth,
+                tag_class,
+                encoding_type,
+                tag_number,
+                header_length,
+                content_length,
+            ) in iter_headers(data, max_depth=max_depth):
+                del parents[depth:]
+                constructed = encoding_type is EncodingType.CONSTRUCTED
+                node_rows.append(
+                    (
+                        file_id,
+                        node_id,
+                        parents[-1] if parents else None,
+                        depth,
+                        offset,
+                        tag_class,
+                        tag_number,
+                        constructed,
+                        header_length,
+                        content_length,
+                    )
+                )
+                if constructed:
+                    parents.append(node_id)
+                elif values and tag_class is TagClass.UNIVERSAL:
+                    parser = BUFFER_PARSERS.get(tag_number)
+                    if parser is not None:
+                        try:
+                            value = parser(
+                                data, offset + header_length, content_length, False
+                            )
+                        except ASN1ParserError as exc:
+                            value_rows.append((file_id, node_id, None, str(exc)))
+                        else:
+                            value_rows.append(
+                                (file_id, node_id, sql_value(value), None)
+                            )
+                node_id += 1
+
+                if len(node_rows) >= batch_size:
+                    _flush(connection, node_rows, value_rows)
+            _flush(connection, node_rows, value_rows)
+        finally:
+            # the rows hold no view of the data, only values copied out of it
+            data.release()
+            mapped.close()
+    return node_id
+
+
+def export_sqlite(
+    paths: Iterable[Path],
+    database: Path | str,
+    values: bool = False,
+    max_depth: int | None = None,
+    batch_size: int = 100_000,
+) -> int:
+    """
+    Loads the encodings of the files in `paths` into the SQLite `database`:
+    a row of `files` for each file and a row of `nodes` for each encoding,
+    numbered in document order within its file and linked to its parent.
+    With `values` the universal primitives decoded by the buffer parsers get
+    a row of `values`, with the error message when decoding fails.
+
+    Rows are inserted `batch_size` at a time, one transaction per batch, in
+    WAL mode; the indexes are created after loading. Files can be added to
+    an existing database.
+
+    Returns:
+        int: the number of nodes inserted
+    """
+    connection = sqlite3.connect(database)
+    try:
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(SCHEMA)
+
+        count = 0
+        for path in paths:
+            count += _export_file(
+                connection, Path(path), values, max_depth, batch_size
+            )
+
+        connection.executescript(INDEXES)
+    finally:
+        connection.close()
+    return count
@@ -0,0 +1,237 @@
+from enum import IntEnum
+from typing import Dict, List, NamedTuple, Tuple
+from asn1decoder.asn1types import ASN1Encoding
+from asn1decoder.asn1parser import parse_encoding
+
+
+class ErrorCode(IntEnum):
+    """
+    Reasons reported by the non-raising validation functions. OK is 0, so a
+    code can be tested for truth and stored in a byte array.
+    """
+
+    OK = 0
+    # structure
+    TRUNCATED = 1
+    BAD_HIGH_TAG = 2
+    BAD_LENGTH = 3
+    INDEFINITE_PRIMITIVE = 4
+    MISSING_EOC = 5
+    LENGTH_MISMATCH = 6
+    # values
+    UNEXPECTED_TAG = 7
+    CONSTRUCTED_FORM = 8
+    EMPTY_CONTENT = 9
+    NOT_MINIMAL = 10
+    NON_EMPTY_CONTENT = 11
+    INVALID_CONTENT = 12
+    INVALID_CHARACTER = 13
+    INVALID_LENGTH = 14
+    INVALID_UNUSED_BITS = 15
+    INVALID_TIME = 16
+    INVALID_SEGMENT = 17
+    NO_DECODER = 18
+    # validate_structure
+    TRAILING_DATA = 19
+    INDEFINITE_LENGTH = 20
+    NON_MINIMAL_LENGTH = 21
+    NON_MINIMAL_TAG = 22
+
+
+REASONS: Dict[ErrorCode, str] = {
+    ErrorCode.OK: "well-formed",
+    ErrorCode.TRUNCATED: "unexpected end of data",
+    ErrorCode.BAD_HIGH_TAG: "first subsequent tag octet has bits 7-1 all zero",
+    ErrorCode.BAD_LENGTH: "length octet 0xFF is reserved",
+    ErrorCode.INDEFINITE_PRIMITIVE: "primitive encoding with indefinite length",
+    ErrorCode.MISSING_EOC: "missing end-of-contents octets",
+    ErrorCode.LENGTH_MISMATCH: "content overruns the length of its parent",
+    ErrorCode.UNEXPECTED_TAG: "unexpected tag",
+    ErrorCode.CONSTRUCTED_FORM: "constructed form not allowed for this type",
+    ErrorCode.EMPTY_CONTENT: "empty content",
+    ErrorCode.NOT_MINIMAL: "value not minimally encoded",
+    ErrorCode.NON_EMPTY_CONTENT: "content shall be empty",
+    ErrorCode.INVALID_CONTENT: "invalid content",
+    ErrorCode.INVALID_CHARACTER: "invalid character",
+    ErrorCode.INVALID_LENGTH: "invalid content length for this type",
+    ErrorCode.INVALID_UNUSED_BITS: "invalid number of unused bits",
+    ErrorCode.INVALID_TIME: "invalid time",
+    ErrorCode.INVALID_SEGMENT: "invalid segment of a constructed string",
+    ErrorCode.NO_DECODER: "no decoder for this tag",
+    ErrorCode.TRAILING_DATA: "trailing data after the encoding",
+    ErrorCode.INDEFINITE_LENGTH: "indefinite length not allowed in DER",
+    ErrorCode.NON_MINIMAL_LENGTH: "length octets not minimally encoded",
+    ErrorCode.NON_MINIMAL_TAG: "high-tag-number form used for a tag below 31",
+}
+
+# universal string types, which DER requires to be primitive
+_STRING_TAGS = frozenset((3, 4, 12, 18, 19, 20, 21, 22, 25, 26, 27, 28, 29, 30))
+
+
+# (code, offset): offset is where the encoding ends when code is OK, otherwise
+# where the error was found
+Check = Tuple[ErrorCode, int]
+
+
+def check_encoding(
+    data: bytes | memoryview, offset: int = 0, der: bool = False
+) -> Check:
+    """
+    Checks, without raising and without building any node, that the encoding
+    at `offset` would be accepted by `parse_encoding`. Nested encodings are
+    walked iteratively. With `der` the encoding must also follow the DER
+    restrictions on tags, lengths and constructed strings.
+
+    Returns:
+        (ErrorCode, int): the code and the end offset, or the error offset
+    """
+    size = len(data)
+    # end offsets of the open constructed encodings, None when indefinite
+    ends: List[int | None] = []
+
+    while True:
+        if ends:
+            end = ends[-1]
+            if end is None:
+                if offset + 2 > size:
+                    return ErrorCode.MISSING_EOC, offset
+                if data[offset] == 0 and data[offset + 1] == 0:
+                    offset += 2
+                    ends.pop()
+                    if not ends:
+                        return ErrorCode.OK, offset
+                    continue
+            elif offset >= end:
+                if offset != end:
+                    return ErrorCode.LENGTH_MISMATCH, offset
+                ends.pop()
+                if not ends:
+                    return ErrorCode.OK, offset
+                continue
+
+        start = offset
+        if offset >= size:
+            return ErrorCode.TRUNCATED, offset
+
+        identifier_octet = data[offset]
+        offset += 1
+        tag_number = identifier_octet & 0x1F
+        if tag_number == 0x1F:
+            if offset >= size:
+                return ErrorCode.TRUNCATED, offset
+            if data[offset] & 0x7F == 0:
+                return ErrorCode.BAD_HIGH_TAG, offset
+            tag_number = 0
+            while data[offset] & 0x80:
+                tag_number = tag_number << 7 | data[offset] & 0x7F
+                offset += 1
+                if offset >= size:
+                    return ErrorCode.TRUNCATED, offset
+            tag_number = tag_number << 7 | data[offset]
+            offset += 1
+            if der and tag_number < 0x1F:
+                return ErrorCode.NON_MINIMAL_TAG, start
+
+        if offset >= size:
+            return ErrorCode.TRUNCATED, offset
+        byte = data[offset]
+        offset += 1
+        constructed = identifier_octet & 0x20
+
+        # 10.2 DER encodes universal string types in the primitive form
+        universal = identifier_octet < 0x40
+        if der and constructed and universal and tag_number in _STRING_TAGS:
+            return ErrorCode.CONSTRUCTED_FORM, start
+
+        if byte == 0x80:
+            if not constructed:
+                return ErrorCode.INDEFINITE_PRIMITIVE, start
+            if der:
+                return ErrorCode.INDEFINITE_LENGTH, offset - 1
+            ends.append(None)
+            continue
+
+        if byte < 0x80:
+            length = byte
+        elif byte == 0xFF:
+            return ErrorCode.BAD_LENGTH, offset - 1
+        else:
+            length_end = offset + (byte & 0x7F)
+            if length_end > size:
+                return ErrorCode.TRUNCATED, size
+            length = int.from_bytes(data[offset:length_end], "big")
+            # 10.1 DER uses the definite form with the fewest length octets
+            if der and (length < 0x80 or data[offset] == 0):
+                return ErrorCode.NON_MINIMAL_LENGTH, offset - 1
+            offset = length_end
+
+        if constructed:
+            if length:
+                ends.append(offset + length)
+                continue
+        else:
+            # parse_encoding does not look at the content of empty primitives
+            if length and offset + length > size:
+                return ErrorCode.TRUNCATED, size
+            offset += length
+
+        if not ends:
+            return ErrorCode.OK, offset
+
+
+def try_parse_encoding(
+    data: memoryview, offset: int = 0
+) -> Tuple[bool, ASN1Encoding | ErrorCode, int]:
+    """
+    Non-raising `parse_encoding`. The structure is checked first with
+    `check_encoding`, so the tree is built only for well-formed data.
+
+    Returns:
+        (ok, value, offset): the encoding and its end offset, or the error
+        code and the offset of the error
+    """
+    code, end = check_encoding(data, offset)
+    if code:
+        return False, code, end
+    return True, parse_encoding(data, offset), end
+
+
+class StructureCheck(NamedTuple):
+    code: ErrorCode
+    offset: int
+    reason: str
+
+    @property
+    def ok(self) -> bool:
+        return self.code is ErrorCode.OK
+
+
+def validate_structure(
+    buf: bytes | memoryview, profile: str = "ber", multiple: bool = False
+) -> StructureCheck:
+    """
+    Checks that `buf` holds a single well-formed encoding (a sequence of
+    them with `multiple`) and nothing else, applying the rules of
+    `parse_encoding` without building any node. The "der" profile also
+    rejects indefinite lengths, non-minimal length and tag octets and
+    constructed strings.
+
+    Returns:
+        StructureCheck: the code, offset and reason of the first error, or
+        ErrorCode.OK and the size of the buffer
+    """
+    if profile not in ("ber", "der"):
+        raise ValueError(f"unknown profile {profile!r}, expected 'ber' or 'der'")
+
+    der = profile == "der"
+    size = len(buf)
+    offset = 0
+    while True:
+        code, offset = check_encoding(buf, offset, der)
+        if code:
+            return StructureCheck(code, offset, REASONS[code])
+        if offset == size:
+            return StructureCheck(code, offset, REASONS[code])
+        if not multiple:
+            code = ErrorCode.TRAILING_DATA
+            return StructureCheck(code, offset, REASONS[code])
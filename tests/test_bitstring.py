@@ -0,0 +1,108 @@
+import pytest
+from asn1decoder.asn1parser import parse_encoding
+from asn1decoder.asn1values import (
+    parse_bitstring,
+    decode_value,
+    BitString,
+    BitStringParserError,
+    KEY_USAGE_BITS,
+)
+
+
+def test_bitstring_primitive():
+    """'0000101 10111'B: 12 bits, 4 unused"""
+    data = memoryview(
+        bytes(
+            [
+                0b0000_0011,  # UNIVERSAL 3 primitive
+                0b0000_0011,  # length 3
+                0b0000_0100,  # 4 unused bits
+                0b0000_1011,
+                0b0111_1111,  # unused bits are not zero, BER allows it
+            ]
+        )
+    )
+    value = parse_bitstring(parse_encoding(data=data, offset=0))
+
+    assert value.bit_length == 12
+    assert value.to_int() == 0b0000_1011_0111
+    assert value.to_bytes() == b"\x0b\x70"
+    assert value.to_bytes(mask=False) == b"\x0b\x7f"
+    assert list(value) == [0, 0, 0, 0, 1, 0, 1, 1, 0, 1, 1, 1]
+    assert list(value.iter_set_bits()) == [4, 6, 7, 9, 10, 11]
+    assert value[4] == 1 and value[-1] == 1
+    assert repr(value) == "BitString('000010110111'B)"
+    with pytest.raises(IndexError):
+        value[12]
+
+    # a view over the source buffer, not a copy
+    assert value.content.obj is data.obj
+
+
+def test_bitstring_empty():
+    data = memoryview(bytes([0b0000_0011, 0b0000_0001, 0b0000_0000]))
+    value = parse_bitstring(parse_encoding(data=data, offset=0))
+    assert value.bit_length == 0
+    assert value.to_int() == 0
+    assert list(value.iter_set_bits()) == []
+
+
+def test_bitstring_key_usage():
+    """digitalSignature, keyEncipherment and decipherOnly"""
+    data = memoryview(
+        bytes([0b0000_0011, 0b0000_0011, 0b0000_0111, 0b1010_0000, 0b1000_0000])
+    )
+    value = decode_value(parse_encoding(data=data, offset=0))
+
+    assert isinstance(value, BitString)
+    assert value.named_bits(KEY_USAGE_BITS) == {
+        "digitalSignature",
+        "keyEncipherment",
+        "decipherOnly",
+    }
+    assert value.named_bits({"keyEncipherment": 2, "cRLSign": 6}) == {
+        "keyEncipherment"
+    }
+
+
+def test_bitstring_constructed():
+    """BER constructed form, with a nested constructed segment"""
+    data = memoryview(
+        bytes(
+            [
+                0b0010_0011, 0b0000_1100,  # constructed BIT STRING
+                0b0000_0011, 0b0000_0010, 0x00, 0b1010_1010,
+                0b0010_0011, 0b0000_0110,  # nested constructed
+                0b0000_0011, 0b0000_0100, 0x04, 0xFF, 0xFF, 0b1111_0000,
+            ]
+        )
+    )  # fmt: skip
+    value = parse_bitstring(parse_encoding(data=data, offset=0))
+
+    assert value.bit_length == 8 + 20
+    assert value.to_bytes() == b"\xaa\xff\xff\xf0"
+    assert value == decode_value(parse_encoding(data=data, offset=0))
+
+
+def test_bitstring_errors():
+    cases = [
+        # unused bits > 7
+        bytes([0b0000_0011, 0b0000_0010, 0b0000_1000, 0xFF]),
+        # no content octets but unused bits
+        bytes([0b0000_0011, 0b0000_0001, 0b0000_0001]),
+        # no initial octet
+        bytes([0b0000_0011, 0b0000_0000]),
+        # unused bits in a segment which is not the last
+        bytes(
+            [
+                0b0010_0011, 0b0000_1000,
+                0b0000_0011, 0b0000_0010, 0x01, 0xFE,
+                0b0000_0011, 0b0000_0010, 0x00, 0xFF,
+            ]
+        ),  # fmt: skip
+        # segment of the wrong type
+        bytes([0b0010_0011, 0b0000_0011, 0b0000_0100, 0b0000_0001, 0xFF]),
+    ]
+    for data in cases:
+        with pytest.raises(BitStringParserError):
+            parse_bitstring(parse_encoding(data=memoryview(data), offset=0))
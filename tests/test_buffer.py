@@ -0,0 +1,130 @@
+from datetime import datetime, timezone
+import pytest
+from asn1decoder.asn1parser import parse_encoding, parse_header
+from asn1decoder.asn1values import (
+    BUFFER_PARSERS,
+    decode_value,
+    parse_integer_buffer,
+    parse_bitstring_buffer,
+    parse_octetstring_buffer,
+    parse_printablestring_buffer,
+    parse_generalizedtime_buffer,
+    parse_value_at,
+    IntegerParserError,
+    OctetStringParserError,
+    PrintableStringParserError,
+)
+
+
+def span(data: bytes, offset: int = 0):
+    _, encoding_type, _, header_length, content_length = parse_header(
+        memoryview(data), offset
+    )
+    return offset + header_length, content_length, bool(encoding_type)
+
+
+def test_primitive_values():
+    data = bytes(
+        [
+            0b0011_0000, 0b0000_1010,  # SEQUENCE
+            0b0000_0010, 0b0000_0010, 0xFF, 0x7F,  # INTEGER -129
+            0b0001_0011, 0b0000_0100, 0x41, 0x42, 0x20, 0x31,  # PrintableString
+        ]
+    )  # fmt: skip
+    buf = memoryview(data)
+
+    assert parse_integer_buffer(buf, 4, 2) == -129
+    assert parse_printablestring_buffer(buf, 8, 4) == "AB 1"
+    # bytes work as well as views
+    assert parse_integer_buffer(data, 4, 2) == -129
+
+
+def test_same_values_as_parse_functions():
+    cases = [
+        bytes([0x02, 0x01, 0x05]),
+        bytes([0x03, 0x02, 0x04, 0xF0]),
+        bytes([0x04, 0x02, 0xDE, 0xAD]),
+        bytes([0x05, 0x00]),
+        bytes([0x06, 0x03, 0x2A, 0x86, 0x48]),
+        bytes([0x0C, 0x02, 0xC3, 0xA9]),
+        bytes([0x12, 0x03, 0x31, 0x20, 0x32]),
+        bytes([0x16, 0x01, 0x7E]),
+        bytes([0x17, 0x0D]) + b"991231235959Z",
+        bytes([0x18, 0x0F]) + b"20240102030405Z",
+        bytes([0x1E, 0x02, 0x00, 0xE9]),
+    ]
+    for data in cases:
+        content_offset, content_length, constructed = span(data)
+        parser = BUFFER_PARSERS[data[0]]
+        expected = decode_value(parse_encoding(memoryview(data)))
+        assert parser(memoryview(data), content_offset, content_length, constructed) == (
+            expected
+        )
+
+
+def test_constructed_strings():
+    data = bytes(
+        [
+            0b0010_0100, 0b1000_0000,  # constructed OCTET STRING, indefinite
+            0b0000_0100, 0b0000_0001, 0x61,  # segment
+            0b0010_0100, 0b0000_0011,  # nested constructed segment
+            0b0000_0100, 0b0000_0001, 0x62,
+            0b0000_0000, 0b0000_0000,  # EOC
+        ]
+    )  # fmt: skip
+    assert parse_octetstring_buffer(memoryview(data), 2, None, True) == b"ab"
+
+    data = bytes(
+        [
+            0b0011_0011, 0b0000_0110,  # constructed PrintableString
+            0b0000_0100, 0b0000_0001, 0x41,
+            0b0000_0100, 0b0000_0001, 0x42,
+        ]
+    )  # fmt: skip
+    assert parse_printablestring_buffer(memoryview(data), 2, 6, True) == "AB"
+
+    data = bytes(
+        [
+            0b0010_0011, 0b0000_1000,  # constructed BIT STRING
+            0b0000_0011, 0b0000_0010, 0x00, 0x84,
+            0b0000_0011, 0b0000_0010, 0x04, 0xF0,
+        ]
+    )  # fmt: skip
+    assert parse_bitstring_buffer(memoryview(data), 2, 8, True).to_bytes() == (
+        b"\x84\xf0"
+    )
+
+
+def test_errors():
+    data = memoryview(bytes([0x02, 0x02, 0x00, 0x05]))
+    with pytest.raises(IntegerParserError, match="not minimally encoded"):
+        parse_integer_buffer(data, 2, 2)
+    with pytest.raises(IntegerParserError, match="shall be primitive"):
+        parse_integer_buffer(data, 2, 2, True)
+    with pytest.raises(IntegerParserError, match="exceeds the buffer"):
+        parse_integer_buffer(data, 2, 5)
+
+    # segment with the wrong tag
+    data = memoryview(bytes([0x24, 0x03, 0x02, 0x01, 0x05]))
+    with pytest.raises(OctetStringParserError, match="tag number = 4"):
+        parse_octetstring_buffer(data, 2, 3, True)
+
+    data = memoryview(bytes([0x13, 0x01, 0x2A]))
+    with pytest.raises(PrintableStringParserError):
+        parse_printablestring_buffer(data, 2, 1)
+
+
+def test_parse_value_at():
+    data = memoryview(
+        bytes([0x80, 0x01, 0x07])
+        + bytes([0x18, 0x0F])
+        + b"20240102030405Z"
+    )
+    assert parse_value_at(data, 0, as_type=2) == (7, 3)
+    assert parse_value_at(data, 3) == (
+        datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        20,
+    )
+    assert parse_generalizedtime_buffer(data, 5, 15, aware=False) == datetime(
+        2024, 1, 2, 3, 4, 5
+    )
@@ -0,0 +1,123 @@
+from array import array
+import pytest
+from asn1decoder.asn1types import TagClass
+from asn1decoder.asn1parser import LengthError
+from asn1decoder.columnar import FieldSpec, extract_columns, ColumnarExtractionError
+
+
+def tlv(identifier: int, content: bytes) -> bytes:
+    return bytes([identifier, len(content)]) + content
+
+
+def integer(value: int) -> bytes:
+    length = (value + (value < 0)).bit_length() // 8 + 1
+    return value.to_bytes(length, "big", signed=True)
+
+
+def cdr(number: bytes, duration: int, volume: int | None = None) -> bytes:
+    """SEQUENCE { [0] IA5String, [1] INTEGER, [2] SEQUENCE { [0] INTEGER } OPTIONAL }
+    with IMPLICIT tags"""
+    content = tlv(0x80, number) + tlv(0x81, integer(duration))
+    if volume is not None:
+        content += tlv(0xA2, tlv(0x80, integer(volume)))
+    return tlv(0x30, content)
+
+
+FIELDS = [
+    FieldSpec("number", path=[0], kind="str", as_type=22),
+    FieldSpec("duration", path=[1], kind="int", default=-1),
+    FieldSpec("volume", path=[2, 0], kind="float", default=0.0),
+]
+
+
+def test_extract_columns_container():
+    """Records are the children of a SEQUENCE OF"""
+    records = cdr(b"123", 60, 1000) + cdr(b"456", 300) + cdr(b"789", -5, 7)
+    data = memoryview(tlv(0x30, records))
+
+    columns = extract_columns(data, FIELDS)
+    assert columns["number"] == ["123", "456", "789"]
+    assert columns["duration"] == array("q", [60, 300, -5])
+    assert columns["volume"] == array("d", [1000.0, 0.0, 7.0])
+
+
+def test_extract_columns_concatenated_indefinite():
+    """Records laid one after the other, with indefinite lengths"""
+    record = (
+        bytes([0x30, 0x80])
+        + tlv(0x81, integer(42))
+        + tlv(0x80, b"555")
+        + bytes([0x00, 0x00])
+    )
+    data = memoryview(record + cdr(b"1", 1))
+
+    columns = extract_columns(data, FIELDS, container=False)
+    assert columns["number"] == ["555", "1"]
+    assert columns["duration"] == array("q", [42, 1])
+    assert columns["volume"] == array("d", [0.0, 0.0])
+
+
+def test_extract_columns_universal_path():
+    """Path elements can select universal tags"""
+    data = memoryview(tlv(0x30, tlv(0x30, tlv(0x02, b"\x07") + tlv(0x0C, b"ok"))))
+    fields = [
+        FieldSpec("n", path=[(TagClass.UNIVERSAL, 2)], default=0),
+        FieldSpec("s", path=[(TagClass.UNIVERSAL, 12)], kind="str"),
+    ]
+    columns = extract_columns(data, fields)
+    assert columns == {"n": array("q", [7]), "s": ["ok"]}
+
+
+def test_extract_columns_numpy():
+    """Numeric columns as NumPy arrays"""
+    numpy = pytest.importorskip("numpy")
+    data = memoryview(tlv(0x30, cdr(b"1", 10) + cdr(b"2", 20)))
+    columns = extract_columns(data, FIELDS, use_numpy=True)
+    assert columns["duration"].dtype == numpy.int64
+    assert columns["duration"].tolist() == [10, 20]
+
+
+def test_field_spec_validation():
+    """Numeric fields need a default and paths cannot overlap"""
+    with pytest.raises(ValueError, match="requires a default"):
+        FieldSpec("duration", path=[1])
+
+    with pytest.raises(ValueError, match="cannot hold universal tag 12"):
+        FieldSpec("name", path=[0], kind="int", default=0, as_type=12)
+
+    with pytest.raises(ValueError, match="cannot hold universal tag 4"):
+        FieldSpec("name", path=[0], kind="float", default=0.0, as_type=4)
+
+    with pytest.raises(ValueError, match="overlaps"):
+        extract_columns(
+            memoryview(tlv(0x30, b"")),
+            [
+                FieldSpec("a", path=[2], kind="bytes"),
+                FieldSpec("b", path=[2, 0], default=0),
+            ],
+        )
+
+
+def test_extract_columns_field_overruns_record():
+    """A field running past the end of its record is an error"""
+    data = memoryview(bytes.fromhex("3003800201") + bytes.fromhex("3003800107"))
+    with pytest.raises(LengthError, match="length mismatch"):
+        extract_columns(data, FIELDS, container=False)
+
+
+def test_extract_columns_primitive_record():
+    """Records shall be constructed"""
+    data = memoryview(tlv(0x30, tlv(0x02, b"\x01")))
+    with pytest.raises(ColumnarExtractionError, match="shall be constructed"):
+        extract_columns(data, FIELDS)
+
+
+def test_extract_columns_large_integers():
+    """An int column with a value beyond 64 bits becomes a list of ints"""
+    large = 1 << 70
+    records = cdr(b"1", 10) + cdr(b"2", large) + cdr(b"3", -large)
+    data = memoryview(tlv(0x30, records))
+
+    columns = extract_columns(data, FIELDS, use_numpy=False)
+    assert columns["duration"] == [10, large, -large]
+    assert columns["volume"] == array("d", [0.0, 0.0, 0.0])
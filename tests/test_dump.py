@@ -0,0 +1,177 @@
+import io
+from pathlib import Path
+import pytest
+from asn1decoder.asn1parser import (
+    ASN1ParserError,
+    EOCError,
+    iter_headers,
+    parse_encoding,
+)
+from asn1decoder.asn1types import EncodingType, TagClass
+from asn1decoder.dump import dump, dump_asn1parse, strparse
+
+FILES = Path(__file__).parent.parent / "files"
+
+DATA = memoryview(
+    bytes(
+        [
+            0b0011_0000, 0b1000_0000,  # SEQUENCE, indefinite
+            0b0000_0010, 0b0000_0001, 0x05,  # INTEGER 5
+            0b1010_0000, 0b0000_0101,  # [0]
+            0b0000_0100, 0b0000_0011, 0x61, 0x62, 0x63,  # OCTET STRING
+            0b0000_0000, 0b0000_0000,  # EOC
+            0b0000_0101, 0b0000_0000,  # NULL, second top-level encoding
+        ]
+    )
+)  # fmt: skip
+
+
+def _dump(data, **kwargs) -> str:
+    out = io.StringIO()
+    dump(data, out, **kwargs)
+    return out.getvalue()
+
+
+def test_iter_headers():
+    headers = list(iter_headers(DATA))
+    assert [(offset, depth, number) for offset, depth, _, _, number, _, _ in headers] == [
+        (0, 0, 16),
+        (2, 1, 2),
+        (5, 1, 0),
+        (7, 2, 4),
+        (14, 0, 5),
+    ]
+    assert headers[2][2:] == (
+        TagClass.CONTEXT_SPECIFIC,
+        EncodingType.CONSTRUCTED,
+        0,
+        2,
+        5,
+    )
+    assert headers[0][6] is None
+
+    assert [header[0] for header in iter_headers(DATA, max_depth=0)] == [0, 14]
+    assert [header[0] for header in iter_headers(DATA, 2, 5)] == [2]
+
+    with pytest.raises(EOCError):
+        list(iter_headers(DATA[:12]))
+
+
+def test_iter_headers_truncated_skipped_content():
+    """Content skipped at max_depth shall still be within the data"""
+    truncated = memoryview(bytes([0x30, 0x10, 0x02, 0x01, 0x01]))
+    with pytest.raises(ASN1ParserError, match="Unexpected end of data"):
+        list(iter_headers(truncated, max_depth=0))
+
+    empty = memoryview(bytes([0x30, 0x00]))
+    assert [header[0] for header in iter_headers(empty, max_depth=0)] == [0]
+
+
+def test_dump_lines():
+    assert _dump(DATA) == (
+        "UNIVERSAL CONSTRUCTED SEQUENCE INDEFINITE \n"
+        " UNIVERSAL PRIMITIVE INTEGER  b'\\x05'\n"
+        " CONTEXT_SPECIFIC CONSTRUCTED [0] DEFINITE \n"
+        "  UNIVERSAL PRIMITIVE OCTET-STRING  b'abc'\n"
+        "UNIVERSAL PRIMITIVE NULL  \n"
+    )
+
+
+def test_dump_options():
+    assert _dump(DATA, max_depth=1, max_content=2) == (
+        "UNIVERSAL CONSTRUCTED SEQUENCE INDEFINITE \n"
+        " UNIVERSAL PRIMITIVE INTEGER  05\n"
+        " CONTEXT_SPECIFIC CONSTRUCTED [0] DEFINITE \n"
+        "UNIVERSAL PRIMITIVE NULL  \n"
+    )
+    assert _dump(DATA, offset=7, length=5, max_content=2) == (
+        "UNIVERSAL PRIMITIVE OCTET-STRING  6162... (3 bytes)\n"
+    )
+
+
+def _dump_tree(encoding, level=0):
+    # the output of the former recursive dump
+    yield f"{' ' * level}{encoding}\n"
+    for inner in encoding.inner_encodings or []:
+        yield from _dump_tree(inner, level + 1)
+
+
+def test_dump_matches_tree():
+    data = memoryview((FILES / "bdata_ok.der").read_bytes())
+    lines = _dump(data).splitlines(keepends=True)
+    expected = list(_dump_tree(parse_encoding(data)))
+
+    assert len(lines) == len(expected)
+    for line, tree_line in zip(lines, expected):
+        if "OBJECT-IDENTIFIER" not in tree_line:
+            assert line == tree_line
+
+
+def _asn1parse(data, **kwargs) -> str:
+    out = io.StringIO()
+    dump_asn1parse(data, out, **kwargs)
+    return out.getvalue()
+
+
+def test_dump_offset_out_of_range():
+    assert _dump(memoryview(b"")) == ""
+    for offset in (-1, len(DATA), len(DATA) + 1):
+        with pytest.raises(ValueError, match="out of range"):
+            _dump(DATA, offset=offset)
+
+
+def test_asn1parse_matches_openssl():
+    data = memoryview((FILES / "bdata_ok.der").read_bytes())
+    # the first line is the openssl command
+    expected = (FILES / "bdata_ok.txt").read_bytes().decode("latin-1")
+    assert _asn1parse(data, dump=True) == expected.split("\n", 1)[1]
+
+
+NESTED = memoryview(
+    bytes(
+        [
+            0x30, 0x0C,
+            0x02, 0x02, 0xFF, 0x7F,  # INTEGER -129
+            0x04, 0x06,  # OCTET STRING holding a SEQUENCE
+            0x30, 0x04, 0x02, 0x02, 0x00, 0xFF,  # INTEGER 255
+        ]
+    )
+)  # fmt: skip
+
+
+def test_asn1parse_options():
+    assert _asn1parse(NESTED) == (
+        "    0:d=0  hl=2 l=  12 cons: SEQUENCE          \n"
+        "    2:d=1  hl=2 l=   2 prim: INTEGER           :-81\n"
+        "    6:d=1  hl=2 l=   6 prim: OCTET STRING      [HEX DUMP]:3004020200FF\n"
+    )
+    assert _asn1parse(NESTED, offset=2, length=4) == (
+        "    0:d=0  hl=2 l=   2 prim: INTEGER           :-81\n"
+    )
+    assert _asn1parse(NESTED, offset=6, dump=True, dump_limit=2) == (
+        "    0:d=0  hl=2 l=   6 prim: OCTET STRING      \n"
+        f"      0000 - 30 04 {' ' * 14 * 3}  0.\n"
+    )
+
+    inner = strparse(NESTED, [6])
+    assert bytes(inner) == bytes(NESTED[8:])
+    assert _asn1parse(inner) == (
+        "    0:d=0  hl=2 l=   4 cons: SEQUENCE          \n"
+        "    2:d=1  hl=2 l=   2 prim: INTEGER           :FF\n"
+    )
+
+    with pytest.raises(ValueError, match="out of range"):
+        strparse(NESTED, [14])
+
+    for offset in (-1, 14, 20):
+        with pytest.raises(ValueError, match="out of range"):
+            _asn1parse(NESTED, offset=offset)
+
+
+def test_asn1parse_empty_strings():
+    data = memoryview(bytes([0x30, 0x04, 0x13, 0x00, 0x04, 0x00]))
+    assert _asn1parse(data) == (
+        "    0:d=0  hl=2 l=   4 cons: SEQUENCE          \n"
+        "    2:d=1  hl=2 l=   0 prim: PRINTABLESTRING   :\n"
+        "    4:d=1  hl=2 l=   0 prim: OCTET STRING      \n"
+    )
@@ -0,0 +1,95 @@
+import io
+import json
+from pathlib import Path
+import pytest
+from asn1decoder.asn1parser import parse_encoding
+from asn1decoder.asn1values import decode_value
+from asn1decoder.export import export_json
+
+FILES = Path(__file__).parent.parent / "files"
+
+DATA = memoryview(
+    bytes(
+        [
+            0x30, 0x80,  # SEQUENCE, indefinite
+            0x02, 0x01, 0x05,  # INTEGER 5
+            0xA0, 0x03, 0x04, 0x01, 0xFF,  # [0] { OCTET STRING }
+            0x00, 0x00,  # EOC
+            0x13, 0x02, 0x41, 0x2A,  # PrintableString "A*", invalid
+        ]
+    )
+)  # fmt: skip
+
+
+def _export(data, **kwargs) -> str:
+    out = io.StringIO()
+    export_json(data, out, **kwargs)
+    return out.getvalue()
+
+
+def test_export_ndjson():
+    lines = _export(DATA).splitlines()
+    assert len(lines) == 2
+    first, second = map(json.loads, lines)
+
+    assert first["length"] is None and first["constructed"]
+    integer, tagged = first["children"]
+    assert integer == {
+        "offset": 2,
+        "class": "UNIVERSAL",
+        "tag": 2,
+        "constructed": False,
+        "header_length": 2,
+        "length": 1,
+        "value": 5,
+    }
+    assert tagged["class"] == "CONTEXT_SPECIFIC"
+    assert tagged["children"][0]["value"] == "/w=="
+
+    assert second["content"] == "QSo="
+    assert "'*'" in second["error"]
+
+
+def test_export_json_content():
+    document = json.loads(
+        _export(DATA, ndjson=False, values=False, content_encoding="hex")
+    )
+    assert [node["offset"] for node in document] == [0, 12]
+    assert document[0]["children"][0]["content"] == "05"
+    assert document[1]["content"] == "412a"
+
+    truncated = json.loads(_export(DATA, ndjson=False, max_depth=0))[0]
+    assert truncated["truncated"] and "children" not in truncated
+    tagged = json.loads(_export(DATA, max_depth=1).splitlines()[0])["children"][1]
+    assert tagged["truncated"] and "children" not in tagged
+    empty = json.loads(_export(memoryview(bytes([0x30, 0x00])), max_depth=1))
+    assert empty["children"] == [] and "truncated" not in empty
+    assert json.loads(_export(DATA[:0], ndjson=False)) == []
+
+    with pytest.raises(ValueError, match="content encoding"):
+        _export(DATA, content_encoding="base32")
+
+
+def _nodes(node):
+    yield node
+    for child in node.get("children", []):
+        yield from _nodes(child)
+
+
+def _encodings(encoding):
+    yield encoding
+    for inner in encoding.inner_encodings or []:
+        yield from _encodings(inner)
+
+
+def test_export_matches_tree():
+    data = memoryview((FILES / "bdata_ok.der").read_bytes())
+    (record,) = map(json.loads, _export(data).splitlines())
+    nodes = list(_nodes(record))
+    encodings = list(_encodings(parse_encoding(data)))
+
+    assert len(nodes) == len(encodings)
+    for node, encoding in zip(nodes, encodings):
+        assert node["tag"] == encoding.tag_number
+        if node["tag"] == 2 and node["class"] == "UNIVERSAL":
+            assert node["value"] == decode_value(encoding)
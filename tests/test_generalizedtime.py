@@ -0,0 +1,106 @@
+from array import array
+from datetime import datetime, timedelta, timezone
+import pytest
+from asn1decoder.asn1parser import parse_encoding
+from asn1decoder.asn1values import (
+    parse_generalizedtime,
+    parse_generalizedtime_epoch,
+    GeneralizedTimeParserError,
+    parse_times_epoch,
+)
+from asn1decoder.asn1values.buffer import BUFFER_PARSERS
+
+# -------------------------
+# GeneralizedTime (UNIVERSAL 24)
+# -------------------------
+
+
+def _generalizedtime_encoding(value: bytes, tag_number: int = 24):
+    return parse_encoding(data=memoryview(bytes([tag_number, len(value)]) + value))
+
+
+def test_generalizedtime_utc():
+    """GeneralizedTime in UTC (DER form)"""
+    encoding = _generalizedtime_encoding(b"20250711144521Z")
+    value = parse_generalizedtime(encoding)
+    assert value == datetime(2025, 7, 11, 14, 45, 21, tzinfo=timezone.utc)
+    assert parse_generalizedtime_epoch(encoding) == int(value.timestamp())
+
+
+def test_generalizedtime_fraction_and_offset():
+    """GeneralizedTime with fractional seconds and a UTC offset"""
+    encoding = _generalizedtime_encoding(b"20250711144521.25+0130")
+    value = parse_generalizedtime(encoding)
+    tz = timezone(timedelta(hours=1, minutes=30))
+    assert value == datetime(2025, 7, 11, 14, 45, 21, 250000, tzinfo=tz)
+    assert parse_generalizedtime_epoch(encoding, unit="ms") == int(
+        value.timestamp() * 1000
+    )
+
+
+def test_generalizedtime_fraction_of_minute():
+    """GeneralizedTime fraction applies to the last element present"""
+    encoding = _generalizedtime_encoding(b"202507111445,5-05")
+    value = parse_generalizedtime(encoding)
+    tz = timezone(timedelta(hours=-5))
+    assert value == datetime(2025, 7, 11, 14, 45, 30, tzinfo=tz)
+
+
+def test_generalizedtime_local():
+    """GeneralizedTime without designator is a local (naive) time"""
+    encoding = _generalizedtime_encoding(b"2025071114")
+    value = parse_generalizedtime(encoding)
+    assert value == datetime(2025, 7, 11, 14)
+    assert value.tzinfo is None
+
+
+def test_generalizedtime_invalid_month():
+    """GeneralizedTime with month out of range"""
+    encoding = _generalizedtime_encoding(b"20251311144521Z")
+    with pytest.raises(GeneralizedTimeParserError, match="invalid month"):
+        parse_generalizedtime(encoding)
+
+
+def test_generalizedtime_leap_day():
+    """GeneralizedTime honours leap years"""
+    encoding = _generalizedtime_encoding(b"20240229000000Z")
+    assert parse_generalizedtime(encoding).day == 29
+
+    encoding = _generalizedtime_encoding(b"21000229000000Z")
+    with pytest.raises(GeneralizedTimeParserError, match="invalid day"):
+        parse_generalizedtime(encoding)
+
+
+def test_generalizedtime_year_zero():
+    """GeneralizedTime year 0000 has no datetime"""
+    encoding = _generalizedtime_encoding(b"00000101000000Z")
+    with pytest.raises(GeneralizedTimeParserError, match="invalid year, 0"):
+        parse_generalizedtime(encoding)
+
+    with pytest.raises(GeneralizedTimeParserError, match="invalid year, 0"):
+        BUFFER_PARSERS[24](memoryview(b"00000101000000Z"), 0, 15)
+
+
+def test_generalizedtime_trailing_data():
+    """GeneralizedTime with garbage after the designator"""
+    encoding = _generalizedtime_encoding(b"20250711144521ZZ")
+    with pytest.raises(GeneralizedTimeParserError, match="trailing data"):
+        parse_generalizedtime(encoding)
+
+
+def test_generalizedtime_wrong_tag():
+    """GeneralizedTime parser rejects UTCTime encodings"""
+    encoding = _generalizedtime_encoding(b"250711144521Z", tag_number=23)
+    with pytest.raises(GeneralizedTimeParserError, match="tag number = 24"):
+        parse_generalizedtime(encoding)
+
+
+def test_times_epoch_batch():
+    """UTCTime and GeneralizedTime converted together to an int64 array"""
+    encodings = [
+        _generalizedtime_encoding(b"250711144521Z", tag_number=23),
+        _generalizedtime_encoding(b"20250711154521+0100"),
+        _generalizedtime_encoding(b"19700101000000.5Z"),
+    ]
+    values = parse_times_epoch(encodings, unit="ms")
+    assert values == array("q", [1752245121000, 1752245121000, 500])
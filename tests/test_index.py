@@ -0,0 +1,114 @@
+import os
+import struct
+from pathlib import Path
+import pytest
+from asn1decoder.asn1types import EncodingType, TagClass
+from asn1decoder.index import (
+    ASN1Index,
+    IndexFormatError,
+    StaleIndexError,
+    build_index,
+    load_index,
+    open_index,
+)
+
+FILES = Path(__file__).parent.parent / "files"
+
+RECORD = bytes([0x30, 0x06, 0x02, 0x01, 0x05, 0x04, 0x01, 0x41])
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "records.der"
+    path.write_bytes((FILES / "bdata_ok.der").read_bytes() + RECORD * 3)
+    return path
+
+
+def test_index_records(source):
+    index_path = build_index(source)
+    assert index_path == source.with_name("records.der.asn1idx")
+
+    with ASN1Index(index_path) as index:
+        assert len(index) == index.entry_count == 4
+        assert index.max_depth == 0
+        assert index.record(0) == (
+            0,
+            0,
+            TagClass.UNIVERSAL,
+            EncodingType.CONSTRUCTED,
+            16,
+            2,
+            None,
+        )
+        assert index.record(2).offset == 554
+        assert index.record_number(553) == 1
+        assert index.record_number(554) == 2
+
+        data = memoryview(source.read_bytes())
+        encoding = index.parse_record(data, 3)
+        assert encoding.header.length == len(RECORD)
+        assert bytes(encoding.inner_encodings[1].content) == b"A"
+
+
+def test_index_layout(source):
+    """The index is little-endian and its record table 8-octet aligned"""
+    index_path = build_index(source, max_depth=1)
+    raw = index_path.read_bytes()
+    records_offset = struct.unpack_from("<q", raw, 56)[0]
+    assert records_offset % 8 == 0
+
+    with ASN1Index(index_path) as index:
+        table = raw[records_offset:]
+        assert len(table) == 8 * len(index)
+        starts = [start for (start,) in struct.iter_unpack("<Q", table)]
+        assert [index.entry(start) for start in starts] == [
+            index.record(n) for n in range(len(index))
+        ]
+        assert starts[1] > starts[0] == 0
+        assert index.record(-1) == index.record(len(index) - 1)
+
+
+def test_index_nested(source):
+    with open_index(source, max_depth=1) as index:
+        assert index.max_depth == 1
+        assert [entry.offset for entry in index.record_entries(1)] == [546, 548, 551]
+        assert index.find(550).offset == 548
+        assert index.find(555).tag_number == 16
+        assert index.record_number(0) == 0
+
+
+def test_index_invalidation(source):
+    build_index(source)
+    with load_index(source) as index:
+        assert index.is_fresh(source)
+
+    stat = os.stat(source)
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    with pytest.raises(StaleIndexError):
+        load_index(source)
+    with open_index(source) as index:
+        assert index.is_fresh(source)
+
+    index_path = source.with_name("records.der.asn1idx")
+    index_path.write_bytes(b"not an index" * 10)
+    with pytest.raises(IndexFormatError):
+        ASN1Index(index_path)
+
+
+def test_index_limits(tmp_path):
+    deep = tmp_path / "deep.der"
+    deep.write_bytes(b"\x30\x80" * 300 + b"\x00\x00" * 300)
+    with ASN1Index(build_index(deep, max_depth=None)) as index:
+        assert index.entry_count == 300
+        assert index.entry(299).depth == 299
+
+    high_tag = tmp_path / "high_tag.der"
+    high_tag.write_bytes(bytes([0x1F, 0x90, 0x80, 0x80, 0x80, 0x00, 0x00]))
+    with ASN1Index(build_index(high_tag)) as index:
+        assert index.record(0).tag_number == 1 << 32
+
+    huge_tag = tmp_path / "huge_tag.der"
+    huge_tag.write_bytes(bytes([0x1F]) + b"\x81" * 10 + bytes([0x00, 0x00]))
+    with pytest.raises(IndexFormatError):
+        build_index(huge_tag)
+    assert list(tmp_path.glob("huge_tag.der.asn1idx*")) == []
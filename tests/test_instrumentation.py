@@ -0,0 +1,115 @@
+from pathlib import Path
+import pytest
+from asn1decoder.asn1parser import (
+    ASN1ParserError,
+    LengthError,
+    iter_headers,
+    parse_encoding,
+)
+from asn1decoder.asn1types import TagClass
+from asn1decoder.asn1values import decode_value
+from asn1decoder.instrumentation import (
+    Instrumentation,
+    per_tag_report,
+    select_decode_value,
+    select_iter_headers,
+    select_parse_encoding,
+)
+
+FILES = Path(__file__).parent.parent / "files"
+
+INTEGER = (TagClass.UNIVERSAL, 2)
+SEQUENCE = (TagClass.UNIVERSAL, 16)
+
+
+def test_disabled_selects_plain_functions():
+    assert select_parse_encoding(None) is parse_encoding
+    assert select_decode_value(None) is decode_value
+    assert select_iter_headers(None) is iter_headers
+
+
+def test_instrumented_parse_encoding():
+    data = memoryview((FILES / "bdata_ok.der").read_bytes())
+    events = []
+
+    def on_node_start(offset, depth, tag_class, tag_number):
+        events.append(("start", offset, depth))
+
+    def on_node_end(offset, depth, tag_class, tag_number, length):
+        events.append(("end", offset, length))
+
+    instrumentation = Instrumentation(on_node_start, on_node_end)
+    parse = select_parse_encoding(instrumentation)
+
+    encoding = parse(data, 0)
+    assert encoding == parse_encoding(data)
+    assert events[:2] == [("start", 0, 0), ("start", 2, 1)]
+    assert events[-1] == ("end", 0, len(data))
+
+    nodes = sum(1 for _ in iter_headers(data))
+    assert sum(instrumentation.nodes.values()) == nodes
+    assert instrumentation.nodes[INTEGER] == 3
+
+
+def test_instrumented_errors():
+    instrumentation = Instrumentation()
+    errors = []
+    instrumentation.on_error = lambda exc, offset: errors.append(offset)
+    parse = select_parse_encoding(instrumentation)
+    data = memoryview(bytes([0x30, 0x04, 0x02, 0x01, 0x01, 0x05, 0x00]))
+
+    with pytest.raises(LengthError):
+        parse(data, 0)
+    assert instrumentation.errors == {"LengthError": 1}
+    assert instrumentation.error_offsets == [("LengthError", 0)]
+    assert errors == [0]
+
+    walk = select_iter_headers(instrumentation)
+    with pytest.raises(LengthError):
+        list(walk(data))
+    assert instrumentation.errors["LengthError"] == 2
+
+
+MALFORMED = [
+    bytes([0x30, 0x80, 0x02, 0x01, 0x01]),  # missing EOC
+    bytes([0x04, 0x80, 0x00, 0x00]),  # primitive, indefinite
+    bytes([0x30, 0x03, 0x02, 0x02, 0x01]),  # child overruns its parent
+    bytes([0x30, 0x04, 0x02, 0x01, 0x01]),  # truncated
+    bytes([0x30, 0x05, 0x02, 0x01, 0x01, 0x1F, 0x81]),  # truncated tag
+    bytes([0x04, 0x82, 0x01]),
+    b"",
+]
+
+
+@pytest.mark.parametrize("data", MALFORMED, ids=lambda data: data.hex())
+def test_instrumented_errors_match_parse_encoding(data):
+    data = memoryview(data)
+    with pytest.raises(ASN1ParserError) as expected:
+        parse_encoding(data)
+
+    instrumentation = Instrumentation()
+    with pytest.raises(type(expected.value)) as raised:
+        select_parse_encoding(instrumentation)(data, 0)
+    assert str(raised.value) == str(expected.value)
+    assert instrumentation.errors == {type(expected.value).__name__: 1}
+
+
+def test_instrumented_decode_value():
+    ticks = iter(range(0, 1000, 10))
+    instrumentation = Instrumentation(clock=lambda: next(ticks))
+    decode = select_decode_value(instrumentation)
+    encoding = parse_encoding(memoryview(bytes([0x02, 0x02, 0x01, 0x00])))
+
+    assert decode(encoding) == 256
+    assert instrumentation.decode_calls[INTEGER] == 1
+    assert instrumentation.decode_ns[INTEGER] == 10
+    assert instrumentation.bytes_materialized == 2
+
+    with pytest.raises(ValueError):
+        decode(parse_encoding(memoryview(bytes([0x02, 0x02, 0x00, 0x01]))))
+    assert instrumentation.errors == {"IntegerParserError": 1}
+    assert per_tag_report(instrumentation) == {INTEGER: (0, 2, 20)}
+    assert instrumentation.slowest_tags(1) == [(INTEGER, 20)]
+
+    instrumentation.reset()
+    assert not instrumentation.decode_calls and not instrumentation.errors
@@ -1,6 +1,8 @@
+from array import array
 import pytest
 from asn1decoder.asn1parser import parse_encoding
 from asn1decoder.asn1values import parse_integer, IntegerParserError
+from asn1decoder.asn1values import parse_integer_lazy, parse_integers
 
 
 def test_integer_zero():
@@ -128,3 +130,69 @@ def test_integer_non_minimal_negative():
     encoding = parse_encoding(data=data, offset=0)
     with pytest.raises(IntegerParserError, match="not minimally encoded"):
         parse_integer(encoding=encoding)
+
+
+# ############################################################################
+# lazy and batched decoding
+# ############################################################################
+
+
+def _integer_encoding(value: int, length: int | None = None):
+    if length is None:
+        length = (value + (value < 0)).bit_length() // 8 + 1
+    content = value.to_bytes(length, byteorder="big", signed=True)
+    if len(content) < 128:
+        header = bytes([0x02, len(content)])
+    else:
+        header = bytes([0x02, 0x82]) + len(content).to_bytes(2, byteorder="big")
+    return parse_encoding(data=memoryview(header + content))
+
+
+def test_integer_lazy():
+    """Lazy INTEGER keeps the content view and converts on demand"""
+    modulus = (1 << 2047) + 12345
+    value = parse_integer_lazy(_integer_encoding(modulus))
+    assert value.byte_length == 257
+    assert value.tobytes() == modulus.to_bytes(257, byteorder="big", signed=True)
+    assert repr(value) == "LazyInteger(<257 bytes>)"
+    assert value == modulus
+    assert int(value) == modulus
+
+
+def test_integer_lazy_non_minimal():
+    """Lazy INTEGER still validates minimal encoding"""
+    with pytest.raises(IntegerParserError, match="not minimally encoded"):
+        parse_integer_lazy(_integer_encoding(5, length=2))
+
+
+def test_integers_array():
+    """Small INTEGERs decoded at once into an int64 array"""
+    values = [0, 5, -1, 127, 128, -129, 2**63 - 1, -(2**63)]
+    result = parse_integers([_integer_encoding(v) for v in values], use_numpy=False)
+    assert result == array("q", values)
+
+
+def test_integers_array_non_minimal():
+    """Batch decoding reports the first non minimally encoded value"""
+    encodings = [_integer_encoding(1), _integer_encoding(-1, length=2)]
+    with pytest.raises(IntegerParserError, match="not minimally encoded at index 1"):
+        parse_integers(encodings, use_numpy=False)
+
+
+def test_integers_overflow_fallback():
+    """Values not fitting 64 bits fall back to a list of ints"""
+    values = [1, 2**64, -(2**70)]
+    result = parse_integers([_integer_encoding(v) for v in values], use_numpy=False)
+    assert result == values
+
+
+def test_integers_numpy():
+    """Batch decoding into a NumPy array"""
+    numpy = pytest.importorskip("numpy")
+    values = [0, -1, 300, -(2**40)]
+    result = parse_integers([_integer_encoding(v) for v in values], use_numpy=True)
+    assert result.dtype == numpy.int64
+    assert result.tolist() == values
+
+    with pytest.raises(IntegerParserError, match="not minimally encoded at index 0"):
+        parse_integers([_integer_encoding(300, length=3)], use_numpy=True)
@@ -0,0 +1,68 @@
+import pytest
+from asn1decoder.asn1parser import parse_encoding
+from asn1decoder.asn1values import (
+    InternPool,
+    parse_ia5string,
+    parse_oid,
+    parse_printablestring,
+    parse_utf8string,
+    PrintableStringParserError,
+)
+
+
+def _encoding(identifier: int, content: bytes):
+    return parse_encoding(memoryview(bytes([identifier, len(content)]) + content))
+
+
+def test_repeated_values_share_one_object():
+    pool = InternPool()
+    first = parse_printablestring(_encoding(0x13, b"IT"), pool=pool)
+    # a separate buffer, as in another document
+    second = parse_printablestring(_encoding(0x13, b"IT"), pool=pool)
+
+    assert first == "IT"
+    assert first is second
+    assert pool.cache_info() == (1, 1, 4096, 1)
+
+
+def test_values_are_pooled_per_type():
+    pool = InternPool()
+    assert parse_utf8string(_encoding(0x0C, "Università".encode()), pool=pool) == (
+        "Università"
+    )
+    assert parse_ia5string(_encoding(0x16, b"a@b.it"), pool=pool) == "a@b.it"
+
+    oid = parse_oid(_encoding(0x06, b"\x2a\x86\x48"), pool=pool)
+    assert oid == "1.2.840"
+    assert parse_oid(_encoding(0x06, b"\x2a\x86\x48"), pool=pool) is oid
+
+    # same octets, different type
+    assert parse_ia5string(_encoding(0x16, b"\x2a\x01"), pool=pool) == "*\x01"
+    assert pool.cache_info().currsize == 4
+
+
+def test_lru_eviction_and_clear():
+    pool = InternPool(maxsize=2)
+    parse_printablestring(_encoding(0x13, b"A"), pool=pool)
+    parse_printablestring(_encoding(0x13, b"B"), pool=pool)
+    parse_printablestring(_encoding(0x13, b"A"), pool=pool)  # A most recent
+    parse_printablestring(_encoding(0x13, b"C"), pool=pool)  # evicts B
+
+    parse_printablestring(_encoding(0x13, b"A"), pool=pool)
+    assert pool.cache_info() == (2, 3, 2, 2)
+    parse_printablestring(_encoding(0x13, b"B"), pool=pool)
+    assert pool.cache_info().misses == 4
+
+    pool.clear()
+    assert pool.cache_info() == (0, 0, 2, 0)
+
+    with pytest.raises(ValueError):
+        InternPool(maxsize=0)
+
+
+def test_errors_are_not_pooled():
+    pool = InternPool()
+    for _ in range(2):
+        with pytest.raises(PrintableStringParserError):
+            parse_printablestring(_encoding(0x13, b"*"), pool=pool)
+    assert pool.cache_info() == (0, 2, 4096, 0)
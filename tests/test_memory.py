@@ -0,0 +1,44 @@
+from pathlib import Path
+from asn1decoder.asn1parser import iter_headers, parse_encoding
+from asn1decoder.asn1types import EncodingType, TagClass
+from asn1decoder.memory import check_memory_report, memory_report
+
+FILES = Path(__file__).parent.parent / "files"
+
+RECORD = bytes([0x30, 0x06, 0x02, 0x01, 0x05, 0x04, 0x01, 0x41])
+
+
+def test_memory_report():
+    data = memoryview((FILES / "bdata_ok.der").read_bytes())
+    report = memory_report(parse_encoding(data))
+    headers = list(iter_headers(data))
+
+    assert report.nodes == len(headers)
+    assert report.viewed_bytes == sum(
+        content_length
+        for _, _, _, encoding_type, _, _, content_length in headers
+        if encoding_type is EncodingType.PRIMITIVE
+    )
+    assert report.by_type["ASN1Encoding"].count == report.nodes
+    assert report.by_type["IdentifierComponent"].count == report.nodes
+    assert report.owned_bytes == sum(usage.bytes for usage in report.by_tag.values())
+    assert report.by_tag[(TagClass.UNIVERSAL, 2)].count == 3
+
+
+def test_memory_report_values():
+    tree = parse_encoding(memoryview(RECORD))
+    before = memory_report(tree)
+    assert "bytes" not in before.by_type
+
+    assert tree.inner_encodings[1].value == b"A"
+    after = memory_report(tree)
+    assert after.by_type["bytes"].count == 1
+    assert after.owned_bytes > before.owned_bytes
+    assert after.viewed_bytes == before.viewed_bytes == 2
+
+
+def test_memory_report_matches_tracemalloc():
+    data = memoryview(bytes([0x30, 0x82, 0x3A, 0x98]) + RECORD * 1875)
+    check = check_memory_report(data)
+    assert check.report.nodes == 1 + 3 * 1875
+    assert 0.9 < check.ratio < 1.1
@@ -0,0 +1,68 @@
+import json
+import threading
+from pathlib import Path
+import pytest
+from asn1decoder.asn1parser import EOCError
+from asn1decoder.asn1types import TagClass
+from asn1decoder.metrics import MetricsRegistry
+
+FILES = Path(__file__).parent.parent / "files"
+
+DATA = memoryview(bytes([0x30, 0x06, 0x02, 0x01, 0x05, 0x02, 0x01, 0x06]))
+
+
+def test_metrics_counters():
+    registry = MetricsRegistry(buckets=(1.0, 100.0))
+    encoding = registry.parse_encoding(DATA)
+    registry.parse_encoding(DATA)
+    assert registry.decode_value(encoding.inner_encodings[0]) == 5
+
+    with pytest.raises(EOCError):
+        registry.parse_encoding(memoryview(bytes([0x30, 0x80, 0x05, 0x00])))
+    with pytest.raises(ValueError):
+        registry.decode_value(registry.parse_encoding(memoryview(b"\x02\x00")))
+
+    snapshot = registry.snapshot()
+    assert (snapshot.documents, snapshot.bytes) == (3, 18)
+    assert snapshot.nodes == 9
+    assert snapshot.tags[(TagClass.UNIVERSAL, 2)] == 5
+    assert snapshot.errors == {"EOCError": 1, "IntegerParserError": 1}
+    assert snapshot.latency_buckets == [4, 4, 4]
+    assert snapshot.latency_count == 4
+
+    registry.reset()
+    assert registry.snapshot().documents == 0
+
+
+def test_metrics_threads():
+    registry = MetricsRegistry()
+
+    def work():
+        for _ in range(100):
+            registry.parse_encoding(DATA)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    snapshot = registry.snapshot()
+    assert snapshot.documents == 400
+    assert snapshot.nodes == 1200
+
+
+def test_metrics_exposition():
+    registry = MetricsRegistry(buckets=(1.0,))
+    registry.parse_encoding(DATA)
+
+    text = registry.to_prometheus()
+    assert "# TYPE asn1decoder_documents_parsed_total counter\n" in text
+    assert "asn1decoder_documents_parsed_total 1\n" in text
+    assert 'asn1decoder_tag_nodes_total{class="UNIVERSAL",tag="2"} 2\n' in text
+    assert 'asn1decoder_parse_duration_seconds_bucket{le="+Inf"} 1\n' in text
+    assert "asn1decoder_parse_duration_seconds_count 1\n" in text
+
+    document = json.loads(registry.to_json())
+    assert document["tags"] == {"UNIVERSAL:2": 2, "UNIVERSAL:16": 1}
+    assert document["parse_duration_seconds"]["buckets"] == {"1.0": 1, "+Inf": 1}
@@ -1,6 +1,23 @@
 import pytest
 from asn1decoder.asn1parser import parse_encoding
 from asn1decoder.asn1values import parse_oid, OIDParserError
+from asn1decoder.asn1values import (
+    decode_oid,
+    OIDDecoderCache,
+    register_oid_name,
+    lookup_oid_name,
+    encode_oid,
+    OIDMatcher,
+    parse_oid_arcs,
+    parse_relative_oid,
+    parse_relative_oid_arcs,
+    RelativeOIDParserError,
+)
+from asn1decoder.asn1values.oid import (
+    extract_oid_subidentifiers,
+    parse_oid_subidentifier,
+)
+from asn1decoder.asn1values.oid_registry import OID_NAMES
 
 
 # ############################################################################
@@ -79,3 +96,186 @@ def test_oid_last_byte_continuation_bit():
     encoding = parse_encoding(data=data, offset=0)
     with pytest.raises(OIDParserError, match="continuation bit set on last byte"):
         parse_oid(encoding)
+
+
+# ############################################################################
+# decoder cache and registry
+# ############################################################################
+
+
+def _oid_encoding(content: bytes):
+    return parse_encoding(data=memoryview(bytes([0x06, len(content)]) + content))
+
+
+def test_oid_cache_hits_and_misses():
+    """Repeated OIDs are served from the cache"""
+    cache = OIDDecoderCache(maxsize=4)
+    sha256 = bytes([0x60, 0x86, 0x48, 0x01, 0x65, 0x03, 0x04, 0x02, 0x01])
+
+    first = decode_oid(_oid_encoding(sha256), cache=cache)
+    second = decode_oid(_oid_encoding(sha256), cache=cache)
+
+    assert first is second
+    assert first.dotted == "2.16.840.1.101.3.4.2.1"
+    assert first.arcs == (2, 16, 840, 1, 101, 3, 4, 2, 1)
+    assert first.name == "sha256"
+    assert cache.cache_info() == (1, 1, 4, 1)
+
+
+def test_oid_cache_lru_eviction():
+    """The least recently used OID is evicted once maxsize is exceeded"""
+    cache = OIDDecoderCache(maxsize=2)
+    decode_oid(_oid_encoding(bytes([0x2A, 0x01])), cache=cache)  # 1.2.1
+    decode_oid(_oid_encoding(bytes([0x2A, 0x02])), cache=cache)  # 1.2.2
+    decode_oid(_oid_encoding(bytes([0x2A, 0x01])), cache=cache)  # hit, 1.2.1 is now recent
+    decode_oid(_oid_encoding(bytes([0x2A, 0x03])), cache=cache)  # evicts 1.2.2
+    assert cache.cache_info().currsize == 2
+
+    decode_oid(_oid_encoding(bytes([0x2A, 0x01])), cache=cache)
+    assert cache.hits == 2
+    decode_oid(_oid_encoding(bytes([0x2A, 0x02])), cache=cache)
+    assert cache.misses == 4
+
+
+def test_oid_registry():
+    """Unknown OIDs have no name until registered"""
+    oid = decode_oid(_oid_encoding(bytes([0x2A, 0x03, 0x04])), cache=OIDDecoderCache())
+    assert oid.dotted == "1.2.3.4"
+    assert oid.name is None
+
+    register_oid_name("1.2.3.4", "test-oid")
+    try:
+        assert oid.name == "test-oid"
+        assert lookup_oid_name("1.2.3.4") == "test-oid"
+    finally:
+        OID_NAMES.pop("1.2.3.4")
+
+
+# ############################################################################
+# raw encoded matcher
+# ############################################################################
+
+
+def test_encode_oid_roundtrip():
+    """encode_oid merges the first two arcs and is the inverse of parse_oid"""
+    assert encode_oid("2.999.3") == bytes([0x88, 0x37, 0x03])
+    assert encode_oid((1, 2, 840, 113549)) == bytes(
+        [0x2A, 0x86, 0x48, 0x86, 0xF7, 0x0D]
+    )
+
+    content = encode_oid("1.2.840.113549.1.7.2")
+    assert parse_oid(_oid_encoding(content)) == "1.2.840.113549.1.7.2"
+
+
+def test_oid_matcher_exact_and_longest_prefix():
+    """Exact matches win over prefixes, longer prefixes over shorter ones"""
+    matcher = OIDMatcher(
+        oids={"2.5.29.15": "keyUsage"},
+        prefixes={"2.5.29": "id-ce", "2.5": "ds", "1.2.840.113549.1.1": "pkcs1"},
+    )
+
+    assert matcher.match(encode_oid("2.5.29.15")) == "keyUsage"
+    assert matcher.match(encode_oid("2.5.29.19")) == "id-ce"
+    assert matcher.match(encode_oid("2.5.4.3")) == "ds"
+    assert matcher.match(encode_oid("1.2.840.113549.1.1.11")) == "pkcs1"
+    assert matcher.match(encode_oid("1.2.840.113549.1.7.2")) is None
+
+
+def test_oid_matcher_arc_boundary():
+    """A prefix does not match an arc that merely starts with the same bytes"""
+    matcher = OIDMatcher(prefixes={"1.2.3": "p"})
+    assert matcher.match(encode_oid("1.2.3.4")) == "p"
+    assert matcher.match(encode_oid("1.2.387")) is None  # 387 = 0x83 0x03
+
+
+def test_oid_matcher_root_arc():
+    """Root arc prefixes are resolved from the merged X*40+Y subidentifier"""
+    matcher = OIDMatcher(prefixes={"2": "joint-iso-itu-t", "1": "iso"})
+    assert matcher.match(encode_oid("2.999.3")) == "joint-iso-itu-t"
+    assert matcher.match(encode_oid("2.5.29")) == "joint-iso-itu-t"
+    assert matcher.match(encode_oid("1.39")) == "iso"
+
+
+def test_oid_matcher_encoding():
+    """match_encoding reads the content view of an OID node"""
+    matcher = OIDMatcher(oids={"2.16.840.1.101.3.4.2.1": "sha256"})
+    content = encode_oid("2.16.840.1.101.3.4.2.1")
+    assert matcher.match_encoding(_oid_encoding(content)) == "sha256"
+
+
+# ############################################################################
+# arcs output and RELATIVE-OID
+# ############################################################################
+
+
+def test_oid_arcs():
+    """parse_oid_arcs returns the integer components"""
+    encoding = _oid_encoding(bytes([0x88, 0x37, 0x03]))
+    assert parse_oid_arcs(encoding) == (2, 999, 3)
+
+
+def test_oid_first_arcs():
+    """The first subidentifier splits into X*40+Y"""
+    for content, arcs in (
+        (bytes([0x27, 0x01]), (0, 39, 1)),
+        (bytes([0x28]), (1, 0)),
+        (bytes([0x4F]), (1, 39)),
+        (bytes([0x50]), (2, 0)),
+    ):
+        assert parse_oid_arcs(_oid_encoding(content)) == arcs
+
+
+def test_oid_subidentifier_helpers():
+    """The subidentifier helpers split and evaluate the content octets"""
+    content = bytes([0x2A, 0x86, 0x48, 0x03])
+    subidentifiers = extract_oid_subidentifiers(content)
+    assert subidentifiers == [[0x2A], [0x86, 0x48], [0x03]]
+    assert [parse_oid_subidentifier(octets) for octets in subidentifiers] == [
+        42,
+        840,
+        3,
+    ]
+
+    with pytest.raises(OIDParserError, match="not minimally encoded"):
+        parse_oid_subidentifier([0x80, 0x01])
+
+
+def test_oid_non_minimal_inner_subidentifier():
+    """Non-minimal encoding is detected on any subidentifier, not just the first"""
+    encoding = _oid_encoding(bytes([0x2A, 0x03, 0x80, 0x01]))
+    with pytest.raises(OIDParserError, match="not minimally encoded"):
+        parse_oid_arcs(encoding)
+
+
+def test_relative_oid():
+    """RELATIVE-OID subidentifiers are not merged"""
+    data = memoryview(
+        bytes(
+            [
+                0b00001101,  # UNIVERSAL PRIMITIVE 13 (RELATIVE-OID)
+                0b00000100,  # length 4
+                0b00001000,  # 8
+                0b10000110,  # 0x86
+                0b01001000,  # 0x48 → 840
+                0b00000001,  # 1
+            ]
+        )
+    )
+    encoding = parse_encoding(data=data, offset=0)
+    assert parse_relative_oid_arcs(encoding) == (8, 840, 1)
+    assert parse_relative_oid(encoding) == "8.840.1"
+
+
+def test_relative_oid_last_byte_continuation_bit():
+    """RELATIVE-OID with MSB=1 on the last byte"""
+    data = memoryview(bytes([0b00001101, 0b00000001, 0b10000001]))
+    encoding = parse_encoding(data=data, offset=0)
+    with pytest.raises(RelativeOIDParserError, match="continuation bit"):
+        parse_relative_oid(encoding)
+
+
+def test_relative_oid_wrong_tag():
+    """RELATIVE-OID parser rejects OBJECT IDENTIFIER encodings"""
+    encoding = _oid_encoding(bytes([0x2A, 0x03]))
+    with pytest.raises(RelativeOIDParserError, match="tag number = 13"):
+        parse_relative_oid(encoding)
@@ -0,0 +1,222 @@
+from datetime import datetime, timezone
+import pytest
+from asn1decoder.asn1types import TagClass
+from asn1decoder.asn1parser import parse_encoding
+from asn1decoder.asn1values import (
+    decode_value,
+    decode_tree,
+    register_decoder,
+    unregister_decoder,
+    has_decoder,
+    parse_octetstring,
+    parse_integer,
+    parse_printablestring,
+    parse_utctime,
+    IntegerParserError,
+    PrintableStringParserError,
+    ValueDecoderError,
+)
+from asn1decoder.asn1values.buffer import BUFFER_PARSERS
+
+
+def test_decode_value_universal():
+    cases = [
+        (bytearray([0b0000_0010, 0b0000_0010, 0xFF, 0x7F]), -129),
+        (bytearray([0b0000_0101, 0b0000_0000]), None),
+        (bytearray([0b0000_0100, 0b0000_0000]), b""),
+        (bytearray([0b0000_0110, 0b0000_0010, 0x2A, 0x03]), "1.2.3"),
+        (bytearray([0b0001_0011, 0b0000_0010, 0x41, 0x42]), "AB"),
+        (bytearray([0b0001_0010, 0b0000_0010, 0x31, 0x20]), "1 "),
+        (bytearray([0b0001_1110, 0b0000_0010, 0x00, 0xE9]), "é"),
+        (
+            bytearray([0b0001_0111, 0b0000_1101]) + b"991231235959Z",
+            datetime(1999, 12, 31, 23, 59, 59),
+        ),
+    ]
+    for data, expected in cases:
+        assert decode_value(parse_encoding(memoryview(data))) == expected
+
+
+def test_decode_value_times():
+    """UTCTime decodes naive, GeneralizedTime aware, on every path"""
+    utctime = bytes([0x17, 13]) + b"991231235959Z"
+    generalizedtime = bytes([0x18, 15]) + b"19991231235959Z"
+    for data, tzinfo in ((utctime, None), (generalizedtime, timezone.utc)):
+        data = memoryview(data)
+        assert decode_value(parse_encoding(data)).tzinfo is tzinfo
+        assert BUFFER_PARSERS[data[0]](data, 2, len(data) - 2).tzinfo is tzinfo
+
+
+def test_decode_value_constructed_string():
+    data = bytearray(
+        [
+            0b0011_0011,  # constructed PrintableString
+            0b0000_1000,
+            0b0000_0100, 0b0000_0010, 0x41, 0x42,  # "AB"
+            0b0000_0100, 0b0000_0010, 0x43, 0x44,  # "CD"
+        ]
+    )  # fmt: skip
+    assert decode_value(parse_encoding(memoryview(data))) == "ABCD"
+
+
+def test_decode_value_errors():
+    # not minimally encoded
+    data = bytearray([0b0000_0010, 0b0000_0010, 0x00, 0x01])
+    with pytest.raises(IntegerParserError):
+        decode_value(parse_encoding(memoryview(data)))
+
+    data = bytearray([0b0001_0011, 0b0000_0001, 0x40])  # '@'
+    with pytest.raises(PrintableStringParserError):
+        decode_value(parse_encoding(memoryview(data)))
+
+    # SEQUENCE has no value decoder
+    data = bytearray([0b0011_0000, 0b0000_0000])
+    with pytest.raises(ValueDecoderError):
+        decode_value(parse_encoding(memoryview(data)))
+
+
+def test_register_decoder():
+    data = bytearray([0b0100_0001, 0b0000_0001, 0x07])  # [APPLICATION 1]
+    encoding = parse_encoding(memoryview(data))
+
+    register_decoder(TagClass.APPLICATION, 1, content_decoder=lambda c: c[0] * 2)
+    try:
+        assert has_decoder(TagClass.APPLICATION, 1)
+        assert decode_value(encoding) == 14
+    finally:
+        unregister_decoder(TagClass.APPLICATION, 1)
+
+    assert not has_decoder(TagClass.APPLICATION, 1)
+    with pytest.raises(ValueDecoderError):
+        decode_value(encoding)
+
+    with pytest.raises(ValueError):
+        register_decoder(TagClass.UNIVERSAL, 2, parse_octetstring)
+
+    with pytest.raises(ValueError):
+        register_decoder(TagClass.PRIVATE, 1)
+
+
+def test_decode_tree():
+    data = bytearray(
+        [
+            0b0011_0000, 0b0000_1110,  # SEQUENCE
+            0b0000_0010, 0b0000_0001, 0x05,  # INTEGER 5
+            0b1010_0000, 0b0000_0100,  # [0] constructed
+            0b0000_0101, 0b0000_0000,  # NULL
+            0b1000_0001, 0b0000_0000,  # [1] primitive, no decoder
+            0b1100_0010, 0b0000_0001, 0x09,  # [PRIVATE 2]
+            0b0000_0001, 0b0000_0000,  # BOOLEAN, no decoder
+        ]
+    )  # fmt: skip
+    encoding = parse_encoding(memoryview(data))
+
+    assert decode_tree(encoding) == [5, [None, b""], b"\x09", b""]
+
+    register_decoder(TagClass.PRIVATE, 2, content_decoder=lambda c: -c[0])
+    try:
+        assert decode_tree(encoding) == [5, [None, b""], -9, b""]
+    finally:
+        unregister_decoder(TagClass.PRIVATE, 2)
+
+    with pytest.raises(ValueDecoderError):
+        decode_tree(encoding, strict=True)
+
+
+def test_implicit_parsers():
+    # [0] IMPLICIT INTEGER 5
+    encoding = parse_encoding(memoryview(bytearray([0b1000_0000, 0b0000_0001, 0x05])))
+    with pytest.raises(IntegerParserError):
+        parse_integer(encoding)
+    assert parse_integer(encoding, implicit=True) == 5
+
+    # [APPLICATION 3] IMPLICIT PrintableString
+    encoding = parse_encoding(memoryview(bytearray([0b0100_0011, 0b0000_0001, 0x41])))
+    with pytest.raises(PrintableStringParserError):
+        parse_printablestring(encoding)
+    assert parse_printablestring(encoding, implicit=True) == "A"
+
+    # [1] IMPLICIT UTCTime
+    data = bytearray([0b1000_0001, 0b0000_1101]) + b"991231235959Z"
+    encoding = parse_encoding(memoryview(data))
+    assert parse_utctime(encoding, implicit=True) == datetime(1999, 12, 31, 23, 59, 59)
+
+
+def test_decode_value_as_type():
+    encoding = parse_encoding(memoryview(bytearray([0b1000_0000, 0b0000_0001, 0x05])))
+    with pytest.raises(ValueDecoderError):
+        decode_value(encoding)
+    assert decode_value(encoding, as_type=2) == 5
+    assert decode_value(encoding, as_type=4) == b"\x05"
+
+    # constructed [2] IMPLICIT OCTET STRING, decoded by the full parser
+    data = bytearray(
+        [
+            0b1010_0010, 0b0000_0110,  # [2] constructed
+            0b0000_0100, 0b0000_0001, 0x61,  # OCTET STRING segment
+            0b0000_0100, 0b0000_0001, 0x62,  # OCTET STRING segment
+        ]
+    )  # fmt: skip
+    assert decode_value(parse_encoding(memoryview(data)), as_type=4) == b"ab"
+
+    with pytest.raises(ValueDecoderError, match="UNIVERSAL tag 1"):
+        decode_value(encoding, as_type=1)
+
+
+def test_decode_tree_tag_types():
+    data = bytearray(
+        [
+            0b0011_0000, 0b0000_1011,  # SEQUENCE
+            0b1000_0000, 0b0000_0001, 0x05,  # [0] IMPLICIT INTEGER
+            0b1010_0001, 0b0000_0011,  # [1] IMPLICIT SEQUENCE
+            0b1000_0000, 0b0000_0001, 0x07,  # [0] IMPLICIT INTEGER
+            0b0100_0010, 0b0000_0001, 0x41,  # [APPLICATION 2] IMPLICIT IA5String
+        ]
+    )  # fmt: skip
+    encoding = parse_encoding(memoryview(data))
+
+    assert decode_tree(encoding) == [b"\x05", [b"\x07"], b"A"]
+
+    tag_types = {0: 2, 1: 16, (TagClass.APPLICATION, 2): 22}
+    assert decode_tree(encoding, tag_types=tag_types) == [5, [7], "A"]
+
+    with pytest.raises(ValueDecoderError, match="mapped to constructed type"):
+        decode_tree(encoding, tag_types={0: 17})
+    with pytest.raises(ValueDecoderError):
+        decode_tree(encoding, tag_types={0: 1})
+
+
+def test_value_is_cached():
+    data = bytearray(
+        [
+            0b0011_0000, 0b0000_0111,  # SEQUENCE
+            0b0000_0010, 0b0000_0001, 0x05,  # INTEGER 5
+            0b0000_0010, 0b0000_0010, 0x00, 0x05,  # INTEGER, not minimal
+        ]
+    )  # fmt: skip
+    encoding = parse_encoding(memoryview(data))
+    valid, invalid = encoding.inner_encodings
+
+    assert valid.value == 5
+    # served from the cache, not decoded again
+    data[4] = 0x06
+    assert valid.value == 5
+    valid.clear_value()
+    assert valid.value == 6
+
+    with pytest.raises(IntegerParserError):
+        invalid.value
+    with pytest.raises(IntegerParserError):
+        invalid.value
+    assert invalid._value_cache is not None
+
+    encoding.clear_value(recursive=True)
+    assert valid._value_cache is None and invalid._value_cache is None
+
+    # SEQUENCE has no registered decoder
+    with pytest.raises(ValueDecoderError):
+        encoding.value
+
+    # the cache does not take part in comparisons and representations
+    assert valid == parse_encoding(memoryview(data), 2)
+    assert "_value_cache" not in repr(valid)
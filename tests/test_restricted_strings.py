@@ -6,6 +6,8 @@ from asn1decoder.asn1values import parse_printablestring, PrintableStringParserE
 from asn1decoder.asn1values import parse_ia5string, IA5StringParserError
 from asn1decoder.asn1values import parse_visiblestring, VisibleStringParserError
 from asn1decoder.asn1values import parse_generalstring, GeneralStringParserError
+from asn1decoder.asn1values.general_string import ASN1GeneralString
+from asn1decoder.asn1values import parse_teletexstring, TeletexStringParserError
 
 
 # -------------------------
@@ -102,6 +104,28 @@ def test_numericstring_invalid_char():
         parse_numericstring(encoding)
 
 
+def test_numericstring_constructed_invalid_char():
+    """NumericString constructed with invalid character in a segment"""
+    data = memoryview(
+        bytes(
+            [
+                0b00110010,  # Constructed, UNIVERSAL 18 NumericString
+                0b00000111,  # total length 7 bytes
+                0b00000100,  # tag OCTET STRING
+                0b00000010,  # length 2
+                0b00110001,  # '1'
+                0b00110010,  # '2'
+                0b00000100,  # tag OCTET STRING
+                0b00000001,  # length 1
+                0b01000001,  # 'A' (invalid for NumericString)
+            ]
+        )
+    )
+    encoding = parse_encoding(data=data, offset=0)
+    with pytest.raises(NumericStringParserError, match="char 'A' is not valid"):
+        parse_numericstring(encoding)
+
+
 def test_numericstring_empty():
     """NumericString empty"""
     data = memoryview(
@@ -207,6 +231,23 @@ def test_printablestring_invalid_char():
         parse_printablestring(encoding)
 
 
+def test_printablestring_invalid_non_ascii():
+    """PrintableString with a byte outside 7-bit ASCII"""
+    data = memoryview(
+        bytes(
+            [
+                0b00010011,  # UNIVERSAL 19 PrintableString (primitive)
+                0b00000010,  # length 2
+                0b01000001,  # 'A'
+                0b11000011,  # 0xC3
+            ]
+        )
+    )
+    encoding = parse_encoding(data=data, offset=0)
+    with pytest.raises(PrintableStringParserError, match="cannot decode byte 'c3'"):
+        parse_printablestring(encoding)
+
+
 def test_printablestring_empty():
     """PrintableString empty"""
     data = memoryview(
@@ -467,6 +508,13 @@ def test_generalstring_primitive():
     assert value == bytes([0x41, 0x42, 0xC3, 0x44])
 
 
+def test_generalstring_any_octet():
+    """GeneralString content is not checked against an alphabet"""
+    encoding = parse_encoding(data=memoryview(bytes([0x1B, 0x02, 0xFF, 0x80])))
+    assert parse_generalstring(encoding) == b"\xff\x80"
+    assert ASN1GeneralString(encoding).is_valid_char("\xff")
+
+
 def test_generalstring_constructed_indefinite():
     """GeneralString constructed indefinite length"""
     data = memoryview(
@@ -571,3 +619,66 @@ def test_generalstring_constructed_invalid_subtag():
     encoding = parse_encoding(data=data, offset=0)
     with pytest.raises(OctetStringParserError):
         parse_generalstring(encoding)
+
+
+# -------------------------
+# TeletexString (UNIVERSAL 20)
+# -------------------------
+
+
+def test_teletexstring_primitive():
+    """TeletexString primitive with supplementary characters"""
+    data = memoryview(
+        bytes(
+            [
+                0b00010100,  # UNIVERSAL PRIMITIVE 20
+                0b00000100,  # length = 4
+                0b01000001,  # 'A'
+                0xA4,  # '$'
+                0xFB,  # 'ß'
+                0xE8,  # 'Ł'
+            ]
+        )
+    )
+    encoding = parse_encoding(data=data, offset=0)
+    value = parse_teletexstring(encoding)
+    assert value == "A$ßŁ"
+
+
+def test_teletexstring_diacritic():
+    """TeletexString non-spacing diacritic precedes the base character"""
+    data = memoryview(
+        bytes(
+            [
+                0b00110100,  # UNIVERSAL CONSTRUCTED 20
+                0b00001000,  # length = 8
+                0b00000100,  # OCTET STRING
+                0b00000010,  # length = 2
+                0b01000011,  # 'C'
+                0b01100001,  # 'a'
+                0b00000100,  # OCTET STRING
+                0b00000010,  # length = 2
+                0xC2,  # acute accent
+                0b01100101,  # 'e'
+            ]
+        )
+    )
+    encoding = parse_encoding(data=data, offset=0)
+    value = parse_teletexstring(encoding)
+    assert value == "Caé"
+
+
+def test_teletexstring_dangling_diacritic():
+    """TeletexString ending with a non-spacing diacritic"""
+    data = memoryview(bytes([0b00010100, 0b00000010, 0b01100101, 0xC2]))
+    encoding = parse_encoding(data=data, offset=0)
+    with pytest.raises(TeletexStringParserError, match="diacritical"):
+        parse_teletexstring(encoding)
+
+
+def test_teletexstring_undefined_char():
+    """TeletexString with a character not assigned in T.61"""
+    data = memoryview(bytes([0b00010100, 0b00000001, 0b01111110]))  # '~'
+    encoding = parse_encoding(data=data, offset=0)
+    with pytest.raises(TeletexStringParserError):
+        parse_teletexstring(encoding)
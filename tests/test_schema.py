@@ -0,0 +1,228 @@
+from datetime import datetime, timezone
+import pytest
+from asn1decoder.schema import (
+    compile_schema,
+    generate_decoder_source,
+    parse_module,
+    SchemaDecodeError,
+    SchemaError,
+)
+from asn1decoder.asn1values import IntegerParserError
+
+
+def tlv(identifier: int, content: bytes) -> bytes:
+    return bytes([identifier, len(content)]) + content
+
+
+SCHEMA = """
+CallRecords DEFINITIONS IMPLICIT TAGS ::= BEGIN
+
+id-records OBJECT IDENTIFIER ::= { 1 2 3 }  -- value assignments are skipped
+
+Record ::= [APPLICATION 1] SEQUENCE {
+    serial   INTEGER,
+    name     [0] UTF8String OPTIONAL,
+    kind     [1] INTEGER { voice(0), data(1) } DEFAULT data,
+    callee   [2] EXPLICIT PrintableString (SIZE(1..20)),
+    items    SEQUENCE OF Item,
+    target   Target,
+    attrs    [3] SET { a [0] INTEGER, b [1] IA5String OPTIONAL },
+    ...
+}
+
+Item ::= SEQUENCE { id OBJECT IDENTIFIER, value OCTET STRING }
+
+Target ::= CHOICE {
+    number  [4] NumericString,
+    host    [5] IA5String,
+    when    GeneralizedTime
+}
+
+Records ::= SEQUENCE OF Record
+
+END
+"""
+
+
+@pytest.fixture
+def decoders(tmp_path):
+    return compile_schema(SCHEMA, cache_dir=tmp_path)
+
+
+def record(
+    *extra: bytes,
+    serial: bytes = b"\x2a",
+    name: bytes | None = b"bob",
+    kind: bytes | None = None,
+) -> bytes:
+    content = tlv(0x02, serial)
+    if name is not None:
+        content += tlv(0x80, name)
+    if kind is not None:
+        content += tlv(0x81, kind)
+    content += tlv(0xA2, tlv(0x13, b"Alice"))
+    content += tlv(0x30, tlv(0x30, tlv(0x06, b"\x2a\x03") + tlv(0x04, b"\xff")))
+    content += tlv(0x84, b"123")
+    content += tlv(0xA3, tlv(0x81, b"x") + tlv(0x80, b"\x07"))
+    return tlv(0x61, content + b"".join(extra))
+
+
+def test_decode_sequence(decoders):
+    value = decoders.decode_Record(record())
+
+    assert type(value).__name__ == "Record"
+    assert value.serial == 42
+    assert value.name == "bob"
+    assert value.kind == 1  # DEFAULT data
+    assert value.callee == "Alice"
+    assert [(item.id, item.value) for item in value.items] == [("1.2.3", b"\xff")]
+    assert value.target == ("number", "123")
+    # SET components in any order
+    assert (value.attrs.a, value.attrs.b) == (7, "x")
+
+
+def test_result_classes_use_slots(decoders):
+    value = decoders.decode_Record(record())
+    assert not hasattr(value, "__dict__")
+    with pytest.raises(AttributeError):
+        value.unknown = 1
+    assert value == decoders.decode("Record", record())
+    assert repr(value).startswith("Record(serial=42, name='bob', kind=1,")
+
+
+def test_decode_optional_and_default(decoders):
+    value = decoders.decode_Record(record(name=None, kind=b"\x00"))
+    assert value.name is None
+    assert value.kind == 0
+
+
+def test_decode_extension_skipped(decoders):
+    value = decoders.decode_Record(record(tlv(0x89, b""), tlv(0x30, b"\x05\x00")))
+    assert value.serial == 42
+
+
+def test_decode_sequence_of_indefinite(decoders):
+    data = bytes([0x30, 0x80]) + record() + record() + bytes([0x00, 0x00])
+    values = decoders.decode_Records(memoryview(data))
+    assert len(values) == 2
+    assert values[0] == values[1]
+
+
+def test_decode_choice_and_constructed_string(decoders):
+    # constructed [5] IA5String made of two segments
+    data = tlv(0xA5, tlv(0x04, b"ex") + tlv(0x04, b"ample"))
+    assert decoders.decode_Target(data) == ("host", "example")
+
+    data = tlv(0x18, b"20240102030405Z")
+    assert decoders.decode_Target(data) == (
+        "when",
+        datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+    )
+
+
+def test_decode_errors(decoders):
+    with pytest.raises(SchemaDecodeError, match="unexpected identifier octet 0x30"):
+        decoders.decode_Record(tlv(0x30, b""))
+
+    with pytest.raises(SchemaDecodeError, match="Record.serial: required"):
+        decoders.decode_Record(tlv(0x61, b""))
+
+    with pytest.raises(SchemaDecodeError, match="Target: unexpected identifier"):
+        decoders.decode_Target(tlv(0x86, b"1"))
+
+    with pytest.raises(SchemaDecodeError, match="truncated"):
+        decoders.decode_Record(record()[:-3])
+
+    # value errors come from the asn1values engines
+    with pytest.raises(IntegerParserError):
+        decoders.decode_Record(record(serial=b"\x00\x2a"))
+
+
+def test_compile_schema_is_cached_on_disk(tmp_path):
+    first = compile_schema(SCHEMA, cache_dir=tmp_path)
+    files = list(tmp_path.glob("*.py"))
+    assert len(files) == 1
+    assert "class Record(_Record):" in files[0].read_text()
+
+    # a later compilation reuses the generated module
+    assert compile_schema(SCHEMA, cache_dir=tmp_path) is first
+    assert compile_schema(SCHEMA, use_cache=False).decode_Record(record()).serial == 42
+
+
+@pytest.mark.parametrize(
+    "damage",
+    [
+        pytest.param(lambda text: text + "def (\n", id="syntax-error"),
+        pytest.param(lambda text: text[: text.index("class Record(")], id="truncated"),
+        pytest.param(lambda text: "", id="empty"),
+    ],
+)
+def test_compile_schema_replaces_damaged_cache(tmp_path, damage):
+    compile_schema(SCHEMA, cache_dir=tmp_path / "first")
+    (path,) = (tmp_path / "first").glob("*.py")
+    path.write_text(damage(path.read_text()))
+
+    # another directory, so that the module loaded above is not reused
+    cache_dir = tmp_path / "second"
+    cache_dir.mkdir()
+    damaged = cache_dir / path.name
+    damaged.write_text(path.read_text())
+
+    decoders = compile_schema(SCHEMA, cache_dir=cache_dir)
+    assert decoders.decode_Record(record()).serial == 42
+    assert "class Record(_Record):" in damaged.read_text()
+    assert compile_schema(SCHEMA, cache_dir=str(cache_dir)) is decoders
+
+
+def test_automatic_tags():
+    source = """
+    Auto DEFINITIONS AUTOMATIC TAGS ::= BEGIN
+    Pair ::= SEQUENCE { a INTEGER OPTIONAL, b INTEGER, c CHOICE { x INTEGER, y NULL } }
+    END
+    """
+    decoders = compile_schema(source, use_cache=False)
+    # b is [1] IMPLICIT, the CHOICE c is [2] EXPLICIT with [1] IMPLICIT NULL inside
+    value = decoders.decode_Pair(tlv(0x30, tlv(0x81, b"\x05") + tlv(0xA2, b"\x81\x00")))
+    assert (value.a, value.b, value.c) == (None, 5, ("y", None))
+
+
+def test_parse_module():
+    module = parse_module(SCHEMA)
+    assert module.name == "CallRecords"
+    assert module.tag_default == "IMPLICIT"
+    assert list(module.types) == ["Record", "Item", "Target", "Records"]
+    assert module.types["Record"].extensible
+
+
+@pytest.mark.parametrize(
+    "body, message",
+    [
+        ("A ::= [0] IMPLICIT CHOICE { a INTEGER }", "cannot be tagged IMPLICIT"),
+        ("A ::= SEQUENCE { a B }", "undefined type 'B'"),
+        ("A ::= B\nB ::= A", "defined in terms of itself"),
+        ("A ::= SET { a INTEGER, b INTEGER }", "share tag 02"),
+        ("A ::= BOOLEAN", "unsupported type"),
+    ],
+)
+def test_schema_errors(body, message):
+    source = f"M DEFINITIONS ::= BEGIN\n{body}\nEND"
+    with pytest.raises(SchemaError, match=message):
+        generate_decoder_source(parse_module(source))
+
+
+def test_bit_string():
+    source = """
+    Keys DEFINITIONS ::= BEGIN
+    KeyUsage ::= BIT STRING { digitalSignature(0), keyCertSign(5) }
+    END
+    """
+    decoders = compile_schema(source, use_cache=False)
+    value = decoders.decode_KeyUsage(tlv(0x03, b"\x02\x84"))
+    assert value.named_bits({"digitalSignature": 0, "keyCertSign": 5}) == {
+        "digitalSignature",
+        "keyCertSign",
+    }
+
+    # constructed form
+    data = tlv(0x23, tlv(0x03, b"\x00\x84") + tlv(0x03, b"\x04\xf0"))
+    assert decoders.decode_KeyUsage(data).to_bytes() == b"\x84\xf0"
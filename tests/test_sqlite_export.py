@@ -0,0 +1,67 @@
+import sqlite3
+from pathlib import Path
+from asn1decoder.sqlite_export import export_sqlite
+
+FILES = Path(__file__).parent.parent / "files"
+
+RECORD = bytes(
+    [
+        0x30, 0x0A,
+        0x02, 0x01, 0x05,  # INTEGER 5
+        0x13, 0x02, 0x46, 0x52,  # PrintableString "FR"
+        0x13, 0x01, 0x2A,  # PrintableString "*", invalid
+    ]
+)  # fmt: skip
+
+
+def test_export_sqlite(tmp_path):
+    records = tmp_path / "records.der"
+    records.write_bytes(RECORD * 2)
+    database = tmp_path / "nodes.db"
+
+    count = export_sqlite(
+        [records, FILES / "bdata_ok.der"], database, values=True, batch_size=3
+    )
+
+    connection = sqlite3.connect(database)
+    try:
+        assert connection.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+        assert connection.execute("SELECT count(*) FROM nodes").fetchone() == (count,)
+        assert connection.execute(
+            "SELECT file_id, path FROM files ORDER BY file_id"
+        ).fetchall() == [(1, str(records)), (2, str(FILES / "bdata_ok.der"))]
+
+        rows = connection.execute(
+            "SELECT node_id, parent_id, depth, offset, tag_class, tag_number,"
+            " constructed, header_length, content_length"
+            " FROM nodes WHERE file_id = 1 ORDER BY node_id"
+        ).fetchall()
+        assert rows[:4] == [
+            (0, None, 0, 0, 0, 16, 1, 2, 10),
+            (1, 0, 1, 2, 0, 2, 0, 2, 1),
+            (2, 0, 1, 5, 0, 19, 0, 2, 2),
+            (3, 0, 1, 9, 0, 19, 0, 2, 1),
+        ]
+        assert rows[4][:2] == (4, None)
+
+        values = connection.execute(
+            'SELECT node_id, value, error IS NOT NULL FROM "values"'
+            " WHERE file_id = 1 ORDER BY node_id"
+        ).fetchall()
+        assert values[:3] == [(1, 5, 0), (2, "FR", 0), (3, None, 1)]
+
+        indexes = {
+            name
+            for (name,) in connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            )
+        }
+        assert {"nodes_node", "nodes_tag"} <= indexes
+    finally:
+        connection.close()
+
+
+def test_export_sqlite_max_depth(tmp_path):
+    records = tmp_path / "records.der"
+    records.write_bytes(RECORD * 2)
+    assert export_sqlite([records], tmp_path / "nodes.db", max_depth=0) == 2
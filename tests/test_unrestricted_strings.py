@@ -2,6 +2,11 @@ import pytest
 from asn1decoder.asn1parser import parse_encoding
 from asn1decoder.asn1values.octet_string import OctetStringParserError
 from asn1decoder.asn1values import parse_utf8string, UTF8StringParserError
+from asn1decoder.asn1values import parse_bmpstring, BMPStringParserError
+from asn1decoder.asn1values import (
+    parse_universalstring,
+    UniversalStringParserError,
+)
 
 # -------------------------
 # UTF8String (UNIVERSAL 12)
@@ -147,3 +152,120 @@ def test_utf8string_invalid_utf8():
     encoding = parse_encoding(data=data, offset=0)
     with pytest.raises(UTF8StringParserError):
         parse_utf8string(encoding)
+
+
+# -------------------------
+# BMPString (UNIVERSAL 30)
+# -------------------------
+
+
+def test_bmpstring_primitive():
+    """BMPString primitive (UCS-2 big endian)"""
+    data = memoryview(
+        bytes(
+            [
+                0b00011110,  # UNIVERSAL PRIMITIVE 30
+                0b00000100,  # length = 4
+                0x00,
+                0x41,  # 'A'
+                0x20,
+                0xAC,  # '€'
+            ]
+        )
+    )
+    encoding = parse_encoding(data=data, offset=0)
+    value = parse_bmpstring(encoding)
+    assert value == "A€"
+
+
+def test_bmpstring_constructed_indefinite():
+    """BMPString constructed indefinite, character split across segments"""
+    data = memoryview(
+        bytes(
+            [
+                0b00111110,  # UNIVERSAL CONSTRUCTED 30
+                0b10000000,  # indefinite length
+                0b00000100,  # OCTET STRING
+                0b00000011,  # length = 3
+                0x00,
+                0x41,  # 'A'
+                0x00,
+                0b00000100,  # OCTET STRING
+                0b00000001,  # length = 1
+                0x42,  # 'B'
+                0b00000000,  # EOC
+                0b00000000,
+            ]
+        )
+    )
+    encoding = parse_encoding(data=data, offset=0)
+    value = parse_bmpstring(encoding)
+    assert value == "AB"
+
+
+def test_bmpstring_odd_length():
+    """BMPString with a length which is not a multiple of 2"""
+    data = memoryview(bytes([0b00011110, 0b00000011, 0x00, 0x41, 0x00]))
+    encoding = parse_encoding(data=data, offset=0)
+    with pytest.raises(BMPStringParserError, match="multiple of 2"):
+        parse_bmpstring(encoding)
+
+
+def test_bmpstring_surrogate_pair():
+    """BMPString cannot contain surrogate pairs"""
+    data = memoryview(bytes([0b00011110, 0b00000100, 0xD8, 0x3D, 0xDE, 0x00]))
+    encoding = parse_encoding(data=data, offset=0)
+    with pytest.raises(BMPStringParserError, match="Basic Multilingual Plane"):
+        parse_bmpstring(encoding)
+
+
+def test_bmpstring_lone_surrogate():
+    """BMPString with an unpaired surrogate"""
+    data = memoryview(bytes([0b00011110, 0b00000010, 0xD8, 0x3D]))
+    encoding = parse_encoding(data=data, offset=0)
+    with pytest.raises(BMPStringParserError):
+        parse_bmpstring(encoding)
+
+
+# -------------------------
+# UniversalString (UNIVERSAL 28)
+# -------------------------
+
+
+def test_universalstring_primitive():
+    """UniversalString primitive (UCS-4 big endian)"""
+    data = memoryview(
+        bytes(
+            [
+                0b00011100,  # UNIVERSAL PRIMITIVE 28
+                0b00001000,  # length = 8
+                0x00,
+                0x00,
+                0x00,
+                0x41,  # 'A'
+                0x00,
+                0x01,
+                0xF6,
+                0x00,  # U+1F600
+            ]
+        )
+    )
+    encoding = parse_encoding(data=data, offset=0)
+    value = parse_universalstring(encoding)
+    assert value == "A\U0001F600"
+
+
+def test_universalstring_invalid_length():
+    """UniversalString with a length which is not a multiple of 4"""
+    data = memoryview(bytes([0b00011100, 0b00000010, 0x00, 0x41]))
+    encoding = parse_encoding(data=data, offset=0)
+    with pytest.raises(UniversalStringParserError, match="multiple of 4"):
+        parse_universalstring(encoding)
+
+
+def test_universalstring_surrogate():
+    """UniversalString cannot contain surrogate code points"""
+    data = memoryview(bytes([0b00011100, 0b00000100, 0x00, 0x00, 0xD8, 0x00]))
+    encoding = parse_encoding(data=data, offset=0)
+    with pytest.raises(UniversalStringParserError):
+        parse_universalstring(encoding)
@@ -1,7 +1,8 @@
-from datetime import datetime
+from datetime import datetime, timezone
 import pytest
 from asn1decoder.asn1parser import parse_encoding
 from asn1decoder.asn1values import parse_utctime, UTCTimeParserError
+from asn1decoder.asn1values import parse_utctime_epoch
 
 
 # -------------------------
@@ -152,3 +153,29 @@ def test_utctime_invalid_seconds():
     encoding = parse_encoding(data=data, offset=0)
     with pytest.raises(UTCTimeParserError):
         parse_utctime(encoding)
+
+
+def _utctime_encoding(value: bytes):
+    return parse_encoding(data=memoryview(bytes([0b00010111, len(value)]) + value))
+
+
+def test_utctime_epoch():
+    """UTCTime converted to epoch seconds without building a datetime"""
+    encoding = _utctime_encoding(b"250711144521Z")
+    assert parse_utctime_epoch(encoding) == int(
+        datetime(2025, 7, 11, 14, 45, 21, tzinfo=timezone.utc).timestamp()
+    )
+    assert parse_utctime_epoch(encoding, unit="ms") == 1752245121000
+
+
+def test_utctime_aware():
+    """UTCTime as a tz-aware datetime"""
+    value = parse_utctime(_utctime_encoding(b"920521123456Z"), aware=True)
+    assert value == datetime(1992, 5, 21, 12, 34, 56, tzinfo=timezone.utc)
+    assert value.tzinfo is timezone.utc
+
+
+def test_utctime_invalid_day_of_month():
+    """UTCTime with a day beyond the end of the month"""
+    with pytest.raises(UTCTimeParserError, match="invalid day"):
+        parse_utctime(_utctime_encoding(b"230229000000Z"))
@@ -0,0 +1,195 @@
+from array import array
+import pytest
+from asn1decoder.asn1parser import ASN1ParserError, parse_encoding
+from asn1decoder.validation import (
+    ErrorCode,
+    check_encoding,
+    try_parse_encoding,
+    validate_structure,
+)
+from asn1decoder.asn1values import (
+    decode_value,
+    try_decode,
+    try_parse_integer,
+    try_parse_printablestring,
+    validate_values,
+)
+
+
+def tlv(identifier: int, content: bytes) -> bytes:
+    return bytes([identifier, len(content)]) + content
+
+
+VALUES = [
+    tlv(0x02, b"\x05"),
+    tlv(0x02, b"\x00\x05"),  # not minimal
+    tlv(0x02, b""),
+    tlv(0x03, b"\x02\x84"),
+    tlv(0x03, b"\x08\x84"),
+    tlv(0x03, b"\x01"),
+    tlv(0x23, tlv(0x03, b"\x04\xf0") + tlv(0x03, b"\x00\x84")),
+    tlv(0x04, b"\xde\xad"),
+    tlv(0x24, tlv(0x04, b"a") + tlv(0x24, tlv(0x04, b"b"))),
+    tlv(0x24, tlv(0x02, b"\x01")),
+    tlv(0x05, b""),
+    tlv(0x05, b"\x00"),
+    tlv(0x25, b""),
+    tlv(0x06, b"\x2a\x86\x48"),
+    tlv(0x06, b"\x2a\x80\x01"),
+    tlv(0x06, b"\x2a\x86"),
+    tlv(0x0C, "é".encode()),
+    tlv(0x0C, b"\xc3"),
+    tlv(0x0C, b"\xed\xa0\x80"),
+    tlv(0x0D, b"\x01\x02"),
+    tlv(0x12, b"12 3"),
+    tlv(0x12, b"12a"),
+    tlv(0x13, b"Ab 1"),
+    tlv(0x13, b"A*"),
+    tlv(0x14, b"\xc2e"),
+    tlv(0x14, b"e\xc2"),
+    tlv(0x14, b"#"),
+    tlv(0x16, b"a@b"),
+    tlv(0x16, b"\x80"),
+    tlv(0x17, b"991231235959Z"),
+    tlv(0x17, b"991331235959Z"),
+    tlv(0x17, b"990229235959Z"),
+    tlv(0x18, b"20240102030405Z"),
+    tlv(0x18, b"2024010203.5+0130"),
+    tlv(0x18, b"20240102034"),
+    tlv(0x18, b"20240102030460Z"),
+    tlv(0x18, b"20240102+2400"),
+    tlv(0x18, b"00000101000000Z"),
+    tlv(0x1A, b"~"),
+    tlv(0x1A, b"\x7f"),
+    tlv(0x1B, b"\xff"),
+    tlv(0x1C, b"\x00\x01\xf6\x00"),
+    tlv(0x1C, b"\x00\x00\xd8\x00"),
+    tlv(0x1C, b"\x00\x00\x00"),
+    tlv(0x1E, b"\x00\xe9"),
+    tlv(0x1E, b"\xd8\x3d\xde\x00"),
+    tlv(0x1E, b"\xd8\x3d"),
+    tlv(0x1E, b"\x00"),
+]
+
+
+@pytest.mark.parametrize("data", VALUES, ids=lambda data: data.hex())
+def test_try_decode_agrees_with_decode_value(data):
+    encoding = parse_encoding(memoryview(data))
+    ok, value, offset = try_decode(encoding)
+    try:
+        expected = decode_value(encoding)
+    except ASN1ParserError:
+        assert not ok
+        assert isinstance(value, ErrorCode) and value
+    else:
+        assert ok
+        assert value == expected
+        assert offset == len(data)
+
+
+def test_try_parse_error_codes():
+    encoding = parse_encoding(memoryview(tlv(0x02, b"\x00\x05")))
+    assert try_parse_integer(encoding) == (False, ErrorCode.NOT_MINIMAL, 2)
+
+    encoding = parse_encoding(memoryview(tlv(0x13, b"Ab*")))
+    assert try_parse_printablestring(encoding) == (
+        False,
+        ErrorCode.INVALID_CHARACTER,
+        4,
+    )
+    assert try_parse_integer(encoding) == (False, ErrorCode.UNEXPECTED_TAG, 0)
+
+    encoding = parse_encoding(memoryview(tlv(0x22, tlv(0x02, b"\x01"))))
+    assert try_parse_integer(encoding)[1] is ErrorCode.CONSTRUCTED_FORM
+
+    encoding = parse_encoding(memoryview(tlv(0x18, b"00000101000000Z")))
+    assert try_decode(encoding) == (False, ErrorCode.INVALID_TIME, 2)
+
+    # implicitly tagged
+    encoding = parse_encoding(memoryview(tlv(0x80, b"\x07")))
+    assert try_parse_integer(encoding) == (False, ErrorCode.UNEXPECTED_TAG, 0)
+    assert try_parse_integer(encoding, implicit=True) == (True, 7, 3)
+    assert try_decode(encoding) == (False, ErrorCode.NO_DECODER, 0)
+
+
+STRUCTURES = [
+    tlv(0x30, tlv(0x02, b"\x01") + tlv(0x05, b"")),
+    bytes([0x30, 0x80, 0x02, 0x01, 0x01, 0x24, 0x80, 0x00, 0x00, 0x00, 0x00]),
+    bytes([0x30, 0x80]) + tlv(0x02, b"\x01"),  # missing EOC
+    bytes([0x04, 0x80, 0x00, 0x00]),  # primitive, indefinite
+    bytes([0x30, 0x03, 0x02, 0x02, 0x01]),  # child overruns its parent
+    bytes([0x30, 0x04, 0x02, 0x01, 0x01]),  # truncated
+    bytes([0x1F, 0x80, 0x01, 0x00]),  # high tag with leading zero bits
+    bytes([0x1F, 0x81, 0x01, 0x00]),
+    bytes([0x1F, 0x81]),
+    bytes([0x04, 0xFF]),
+    bytes([0x04, 0x82, 0x01]),
+    bytes([0x04, 0x81, 0x01, 0xAA]),
+    bytes([0x30, 0x00]),
+    b"",
+]
+
+
+@pytest.mark.parametrize("data", STRUCTURES, ids=lambda data: data.hex())
+def test_check_encoding_agrees_with_parse_encoding(data):
+    code, offset = check_encoding(data)
+    try:
+        encoding = parse_encoding(memoryview(data))
+    except ASN1ParserError:
+        assert code
+    else:
+        assert code is ErrorCode.OK
+        assert offset == encoding.header.length
+
+
+def test_try_parse_encoding():
+    data = memoryview(bytes([0x30, 0x80]) + tlv(0x02, b"\x01"))
+    assert try_parse_encoding(data) == (False, ErrorCode.MISSING_EOC, 5)
+
+    ok, encoding, offset = try_parse_encoding(memoryview(tlv(0x02, b"\x01")))
+    assert ok and offset == 3
+    assert encoding.tag_number == 2
+
+
+def test_validate_values():
+    encodings = [parse_encoding(memoryview(data)) for data in VALUES[:3]]
+    codes = validate_values(encodings)
+    assert codes == array("B", [0, ErrorCode.NOT_MINIMAL, ErrorCode.EMPTY_CONTENT])
+    assert validate_values(encodings, as_type=4) == array("B", [0, 0, 0])
+
+
+def test_validate_structure():
+    data = tlv(0x30, tlv(0x02, b"\x01") + tlv(0x05, b""))
+    assert validate_structure(data).ok
+    assert validate_structure(data, profile="der") == (ErrorCode.OK, 7, "well-formed")
+
+    check = validate_structure(data + b"\x00")
+    assert (check.code, check.offset) == (ErrorCode.TRAILING_DATA, 7)
+    assert validate_structure(data + data, multiple=True).ok
+
+    check = validate_structure(bytes([0x30, 0x80]) + tlv(0x02, b"\x01"))
+    assert (check.code, check.offset) == (ErrorCode.MISSING_EOC, 5)
+    assert check.reason == "missing end-of-contents octets"
+
+    with pytest.raises(ValueError, match="unknown profile"):
+        validate_structure(data, profile="cer")
+
+
+@pytest.mark.parametrize(
+    "data, code, offset",
+    [
+        (bytes([0x30, 0x80, 0x00, 0x00]), ErrorCode.INDEFINITE_LENGTH, 1),
+        (bytes([0x04, 0x81, 0x01, 0xAA]), ErrorCode.NON_MINIMAL_LENGTH, 1),
+        (
+            bytes([0x04, 0x82, 0x00, 0x80]) + bytes(128),
+            ErrorCode.NON_MINIMAL_LENGTH,
+            1,
+        ),
+        (bytes([0x1F, 0x05, 0x00]), ErrorCode.NON_MINIMAL_TAG, 0),
+        (tlv(0x30, tlv(0x24, tlv(0x04, b"a"))), ErrorCode.CONSTRUCTED_FORM, 2),
+    ],
+)
+def test_validate_structure_der(data, code, offset):
+    assert validate_structure(data).ok
+    check = validate_structure(data, profile="der")
+    assert (check.code, check.offset) == (code, offset)